@@ -1,4 +1,8 @@
+import multiprocessing
+
 from arcastone.app import main
 
 if __name__ == "__main__":
+    # PDF text extraction uses worker processes; frozen builds need this to start them
+    multiprocessing.freeze_support()
     raise SystemExit(main())
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import multiprocessing
 import sys
 
 from PySide6.QtWidgets import QApplication
@@ -7,6 +8,7 @@ from PySide6.QtWidgets import QApplication
 from .theme import apply_qss, app_logo_icon
 from .main_window import MainWindow
 from .core.config import ensure_directories, set_offline_model_cache_env
+from .core.index import warm_embedder
 
 
 def main() -> int:
@@ -17,10 +19,12 @@ def main() -> int:
     win = MainWindow()
     win.setWindowIcon(app_logo_icon())
     win.show()
+    warm_embedder()
     return app.exec()
 
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()
     raise SystemExit(main())
 
 
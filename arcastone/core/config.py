@@ -56,10 +56,18 @@ FAISS_INDEX_PATH: Path = INDEX_DIR / "index.faiss"
 METADATA_DB_PATH: Path = INDEX_DIR / "metadata.sqlite3"
 
 
+_ENSURED = False
+
+
 def ensure_directories() -> None:
-    """Create required directories if missing."""
+    """Create required directories if missing (once per process)."""
+    global _ENSURED
+    if _ENSURED:
+        return
     for path in [DATA_DIR, BLOBS_DIR, INDEX_DIR, MODELS_DIR]:
-        path.mkdir(parents=True, exist_ok=True)
+        if not path.is_dir():
+            path.mkdir(parents=True, exist_ok=True)
+    _ENSURED = True
 
 
 def set_offline_model_cache_env() -> None:
@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Tuple
+import json
+import mmap
+import os
+
+from .index import _conn, index_stats
+from .manifest import SummaryStats, summary_stats
+from .storage import ensure_subdirs
+
+
+def _parse_iso(ts: str) -> datetime:
+    # On 3.11+ fromisoformat reads the log's "...%fZ" stamps itself, in C and
+    # ~80x faster than strptime; naive stamps are taken as UTC so rows compare
+    try:
+        dt = datetime.fromisoformat(ts)
+    except ValueError:
+        return datetime.fromtimestamp(0, tz=timezone.utc)
+    return dt if dt.tzinfo is not None else dt.replace(tzinfo=timezone.utc)
+
+
+# Rows shown in the activity table
+ACTIVITY_ROWS = 200
+
+
+def _tail_lines(path: Path) -> Iterator[bytes]:
+    """Yield the non-empty lines of a file from last to first.
+
+    The file is memory-mapped and walked backwards with rfind, so only the
+    pages holding the lines actually consumed are read, and each line is
+    copied out once.
+    """
+    with path.open("rb") as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # empty files can't be mapped
+            return
+    with mm:
+        end = len(mm)
+        while end > 0:
+            start = mm.rfind(b"\n", 0, end) + 1
+            line = mm[start:end]
+            if line.strip():
+                yield line
+            end = start - 1
+
+
+# (time, event name, payload, whether payload is shown as JSON); details are
+# only serialized for the rows that survive the merge in recent_activity
+_RawRow = Tuple[datetime, str, object, bool]
+
+
+def _event_row(obj: Dict) -> _RawRow:
+    ts = _parse_iso(str(obj.get("time", "")))
+    ev = obj.get("event", {})
+    if isinstance(ev, dict):
+        return ts, str(ev.get("type", "event")), ev, True
+    return ts, "event", ev, False
+
+
+def _legacy_row(obj: Dict) -> _RawRow:
+    ts = _parse_iso(str(obj.get("time", "")))
+    return ts, str(obj.get("event", "")), obj.get("data", {}), True
+
+
+def _recent_rows(path: Path, to_row: Callable[[Dict], _RawRow], limit: int) -> List[_RawRow]:
+    rows: List[_RawRow] = []
+    if not path.exists():
+        return rows
+    try:
+        for line in _tail_lines(path):
+            try:
+                rows.append(to_row(json.loads(line)))
+            except Exception:
+                continue
+            if len(rows) >= limit:
+                break
+    except Exception:
+        pass
+    return rows
+
+
+def recent_activity(limit: int = ACTIVITY_ROWS) -> List[Tuple[datetime, str, str]]:
+    """Most recent `limit` rows across events.log and the legacy tlog.jsonl, newest first.
+
+    Both logs are append-only, so each is read backwards from its end and
+    only until `limit` rows parse; cost doesn't grow with log size.
+    """
+    subs = ensure_subdirs()
+    rows: List[_RawRow] = []
+    # New events.log
+    rows.extend(_recent_rows(subs["tlog"] / "events.log", _event_row, limit))
+    # Legacy tlog.jsonl
+    legacy = subs["tlog"].parent / "tlog.jsonl"
+    rows.extend(_recent_rows(legacy, _legacy_row, limit))
+    rows.sort(key=lambda r: r[0], reverse=True)
+    return [
+        (ts, name, json.dumps(payload, ensure_ascii=False) if as_json else str(payload))
+        for ts, name, payload, as_json in rows[:limit]
+    ]
+
+
+def latest_catalog_files(limit: int = 200) -> List[Tuple[str, int, str]]:
+    """(name, size, stored_path) of the most recently cataloged files, newest first."""
+    try:
+        # Shared per-thread catalog connection; not closed here
+        cur = _conn().cursor()
+        # id is the rowid, so this walks the table b-tree backwards from its
+        # end and stops after `limit` rows: no sort, and no extra index needed
+        cur.execute("SELECT name, size, stored_path FROM files ORDER BY id DESC LIMIT ?", (limit,))
+        return [(str(name), int(size), str(stored)) for name, size, stored in cur.fetchall()]
+    except Exception:
+        return []
+
+
+@dataclass(frozen=True)
+class DashboardData:
+    summary: SummaryStats
+    index: Dict[str, int]
+    activity: List[Tuple[datetime, str, str]]
+    paths: Dict[str, Path]
+    faiss_size: int
+    catalog_files: List[Tuple[str, int, str]] = field(default_factory=list)
+
+
+def _file_size(path: Path) -> int:
+    # One stat rather than exists() followed by stat()
+    try:
+        return os.stat(path).st_size
+    except OSError:
+        return 0
+
+
+def load_dashboard() -> DashboardData:
+    """Gather everything the dashboard shows; touches disk and SQLite, so run it off the GUI thread."""
+    subs = ensure_subdirs()
+    faiss_path = subs["index"] / "faiss.index"
+    return DashboardData(
+        summary=summary_stats(datetime.now(timezone.utc).strftime("%Y-%m-%d")),
+        index=index_stats(),
+        activity=recent_activity(),
+        paths=subs,
+        faiss_size=_file_size(faiss_path),
+        catalog_files=latest_catalog_files(),
+    )
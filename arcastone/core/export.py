@@ -1,8 +1,9 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Dict, Iterable, List, Tuple
-import shutil
+from typing import BinaryIO, Dict, Iterable, Iterator, List, Set, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 import io
 import json
 import csv
@@ -10,40 +11,132 @@ import tarfile
 import zipfile
 import os
 import secrets
+import shutil
+import sqlite3
+import sys
 
 
-from .storage import resolve_object, ensure_subdirs
-from .manifest import get_document_entry, list_documents
+from .storage import StorageError, resolve_object, ensure_subdirs
+from .manifest import get_document_entry, get_document_entries, list_documents
 from .sitemap import export_sitemap_markdown
 
 
-def _unique_destination(dest_dir: Path, desired_name: str) -> Path:
+_SENDFILE_CHUNK = 2 * 1024 * 1024
+_READ_CHUNK = 1024 * 1024
+_COPY_WORKERS = min(8, (os.cpu_count() or 1) + 4)
+# copy_file_range/sendfile into a regular file are only dependable on Linux
+# (macOS sendfile wants a socket, Windows has neither)
+_KERNEL_COPY = sys.platform.startswith("linux")
+
+
+def _fastcopy(fsrc: BinaryIO, fdst: BinaryIO, size: int) -> None:
+    """Copy `size` bytes from fsrc to fdst (both positioned at 0).
+
+    On Linux tries `os.copy_file_range` (reflink / server-side copy where
+    supported), then `os.sendfile`; any OSError from those just moves on to the
+    next method. Whatever is left is copied with a plain read/write loop.
+    """
+    copied = 0
+    src_fd, dst_fd = fsrc.fileno(), fdst.fileno()
+    if _KERNEL_COPY and hasattr(os, "copy_file_range"):
+        try:
+            while copied < size:
+                n = os.copy_file_range(src_fd, dst_fd, size - copied)
+                if n == 0:
+                    break
+                copied += n
+        except OSError:
+            pass
+    if _KERNEL_COPY and copied < size and hasattr(os, "sendfile"):
+        try:
+            while copied < size:
+                n = os.sendfile(dst_fd, src_fd, copied, min(_SENDFILE_CHUNK, size - copied))
+                if n == 0:
+                    break
+                copied += n
+        except OSError:
+            pass
+    if copied < size:
+        # resume after whatever the kernel paths managed to copy
+        fsrc.seek(copied)
+        fdst.seek(copied)
+        shutil.copyfileobj(fsrc, fdst, _READ_CHUNK)
+
+
+def _copy_file(src: Path, dest: Path, preserve_metadata: bool = True) -> int:
+    """Copy file contents from src to dest; return bytes copied.
+
+    With preserve_metadata (the default) permission bits and timestamps are
+    carried over as shutil.copy2 does.
+    """
+    with open(src, "rb", buffering=0) as fsrc, open(dest, "wb", buffering=0) as fdst:
+        st = os.fstat(fsrc.fileno())
+        _fastcopy(fsrc, fdst, st.st_size)
+    if preserve_metadata:
+        shutil.copystat(src, dest)
+    return int(st.st_size)
+
+
+def _copy_many(pairs: List[Tuple[Path, Path]], preserve_metadata: bool = True) -> List[int]:
+    """Copy (src, dest) pairs as one batch; returns bytes copied per pair.
+
+    The copy syscalls release the GIL, so a small thread pool keeps several
+    files in flight and overlaps their per-file open/copy/close latency.
+    """
+    if len(pairs) <= 1:
+        return [_copy_file(src, dest, preserve_metadata) for src, dest in pairs]
+    with ThreadPoolExecutor(max_workers=min(_COPY_WORKERS, len(pairs))) as pool:
+        return list(pool.map(lambda p: _copy_file(p[0], p[1], preserve_metadata), pairs))
+
+
+def _taken_names(dest_dir: Path) -> Set[str]:
+    """Names already in dest_dir, case-folded so clashes are caught on case-insensitive volumes."""
+    try:
+        return {name.casefold() for name in os.listdir(dest_dir)}
+    except FileNotFoundError:
+        return set()
+
+
+def _unique_destination(dest_dir: Path, desired_name: str, reserved: Set[str] | None = None) -> Path:
+    """Return a free path in dest_dir for desired_name, suffixing _1, _2, ... on clashes.
+
+    `reserved` is the set from _taken_names(dest_dir), listed once per batch instead
+    of stat-ing every candidate; the chosen name is added to it so a batch can plan
+    all destinations before any file is written.
+    """
+    if reserved is None:
+        reserved = _taken_names(dest_dir)
     base = Path(desired_name).stem
     ext = Path(desired_name).suffix
-    candidate = dest_dir / f"{base}{ext}"
+    name = f"{base}{ext}"
     i = 1
-    while candidate.exists():
-        candidate = dest_dir / f"{base}_{i}{ext}"
+    while name.casefold() in reserved:
+        name = f"{base}_{i}{ext}"
         i += 1
-    return candidate
+    reserved.add(name.casefold())
+    return dest_dir / name
 
 
-def export_digests(digests: Iterable[str], destination: Path) -> Dict[str, Path]:
+def export_digests(digests: Iterable[str], destination: Path, preserve_metadata: bool = True) -> Dict[str, Path]:
     """Copy selected blobs to destination using original filenames.
 
     Returns mapping of digest to exported file path.
     """
     destination.mkdir(parents=True, exist_ok=True)
     exported: Dict[str, Path] = {}
+    pairs: List[Tuple[Path, Path]] = []
+    reserved = _taken_names(destination)
     for digest in digests:
-        src = resolve_object(digest)
-        if not src.exists():
+        try:
+            src = resolve_object(digest)
+        except StorageError:
             continue
         entry = get_document_entry(digest)
         name = entry.get("original_filename", digest + ".pdf") if entry else digest + ".pdf"
-        dest = _unique_destination(destination, name)
-        shutil.copy2(src, dest)
+        dest = _unique_destination(destination, name, reserved)
+        pairs.append((src, dest))
         exported[digest] = dest
+    _copy_many(pairs, preserve_metadata)
     return exported
 
 
@@ -56,16 +149,20 @@ def validate_out_dir(out_dir: Path) -> Path:
     out_dir.mkdir(parents=True, exist_ok=True)
     if not out_dir.is_dir():
         raise ValueError(f"Output path is not a directory: {out_dir}")
-    test_file = out_dir / ".arcastone_write_test"
-    try:
-        test_file.write_text("ok", encoding="utf-8")
-        test_file.unlink(missing_ok=True)
-    except Exception as exc:  # pragma: no cover - FS dependent
-        raise ValueError(f"Cannot write to output directory: {out_dir}: {exc}") from exc
+    if not os.access(out_dir, os.W_OK):
+        raise ValueError(f"Cannot write to output directory: {out_dir}")
+    if os.environ.get("ARCASTONE_STRICT_WRITABILITY", "").strip() == "1":
+        # access() can report stale permissions on some network mounts; prove it with a real write
+        test_file = out_dir / ".arcastone_write_test"
+        try:
+            test_file.write_text("ok", encoding="utf-8")
+            test_file.unlink(missing_ok=True)
+        except Exception as exc:  # pragma: no cover - FS dependent
+            raise ValueError(f"Cannot write to output directory: {out_dir}: {exc}") from exc
     return out_dir.resolve()
 
 
-def export_items(items: List[Dict[str, object]], out_dir: Path) -> Dict[str, int]:
+def export_items(items: List[Dict[str, object]], out_dir: Path, preserve_metadata: bool = True) -> Dict[str, int]:
     """Copy stored objects to out_dir using original filenames when known.
 
     items: list like [{"hash": "b3:<hex>"}, ...]
@@ -73,8 +170,8 @@ def export_items(items: List[Dict[str, object]], out_dir: Path) -> Dict[str, int
     Returns summary {"count": n, "bytes": total}.
     """
     out_dir = validate_out_dir(out_dir)
-    count = 0
-    total_bytes = 0
+    pairs: List[Tuple[Path, Path]] = []
+    reserved = _taken_names(out_dir)
     for item in items:
         h = str(item.get("hash", ""))
         if not h:
@@ -83,20 +180,14 @@ def export_items(items: List[Dict[str, object]], out_dir: Path) -> Dict[str, int
             src = resolve_object(h)
         except Exception:
             continue
-        if not src.exists():
-            continue
         # Determine name preference: manifest original_filename, then provided name, then hash.pdf
         digest = h.split(":", 1)[1] if ":" in h else h
         entry = get_document_entry(digest)
         name = (entry.get("original_filename") if entry else None) or str(item.get("name") or f"{digest}.pdf")
-        dest = _unique_destination(out_dir, name)
-        shutil.copy2(src, dest)
-        count += 1
-        try:
-            total_bytes += int(dest.stat().st_size)
-        except Exception:
-            pass
-    return {"count": count, "bytes": total_bytes}
+        dest = _unique_destination(out_dir, name, reserved)
+        pairs.append((src, dest))
+    sizes = _copy_many(pairs, preserve_metadata)
+    return {"count": len(pairs), "bytes": sum(sizes)}
 
 
 # ====== Enhanced multi-format and encryption exports ======
@@ -104,8 +195,9 @@ def export_items(items: List[Dict[str, object]], out_dir: Path) -> Dict[str, int
 def _selected_files(digests: Iterable[str]) -> List[Tuple[Path, str]]:
     files: List[Tuple[Path, str]] = []
     for d in digests:
-        src = resolve_object(d)
-        if not src.exists():
+        try:
+            src = resolve_object(d)  # raises rather than returning a missing path
+        except StorageError:
             continue
         entry = get_document_entry(d)
         name = entry.get("original_filename", f"{d}.pdf") if entry else f"{d}.pdf"
@@ -113,7 +205,19 @@ def _selected_files(digests: Iterable[str]) -> List[Tuple[Path, str]]:
     return files
 
 
-def _pbkdf2_key(puzzle: str, salt: bytes, length: int = 32, iterations: int = 200_000) -> bytes:
+# Encrypted payload header. v2 derives keys with PBKDF2_ITERATIONS; v1 files
+# ("ARCAENC1") used 200k iterations. Both are still readable by decrypt_bytes.
+ENC_MAGIC = b"ARCAENC2"
+PBKDF2_ITERATIONS = 600_000
+_ENC_ITERATIONS = {b"ARCAENC1": 200_000, ENC_MAGIC: PBKDF2_ITERATIONS}
+_ENC_HEADER_LEN = len(ENC_MAGIC) + 16 + 12  # magic, salt, nonce
+_ENC_TAG_LEN = 16
+
+# (salt, key) pair from derive_key, shared by every payload of one export
+ExportKey = Tuple[bytes, bytes]
+
+
+def _pbkdf2_key(puzzle: str, salt: bytes, length: int = 32, iterations: int = PBKDF2_ITERATIONS) -> bytes:
     try:
         from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
         from cryptography.hazmat.primitives import hashes
@@ -123,126 +227,269 @@ def _pbkdf2_key(puzzle: str, salt: bytes, length: int = 32, iterations: int = 20
     return kdf.derive(puzzle.encode("utf-8"))
 
 
-def encrypt_bytes(data: bytes, puzzle: str) -> bytes:
-    """Encrypt bytes with AES-256-GCM using a key from the puzzle.
+def derive_key(puzzle: str) -> ExportKey:
+    """Derive an AES-256 key from the puzzle under a fresh salt; returns (salt, key).
 
-    Output framing: b"ARCAENC1" + 16-byte salt + 12-byte nonce + ciphertext
+    PBKDF2 is deliberately slow, so derive once per export and reuse the pair
+    for every payload (each encryption still gets its own nonce).
     """
+    salt = secrets.token_bytes(16)
+    return salt, _pbkdf2_key(puzzle, salt)
+
+
+def _key_for(puzzle: str | None, key: ExportKey | None) -> ExportKey | None:
+    if key is not None or not puzzle:
+        return key
+    return derive_key(puzzle)
+
+
+def encrypt_with_key(key: bytes, data: bytes) -> bytes:
+    """Encrypt bytes with AES-256-GCM under a fresh 12-byte nonce; returns nonce + ciphertext."""
     try:
         from cryptography.hazmat.primitives.ciphers.aead import AESGCM
     except Exception as exc:  # pragma: no cover - optional dep
         raise RuntimeError("Encryption requested but 'cryptography' is not installed.\nInstall with: pip install cryptography") from exc
-    salt = secrets.token_bytes(16)
-    key = _pbkdf2_key(puzzle, salt)
     nonce = secrets.token_bytes(12)
-    aes = AESGCM(key)
-    ct = aes.encrypt(nonce, data, None)
-    return b"ARCAENC1" + salt + nonce + ct
+    return nonce + AESGCM(key).encrypt(nonce, data, None)
+
+
+def encrypt_bytes(data: bytes, puzzle: str, key: ExportKey | None = None) -> bytes:
+    """Encrypt bytes with AES-256-GCM using a key from the puzzle.
 
+    Pass `key` from derive_key to skip re-deriving it for every payload.
+    Output framing: ENC_MAGIC + 16-byte salt + 12-byte nonce + ciphertext
+    """
+    return _seal(key if key is not None else derive_key(puzzle), data)
+
+
+def _seal(key: ExportKey, data: bytes) -> bytes:
+    salt, raw_key = key
+    return ENC_MAGIC + salt + encrypt_with_key(raw_key, data)
+
+
+class _EncryptedWriter(io.RawIOBase):
+    """Write-only stream that AES-256-GCM encrypts into `raw` as data arrives.
+
+    Produces the same framing as encrypt_bytes (header, salt, nonce, ciphertext,
+    tag) without holding the plaintext in memory. Closing it closes `raw`.
+    """
+
+    def __init__(self, raw: BinaryIO, key: ExportKey):
+        super().__init__()
+        try:
+            from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+        except Exception as exc:  # pragma: no cover - optional dep
+            raise RuntimeError("Encryption requested but 'cryptography' is not installed.\nInstall with: pip install cryptography") from exc
+        salt, raw_key = key
+        nonce = secrets.token_bytes(12)
+        self._raw = raw
+        self._encryptor = Cipher(algorithms.AES(raw_key), modes.GCM(nonce)).encryptor()
+        raw.write(ENC_MAGIC + salt + nonce)
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:  # type: ignore[override]
+        self._raw.write(self._encryptor.update(data))
+        return memoryview(data).nbytes
+
+    def close(self) -> None:
+        if not self.closed:
+            try:
+                self._raw.write(self._encryptor.finalize() + self._encryptor.tag)
+            finally:
+                self._raw.close()
+        super().close()
+
+
+@contextmanager
+def _open_output(out_file: Path, key: ExportKey | None) -> Iterator[BinaryIO]:
+    """Open out_file for streaming writes, encrypting on the fly when key is set."""
+    out_file.parent.mkdir(parents=True, exist_ok=True)
+    with out_file.open("wb") as raw:
+        if key is None:
+            yield raw
+            return
+        writer = _EncryptedWriter(raw, key)
+        try:
+            yield writer  # type: ignore[misc]
+        finally:
+            writer.close()
+
+
+def _header_key(header: bytes, puzzle: str) -> Tuple[bytes, bytes]:
+    """Return (key, nonce) for an encrypted payload header, using the iteration count its magic names."""
+    iterations = _ENC_ITERATIONS.get(header[: len(ENC_MAGIC)])
+    if iterations is None or len(header) < _ENC_HEADER_LEN:
+        raise ValueError("Not an ArcaStone encrypted export")
+    salt = header[len(ENC_MAGIC) : len(ENC_MAGIC) + 16]
+    nonce = header[len(ENC_MAGIC) + 16 : _ENC_HEADER_LEN]
+    return _pbkdf2_key(puzzle, salt, iterations=iterations), nonce
+
+
+def decrypt_bytes(blob: bytes, puzzle: str) -> bytes:
+    """Decrypt a payload produced by encrypt_bytes or an encrypted export.
+
+    Accepts both ARCAENC2 (600k PBKDF2 iterations) and ARCAENC1 (200k) headers.
+    Raises ValueError for an unknown header, a wrong puzzle or a damaged file.
+    """
+    try:
+        from cryptography.exceptions import InvalidTag
+        from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+    except Exception as exc:  # pragma: no cover - optional dep
+        raise RuntimeError("Decryption requested but 'cryptography' is not installed.\nInstall with: pip install cryptography") from exc
+    key, nonce = _header_key(blob[:_ENC_HEADER_LEN], puzzle)
+    try:
+        return AESGCM(key).decrypt(nonce, blob[_ENC_HEADER_LEN:], None)
+    except InvalidTag:
+        raise ValueError("Wrong puzzle or damaged file") from None
+
+
+def decrypt_file(src: Path, dest: Path, puzzle: str) -> Path:
+    """Decrypt an encrypted export file (e.g. `export.zip.enc`) into dest.
 
-def export_zip(digests: Iterable[str], out_file: Path, puzzle: str | None = None) -> Path:
-    buf = io.BytesIO()
-    with zipfile.ZipFile(buf, mode="w", compression=zipfile.ZIP_DEFLATED) as zf:
+    Streams like the writer does, so archives larger than memory work. dest
+    only appears once the authentication tag has checked out.
+    """
+    try:
+        from cryptography.exceptions import InvalidTag
+        from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+    except Exception as exc:  # pragma: no cover - optional dep
+        raise RuntimeError("Decryption requested but 'cryptography' is not installed.\nInstall with: pip install cryptography") from exc
+    remaining = src.stat().st_size - _ENC_HEADER_LEN - _ENC_TAG_LEN
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    part = dest.with_name(dest.name + ".part")
+    with src.open("rb") as f:
+        key, nonce = _header_key(f.read(_ENC_HEADER_LEN), puzzle)
+        if remaining < 0:
+            raise ValueError("Wrong puzzle or damaged file")
+        decryptor = Cipher(algorithms.AES(key), modes.GCM(nonce)).decryptor()
+        try:
+            with part.open("wb") as out:
+                while remaining:
+                    chunk = f.read(min(_READ_CHUNK, remaining))
+                    if not chunk:
+                        break  # truncated meanwhile; the tag check below fails
+                    remaining -= len(chunk)
+                    out.write(decryptor.update(chunk))
+                out.write(decryptor.finalize_with_tag(f.read(_ENC_TAG_LEN)))
+            os.replace(part, dest)
+        except InvalidTag:
+            part.unlink(missing_ok=True)
+            raise ValueError("Wrong puzzle or damaged file") from None
+        except BaseException:
+            part.unlink(missing_ok=True)
+            raise
+    return dest
+
+
+def export_zip(digests: Iterable[str], out_file: Path, puzzle: str | None = None, key: ExportKey | None = None) -> Path:
+    key = _key_for(puzzle, key)
+    if key:
+        out_file = out_file.with_suffix(out_file.suffix + ".enc")
+    with _open_output(out_file, key) as sink, zipfile.ZipFile(sink, mode="w", compression=zipfile.ZIP_DEFLATED) as zf:
         for src, name in _selected_files(digests):
             zf.write(src, arcname=name)
-    data = buf.getvalue()
-    if puzzle:
-        data = encrypt_bytes(data, puzzle)
-        out_file = out_file.with_suffix(out_file.suffix + ".enc")
-    out_file.parent.mkdir(parents=True, exist_ok=True)
-    out_file.write_bytes(data)
     return out_file
 
 
-def export_tar_gz(digests: Iterable[str], out_file: Path, puzzle: str | None = None) -> Path:
-    buf = io.BytesIO()
-    with tarfile.open(fileobj=buf, mode="w:gz") as tf:
+def export_tar_gz(digests: Iterable[str], out_file: Path, puzzle: str | None = None, key: ExportKey | None = None) -> Path:
+    key = _key_for(puzzle, key)
+    if key:
+        out_file = out_file.with_suffix(out_file.suffix + ".enc")
+    # Stream mode ("w|gz") only ever appends, so it works on the encrypting sink too
+    with _open_output(out_file, key) as sink, tarfile.open(fileobj=sink, mode="w|gz") as tf:
         for src, name in _selected_files(digests):
             tf.add(src, arcname=name)
-    data = buf.getvalue()
-    if puzzle:
-        data = encrypt_bytes(data, puzzle)
-        out_file = out_file.with_suffix(out_file.suffix + ".enc")
-    out_file.parent.mkdir(parents=True, exist_ok=True)
-    out_file.write_bytes(data)
     return out_file
 
 
-def export_metadata_json(digests: Iterable[str], out_file: Path, puzzle: str | None = None) -> Path:
-    docs = []
-    for d in digests:
-        entry = get_document_entry(d)
-        if entry:
-            docs.append(entry)
-    data = json.dumps({"documents": docs}, indent=2, ensure_ascii=False).encode("utf-8")
-    if puzzle:
-        data = encrypt_bytes(data, puzzle)
+def export_metadata_json(digests: Iterable[str], out_file: Path, puzzle: str | None = None, key: ExportKey | None = None) -> Path:
+    key = _key_for(puzzle, key)
+    docs = list(get_document_entries(digests).values())
+    if key:
         out_file = out_file.with_suffix(out_file.suffix + ".enc")
-    out_file.parent.mkdir(parents=True, exist_ok=True)
-    out_file.write_bytes(data)
+    with _open_output(out_file, key) as sink, io.TextIOWrapper(sink, encoding="utf-8") as f:
+        f.write(json.dumps({"documents": docs}, indent=2, ensure_ascii=False))
     return out_file
 
 
-def export_metadata_csv(digests: Iterable[str], out_file: Path, puzzle: str | None = None) -> Path:
-    rows: List[Dict[str, object]] = []
-    for d in digests:
-        entry = get_document_entry(d)
-        if entry:
-            rows.append(entry)
-    buf = io.StringIO()
-    if rows:
-        fieldnames = list(rows[0].keys())
-        w = csv.DictWriter(buf, fieldnames=fieldnames)
-        w.writeheader()
-        for r in rows:
-            w.writerow(r)
-    data = buf.getvalue().encode("utf-8")
-    if puzzle:
-        data = encrypt_bytes(data, puzzle)
+def export_metadata_csv(digests: Iterable[str], out_file: Path, puzzle: str | None = None, key: ExportKey | None = None) -> Path:
+    key = _key_for(puzzle, key)
+    rows = list(get_document_entries(digests).values())
+    if key:
         out_file = out_file.with_suffix(out_file.suffix + ".enc")
-    out_file.parent.mkdir(parents=True, exist_ok=True)
-    out_file.write_bytes(data)
+    with _open_output(out_file, key) as sink, io.TextIOWrapper(sink, encoding="utf-8", newline="") as f:
+        if rows:
+            w = csv.DictWriter(f, fieldnames=list(rows[0].keys()))
+            w.writeheader()
+            w.writerows(rows)
     return out_file
 
 
-def export_catalog_sqlite(out_file: Path, puzzle: str | None = None) -> Path:
+def export_catalog_sqlite(out_file: Path, puzzle: str | None = None, key: ExportKey | None = None) -> Path:
+    key = _key_for(puzzle, key)
     subs = ensure_subdirs()
     src = subs["catalog"]
-    data = src.read_bytes() if src.exists() else b""
-    if puzzle:
-        data = encrypt_bytes(data, puzzle)
+    data = b""
+    if src.exists():
+        # serialize() includes pages still sitting in the WAL, unlike read_bytes()
+        conn = sqlite3.connect(str(src))
+        try:
+            data = conn.serialize()
+        finally:
+            conn.close()
+    if key:
+        data = _seal(key, data)
         out_file = out_file.with_suffix(out_file.suffix + ".enc")
     out_file.parent.mkdir(parents=True, exist_ok=True)
     out_file.write_bytes(data)
     return out_file
 
 
-def export_sitemap_md(out_file: Path, puzzle: str | None = None) -> Path:
+def export_sitemap_md(out_file: Path, puzzle: str | None = None, key: ExportKey | None = None) -> Path:
+    key = _key_for(puzzle, key)
     # Build markdown then optionally encrypt
     md = export_sitemap_markdown()
     data = md.encode("utf-8")
-    if puzzle:
-        data = encrypt_bytes(data, puzzle)
+    if key:
+        data = _seal(key, data)
         out_file = out_file.with_suffix(out_file.suffix + ".enc")
     out_file.parent.mkdir(parents=True, exist_ok=True)
     out_file.write_bytes(data)
     return out_file
 
 
-def export_originals(digests: Iterable[str], dest_dir: Path, puzzle: str | None = None) -> Dict[str, Path]:
-    """Copy originals; if puzzle provided, copy as .enc with encrypted content."""
+def export_originals(
+    digests: Iterable[str],
+    dest_dir: Path,
+    puzzle: str | None = None,
+    key: ExportKey | None = None,
+    preserve_metadata: bool = False,
+) -> Dict[str, Path]:
+    """Copy originals; if puzzle provided, copy as .enc with encrypted content.
+
+    The key is derived once and shared by all files; each gets a fresh nonce.
+    Blobs in the object store carry the ingest time, not the document's own
+    dates (those live in the manifest), so plain copies only keep the blobs'
+    timestamps and permissions when preserve_metadata is set.
+    """
     dest_dir = validate_out_dir(dest_dir)
+    key = _key_for(puzzle, key)
     mapping: Dict[str, Path] = {}
+    pairs: List[Tuple[Path, Path]] = []
+    reserved = _taken_names(dest_dir)
     for src, name in _selected_files(digests):
-        dest = _unique_destination(dest_dir, name if not puzzle else name + ".enc")
-        if puzzle:
+        dest = _unique_destination(dest_dir, name if not key else name + ".enc", reserved)
+        if key:
             data = src.read_bytes()
-            enc = encrypt_bytes(data, puzzle)
+            enc = _seal(key, data)
             dest.write_bytes(enc)
         else:
-            shutil.copy2(src, dest)
+            pairs.append((src, dest))
         digest = src.name  # src is objects/<prefix>/<digest>
         mapping[digest] = dest
+    _copy_many(pairs, preserve_metadata)
     return mapping
 
 
@@ -260,24 +507,25 @@ EXPORT_FORMATS = {
 def perform_export(digests: List[str], destination: Path, fmt: str, puzzle: str | None) -> Dict[str, str]:
     """Perform export in the given format. Returns mapping label->path string."""
     destination = destination.resolve()
+    key = derive_key(puzzle) if puzzle else None
     if fmt == "originals":
-        res = export_originals(digests, destination, puzzle)
+        res = export_originals(digests, destination, puzzle, key)
         return {k: str(v) for k, v in res.items()}
     # Single-file outputs
     destination.mkdir(parents=True, exist_ok=True)
     label = "output"
     if fmt == "zip":
-        out = export_zip(digests, destination / "export.zip", puzzle)
+        out = export_zip(digests, destination / "export.zip", puzzle, key)
     elif fmt == "tar.gz":
-        out = export_tar_gz(digests, destination / "export.tar.gz", puzzle)
+        out = export_tar_gz(digests, destination / "export.tar.gz", puzzle, key)
     elif fmt == "json":
-        out = export_metadata_json(digests, destination / "export.json", puzzle)
+        out = export_metadata_json(digests, destination / "export.json", puzzle, key)
     elif fmt == "csv":
-        out = export_metadata_csv(digests, destination / "export.csv", puzzle)
+        out = export_metadata_csv(digests, destination / "export.csv", puzzle, key)
     elif fmt == "sqlite":
-        out = export_catalog_sqlite(destination / "catalog.sqlite", puzzle)
+        out = export_catalog_sqlite(destination / "catalog.sqlite", puzzle, key)
     elif fmt == "sitemap-md":
-        out = export_sitemap_md(destination / "sitemap.md", puzzle)
+        out = export_sitemap_md(destination / "sitemap.md", puzzle, key)
     else:
         raise ValueError(f"Unknown export format: {fmt}")
     return {label: str(out)}
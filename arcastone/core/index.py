@@ -1,16 +1,22 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, Iterable, List, Set, Tuple
+import atexit
+import functools
 import os
+import re
 import sqlite3
+import threading
 
 import numpy as np
 import faiss  # type: ignore
 from sentence_transformers import SentenceTransformer
 
 from .storage import ensure_subdirs
-from .pdf import extract_text, first_snippet
+from .pdf import PdfSource, extract_texts, first_snippet
+from .onnx_embedder import OnnxEmbedder
+from .query_cache import query_cache, search_key
 
 
 # Paths
@@ -20,73 +26,253 @@ INDEX_DIR = DATA_DIR / "index"
 INDEX_DIR.mkdir(parents=True, exist_ok=True)
 FAISS_PATH = INDEX_DIR / "faiss.index"
 MODEL_CACHE = INDEX_DIR / ".models"
+# Optional INT8 ONNX export (scripts/models/prepare_onnx_embedder.py); preferred when present
+ONNX_MODEL_DIR = MODEL_CACHE / "minilm-onnx"
 CATALOG_DB = DATA_DIR / "catalog.sqlite"
 
-
-_EMBEDDER: SentenceTransformer | None = None
+# FAISS layout: an 8-bit scalar-quantised flat index while the vault is small,
+# rebuilt as an HNSW graph over SQ8 codes once brute force stops being cheap.
+HNSW_MIN_VECTORS = 2_000
+HNSW_M = 32
+HNSW_EF_CONSTRUCTION = 200
+HNSW_EF_SEARCH = 64
+# The graph stores 8-bit codes only if they keep recall@10 above this on a
+# sample of the vault; otherwise it falls back to half precision.
+MIN_SQ8_RECALL = 0.9
+RECALL_SAMPLE = 256
+# The live FAISS index is kept in memory and written back after this many new vectors,
+# on flush_index() and at exit, instead of being re-read and re-written per batch
+INDEX_FLUSH_VECTORS = 1000
+# Reciprocal rank fusion constant for search_fused (the usual value from the RRF paper)
+RRF_K = 60
+_SENTENCE_BREAK = re.compile(r"(?<=[.?!;])\s+")
+
+
+_EMBEDDER: SentenceTransformer | OnnxEmbedder | None = None
+_EMBEDDER_LOCK = threading.Lock()
+# One catalog connection per thread, kept open for the life of that thread
+_LOCAL = threading.local()
+_INDEX: faiss.Index | None = None
+_INDEX_DIRTY = 0  # vectors added since the last write
+_INDEX_LOCK = threading.RLock()
+_RECONCILED = False  # catalog checked against FAISS since the process started
+
+
+def _load_onnx_embedder() -> OnnxEmbedder | None:
+    if not ONNX_MODEL_DIR.is_dir():
+        return None
+    try:
+        return OnnxEmbedder(ONNX_MODEL_DIR)
+    except Exception:
+        # onnxruntime missing or export incomplete; use the PyTorch model
+        return None
 
 
-def get_embedder() -> SentenceTransformer:
+def get_embedder() -> SentenceTransformer | OnnxEmbedder:
     global _EMBEDDER
     if _EMBEDDER is None:
-        os.environ.setdefault("TRANSFORMERS_OFFLINE", "1")
-        os.environ.setdefault("HF_DATASETS_OFFLINE", "1")
-        os.environ.setdefault("HF_HUB_DISABLE_TELEMETRY", "1")
-        _EMBEDDER = SentenceTransformer("all-MiniLM-L6-v2", cache_folder=str(MODEL_CACHE))
+        # Index, search and warm-up threads may all ask at once; load the model only once
+        with _EMBEDDER_LOCK:
+            if _EMBEDDER is None:
+                os.environ.setdefault("TRANSFORMERS_OFFLINE", "1")
+                os.environ.setdefault("HF_DATASETS_OFFLINE", "1")
+                os.environ.setdefault("HF_HUB_DISABLE_TELEMETRY", "1")
+                _EMBEDDER = _load_onnx_embedder() or SentenceTransformer(
+                    "all-MiniLM-L6-v2", cache_folder=str(MODEL_CACHE)
+                )
     return _EMBEDDER
 
 
+def warm_embedder() -> None:
+    """Load the embedding model on a background thread so the first search or index run doesn't wait for it."""
+
+    def _load() -> None:
+        try:
+            get_embedder()
+        except Exception:
+            pass  # surfaced again, with context, by the first real caller
+
+    threading.Thread(target=_load, name="arcastone-embedder-warmup", daemon=True).start()
+
+
 def _normalize(x: np.ndarray) -> np.ndarray:
-    n = np.linalg.norm(x, axis=1, keepdims=True) + 1e-12
-    return x / n
+    """L2-normalise rows in place with FAISS's SIMD kernel; returns the float32 array."""
+    x = np.ascontiguousarray(x, dtype=np.float32)  # no copy when already float32
+    faiss.normalize_L2(x)
+    return x
 
 
 def _conn() -> sqlite3.Connection:
-    conn = sqlite3.connect(str(CATALOG_DB))
+    """Return this thread's catalog connection, opening and tuning it on first use.
+
+    The connection is in autocommit mode; write batches use explicit BEGIN/COMMIT.
+    Callers must not close it.
+    """
+    conn = getattr(_LOCAL, "conn", None)
+    if conn is None:
+        conn = sqlite3.connect(str(CATALOG_DB), isolation_level=None, check_same_thread=False)
+        # WAL lets readers run alongside index writes; NORMAL sync is safe with it
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA cache_size=-65536")
+        conn.execute("PRAGMA mmap_size=268435456")
+        _LOCAL.conn = conn
     return conn
 
 
+@atexit.register
+def _close_conn() -> None:
+    # Worker-thread connections are released with their thread; this closes the main one
+    conn = getattr(_LOCAL, "conn", None)
+    if conn is not None:
+        _LOCAL.conn = None
+        conn.close()
+
+
 def init_index() -> None:
     # Ensure sqlite schema
-    conn = _conn()
-    try:
-        cur = conn.cursor()
-        cur.execute(
-            """
-            CREATE TABLE IF NOT EXISTS files (
-                id INTEGER PRIMARY KEY,
-                name TEXT,
-                hash TEXT UNIQUE,
-                size INT,
-                stored_path TEXT
-            )
-            """
+    cur = _conn().cursor()
+    cur.execute(
+        """
+        CREATE TABLE IF NOT EXISTS files (
+            id INTEGER PRIMARY KEY,
+            name TEXT,
+            hash TEXT UNIQUE,
+            size INT,
+            stored_path TEXT
         )
-        cur.execute(
-            """
-            CREATE TABLE IF NOT EXISTS chunks (
-                id INTEGER PRIMARY KEY,
-                file_id INT,
-                page INT,
-                text TEXT,
-                snippet TEXT
-            )
-            """
+        """
+    )
+    cur.execute(
+        """
+        CREATE TABLE IF NOT EXISTS chunks (
+            id INTEGER PRIMARY KEY,
+            file_id INT,
+            page INT,
+            text TEXT,
+            snippet TEXT
         )
-        conn.commit()
-    finally:
-        conn.close()
+        """
+    )
+    # files.hash is already indexed by its UNIQUE constraint; this one turns the
+    # sitemap's per-file MIN(id) into an index walk instead of a sort
+    cur.execute("CREATE INDEX IF NOT EXISTS idx_chunks_file_id ON chunks(file_id, id)")
     # Ensure FAISS file exists (create empty index if missing)
-    if not FAISS_PATH.exists():
+    if _INDEX is None and not FAISS_PATH.exists():
         emb = get_embedder()
         dim = int(emb.get_sentence_embedding_dimension())
-        base = faiss.IndexFlatIP(dim)
-        idx = faiss.IndexIDMap2(base)
-        faiss.write_index(idx, str(FAISS_PATH))
+        faiss.write_index(_new_index(dim), str(FAISS_PATH))
+
+
+def _new_index(dim: int) -> faiss.Index:
+    # There is no data to fit 8-bit ranges to yet, and a fixed [-1, 1] range is
+    # too coarse for 384-d unit vectors (~0.89 recall@10). Half-precision needs
+    # no training, and at under HNSW_MIN_VECTORS vectors its size is irrelevant.
+    sq = faiss.IndexScalarQuantizer(dim, faiss.ScalarQuantizer.QT_fp16, faiss.METRIC_INNER_PRODUCT)
+    return faiss.IndexIDMap2(sq)
+
+
+def _sq8_recall(vecs: np.ndarray, index: faiss.Index, k: int = 10) -> float:
+    """recall@k of `index` against exact inner-product search, on a sample of its own vectors."""
+    rng = np.random.default_rng(0)
+    sample = vecs[rng.choice(len(vecs), size=min(RECALL_SAMPLE, len(vecs)), replace=False)]
+    exact = faiss.IndexFlatIP(vecs.shape[1])
+    exact.add(vecs)
+    _, truth = exact.search(sample, k)
+    _, found = index.search(sample, k)
+    return float(np.mean([len(set(t) & set(f)) / k for t, f in zip(truth, found)]))
+
+
+def _maybe_upgrade_index(index: faiss.Index) -> faiss.Index:
+    """Rebuild a flat index as HNSW + SQ8 once it holds HNSW_MIN_VECTORS vectors.
+
+    Covers both the SQ flat index from _new_index and the exact IndexFlatIP of
+    older vaults. Existing vectors and ids are reconstructed from the flat index
+    and used to train the per-dimension SQ8 ranges, so no re-embedding is needed.
+    Later batches are inserted into the graph incrementally.
+    """
+    if index.ntotal < HNSW_MIN_VECTORS:
+        return index
+    if not isinstance(faiss.downcast_index(index.index), (faiss.IndexFlat, faiss.IndexScalarQuantizer)):
+        return index  # already a graph
+    ids = faiss.vector_to_array(index.id_map).astype(np.int64)
+    vecs = index.index.reconstruct_n(0, index.ntotal)
+    dim = int(vecs.shape[1])
+    sq8 = faiss.IndexScalarQuantizer(dim, faiss.ScalarQuantizer.QT_8bit, faiss.METRIC_INNER_PRODUCT)
+    sq8.train(vecs)
+    sq8.add(vecs)
+    qtype = faiss.ScalarQuantizer.QT_8bit
+    if _sq8_recall(vecs, sq8) < MIN_SQ8_RECALL:
+        qtype = faiss.ScalarQuantizer.QT_fp16
+    hnsw = faiss.IndexHNSWSQ(dim, qtype, HNSW_M, faiss.METRIC_INNER_PRODUCT)
+    hnsw.hnsw.efConstruction = HNSW_EF_CONSTRUCTION
+    hnsw.hnsw.efSearch = HNSW_EF_SEARCH
+    hnsw.train(vecs)
+    upgraded = faiss.IndexIDMap2(hnsw)
+    upgraded.add_with_ids(vecs, ids)
+    return upgraded
 
 
 def _open_index() -> faiss.Index:
-    return faiss.read_index(str(FAISS_PATH))
+    index = faiss.read_index(str(FAISS_PATH))
+    inner = faiss.downcast_index(index.index) if isinstance(index, faiss.IndexIDMap) else index
+    if isinstance(inner, faiss.IndexHNSW):
+        inner.hnsw.efSearch = HNSW_EF_SEARCH
+    return index
+
+
+def get_index() -> faiss.Index:
+    """Return the session's in-memory FAISS index, reading it from disk on first use.
+
+    Hold _INDEX_LOCK while searching or mutating the returned index. Once
+    loaded it is returned without taking the lock, so reading e.g. ntotal
+    never waits behind an add, HNSW rebuild or write in progress.
+    """
+    global _INDEX
+    index = _INDEX
+    if index is not None:
+        return index
+    with _INDEX_LOCK:
+        if _INDEX is None:
+            _INDEX = _open_index()
+        return _INDEX
+
+
+def flush_index() -> None:
+    """Write the in-memory FAISS index to disk if it has unsaved vectors."""
+    global _INDEX_DIRTY
+    with _INDEX_LOCK:
+        if _INDEX is None or not _INDEX_DIRTY:
+            return
+        faiss.write_index(_INDEX, str(FAISS_PATH))
+        _INDEX_DIRTY = 0
+
+
+atexit.register(flush_index)
+
+
+def _catalog_stamp() -> Tuple[Tuple[int, int], ...]:
+    """(mtime_ns, size) of the catalog and its WAL; commits land in the WAL until a checkpoint."""
+    stamp = []
+    for path in (CATALOG_DB, CATALOG_DB.with_name(CATALOG_DB.name + "-wal")):
+        try:
+            st = os.stat(path)
+            stamp.append((st.st_mtime_ns, st.st_size))
+        except OSError:
+            stamp.append((0, 0))
+    return tuple(stamp)
+
+
+@functools.lru_cache(maxsize=1)
+def _catalog_counts(stamp: Tuple[Tuple[int, int], ...]) -> Tuple[int, int]:
+    # COUNT over chunks walks a whole index; only redo it when the catalog changed
+    cur = _conn().cursor()
+    cur.execute("SELECT COUNT(1) FROM files")
+    files = int(cur.fetchone()[0])
+    cur.execute("SELECT COUNT(1) FROM chunks")
+    chunks = int(cur.fetchone()[0])
+    return files, chunks
 
 
 def index_stats() -> Dict[str, int]:
@@ -100,30 +286,17 @@ def index_stats() -> Dict[str, int]:
     last_updated = 0
     faiss_vectors = 0
     # sqlite
+    files, chunks = _catalog_counts(_catalog_stamp())
+    # approximate last update = max(rowid) timestamp from sqlite file mtime
     try:
-        conn = _conn()
-        cur = conn.cursor()
-        cur.execute("SELECT COUNT(1) FROM files")
-        files = int(cur.fetchone()[0])
-        cur.execute("SELECT COUNT(1) FROM chunks")
-        chunks = int(cur.fetchone()[0])
-        # approximate last update = max(rowid) timestamp from sqlite file mtime
-        try:
-            last_updated = int(CATALOG_DB.stat().st_mtime)
-        except Exception:
-            last_updated = 0
-    finally:
-        try:
-            conn.close()
-        except Exception:
-            pass
-    # faiss
-    if FAISS_PATH.exists():
-        try:
-            idx = _open_index()
-            faiss_vectors = int(idx.ntotal)
-        except Exception:
-            faiss_vectors = 0
+        last_updated = int(CATALOG_DB.stat().st_mtime)
+    except Exception:
+        last_updated = 0
+    # faiss; ntotal of the in-memory index is free, lock-free once loaded, and may be ahead of the file
+    try:
+        faiss_vectors = int(get_index().ntotal)
+    except Exception:
+        faiss_vectors = 0
     return {
         "files": files,
         "chunks": chunks,
@@ -132,6 +305,50 @@ def index_stats() -> Dict[str, int]:
     }
 
 
+def indexed_digests() -> Set[str]:
+    """Digests (hex, no "b3:" prefix) of files whose chunks are already indexed.
+
+    FAISS and the catalog normally hold the same chunk ids. When they disagree
+    on the first call in a process (e.g. a crash before the index was flushed),
+    catalog chunks without a vector are deleted so their files count as
+    unindexed and are embedded again. Later calls skip the check: inside a
+    running process a mismatch only means index_prepared has committed chunk
+    rows whose vectors are still being embedded.
+    """
+    global _RECONCILED
+    init_index()
+    conn = _conn()
+    cur = conn.cursor()
+    with _INDEX_LOCK:
+        if not _RECONCILED:
+            cur.execute("SELECT COUNT(*) FROM chunks")
+            chunks = int(cur.fetchone()[0])
+            index = get_index()
+            if int(index.ntotal) != chunks:
+                present = faiss.vector_to_array(index.id_map) if index.ntotal else np.empty(0, dtype=np.int64)
+                _drop_orphan_chunks(conn, present)
+            _RECONCILED = True
+    cur.execute("SELECT hash FROM files WHERE EXISTS (SELECT 1 FROM chunks WHERE chunks.file_id = files.id)")
+    return {str(h).partition(":")[2] for (h,) in cur.fetchall() if h}
+
+
+def _drop_orphan_chunks(conn: sqlite3.Connection, present: np.ndarray) -> None:
+    """Delete catalog chunks whose id is not among the FAISS ids in `present`."""
+    cur = conn.cursor()
+    cur.execute("SELECT id FROM chunks")
+    catalog_ids = np.fromiter((r[0] for r in cur), dtype=np.int64)
+    orphans = np.setdiff1d(catalog_ids, present, assume_unique=True)
+    if not len(orphans):
+        return
+    conn.execute("BEGIN")
+    try:
+        conn.executemany("DELETE FROM chunks WHERE id=?", ((int(cid),) for cid in orphans))
+    except BaseException:
+        conn.rollback()
+        raise
+    conn.commit()
+
+
 def register_file(meta: Dict[str, object]) -> int:
     """Upsert file metadata into the catalog and return file id.
 
@@ -139,138 +356,219 @@ def register_file(meta: Dict[str, object]) -> int:
     """
     init_index()
     conn = _conn()
+    conn.execute("BEGIN")
     try:
-        cur = conn.cursor()
-        cur.execute(
-            """
-            INSERT INTO files(name, hash, size, stored_path)
-            VALUES(?,?,?,?)
-            ON CONFLICT(hash) DO UPDATE SET
-                name=excluded.name,
-                size=excluded.size,
-                stored_path=excluded.stored_path
-            """,
-            (meta.get("name"), meta.get("hash"), meta.get("size"), meta.get("stored_path")),
-        )
-        conn.commit()
-        # fetch id
-        cur.execute("SELECT id FROM files WHERE hash=?", (meta.get("hash"),))
-        row = cur.fetchone()
-        return int(row[0]) if row else -1
-    finally:
-        conn.close()
+        file_id = _upsert_file(conn.cursor(), meta)
+    except BaseException:
+        conn.rollback()
+        raise
+    conn.commit()
+    return file_id
+
+
+def _upsert_file(cur: sqlite3.Cursor, meta: Dict[str, object]) -> int:
+    cur.execute(
+        """
+        INSERT INTO files(name, hash, size, stored_path)
+        VALUES(?,?,?,?)
+        ON CONFLICT(hash) DO UPDATE SET
+            name=excluded.name,
+            size=excluded.size,
+            stored_path=excluded.stored_path
+        """,
+        (meta.get("name"), meta.get("hash"), meta.get("size"), meta.get("stored_path")),
+    )
+    # fetch id
+    cur.execute("SELECT id FROM files WHERE hash=?", (meta.get("hash"),))
+    row = cur.fetchone()
+    return int(row[0]) if row else -1
 
 
 def _split_long(text: str, max_chars: int = 1200, overlap: int = 120) -> List[str]:
     if len(text) <= max_chars:
         return [text]
-    chunks: List[str] = []
-    start = 0
-    while start < len(text):
-        end = min(len(text), start + max_chars)
-        chunks.append(text[start:end])
-        if end == len(text):
-            break
-        start = max(0, end - overlap)
-    return chunks
+    # A window starts every (max_chars - overlap) chars until one reaches the end
+    stride = max_chars - overlap
+    return [text[start : start + max_chars] for start in range(0, len(text) - overlap, stride)]
 
 
-def index_pdf(stored_path: Path, meta: Dict[str, object]) -> int:
-    """Index a PDF: register file, extract text, chunk, embed, write to faiss.
+def _page_chunks(pages: List[Dict[str, object]]) -> List[Tuple[int, str, str]]:
+    """Split extracted pages into (page, chunk_text, snippet) rows."""
+    rows: List[Tuple[int, str, str]] = []
+    for it in pages:
+        page_no = int(it["page"]) if "page" in it else 0
+        page_text = str(it.get("text", ""))
+        for chunk in _split_long(page_text):
+            rows.append((page_no, chunk, first_snippet(chunk)))
+    return rows
 
-    Returns number of chunks indexed.
+
+# (meta, [(page, chunk_text, snippet), ...]) for one PDF, ready for index_prepared
+PreparedPdf = Tuple[Dict[str, object], List[Tuple[int, str, str]]]
+
+
+def prepare_pdfs(specs: Iterable[Tuple[PdfSource, Dict[str, object]]]) -> List[PreparedPdf]:
+    """Extract and chunk PDFs without touching the catalog or index.
+
+    Pure parsing work, so it can run on another thread while index_prepared
+    embeds the previous batch.
+    """
+    specs = list(specs)
+    pages = extract_texts([stored_path for stored_path, _ in specs])
+    return [(meta, _page_chunks(doc_pages)) for (_, meta), doc_pages in zip(specs, pages)]
+
+
+def index_pdfs(specs: Iterable[Tuple[Path, Dict[str, object]]]) -> int:
+    """Index several PDFs with one catalog transaction, one embedding pass and one FAISS update.
+
+    specs: (stored_path, meta) pairs, meta as for register_file.
+    Returns the total number of chunks indexed.
     """
     init_index()
-    file_id = register_file(meta)
-    if file_id <= 0:
-        return 0
-    # Extract text per page
-    items = extract_text(stored_path)
-    # Prepare chunk rows
+    # Text extraction is the slow part; do it before taking the write lock
+    return index_prepared(prepare_pdfs(specs))
+
+
+def index_prepared(prepared: List[PreparedPdf]) -> int:
+    """Catalog, embed and add to FAISS the output of prepare_pdfs; returns chunks indexed."""
+    global _INDEX, _INDEX_DIRTY
+    init_index()
+    chunk_rows: List[int] = []
+    chunk_texts: List[str] = []
     conn = _conn()
+    cur = conn.cursor()
+    # Allocate ids up front under the write lock so executemany can insert
+    # every chunk and the FAISS ids are known without lastrowid.
+    cur.execute("BEGIN IMMEDIATE")
     try:
-        cur = conn.cursor()
-        chunk_texts: List[str] = []
-        chunk_rows: List[int] = []
-        for it in items:
-            page_no = int(it["page"]) if "page" in it else 0
-            page_text = str(it.get("text", ""))
-            for chunk in _split_long(page_text):
-                snip = first_snippet(chunk)
-                cur.execute(
-                    "INSERT INTO chunks(file_id, page, text, snippet) VALUES(?,?,?,?)",
-                    (file_id, page_no, chunk, snip),
-                )
-                chunk_id = cur.lastrowid
-                chunk_rows.append(int(chunk_id))
-                chunk_texts.append(chunk)
-        conn.commit()
-    finally:
-        conn.close()
+        cur.execute("SELECT COALESCE(MAX(id), 0) FROM chunks")
+        next_id = int(cur.fetchone()[0]) + 1
+        for meta, pending in prepared:
+            file_id = _upsert_file(cur, meta)
+            if file_id <= 0 or not pending:
+                continue
+            ids = list(range(next_id, next_id + len(pending)))
+            next_id += len(pending)
+            cur.executemany(
+                "INSERT INTO chunks(id, file_id, page, text, snippet) VALUES(?,?,?,?,?)",
+                [(cid, file_id, page_no, chunk, snip) for cid, (page_no, chunk, snip) in zip(ids, pending)],
+            )
+            chunk_rows.extend(ids)
+            chunk_texts.extend(chunk for _, chunk, _ in pending)
+    except BaseException:
+        conn.rollback()
+        raise
+    conn.commit()
     if not chunk_texts:
         return 0
     # Embed
     emb = get_embedder()
-    vecs = emb.encode(chunk_texts, batch_size=32, convert_to_numpy=True, show_progress_bar=False)
-    vecs = vecs.astype(np.float32)
+    vecs = emb.encode(chunk_texts, batch_size=128, convert_to_numpy=True, show_progress_bar=False)
     vecs = _normalize(vecs)
     # Append to FAISS with IDs mapping to chunk ids
-    index = _open_index()
     ids = np.array(chunk_rows, dtype=np.int64)
-    index.add_with_ids(vecs, ids)
-    faiss.write_index(index, str(FAISS_PATH))
+    with _INDEX_LOCK:
+        index = get_index()
+        index.add_with_ids(vecs, ids)
+        _INDEX = _maybe_upgrade_index(index)
+        _INDEX_DIRTY += len(chunk_rows)
+        if _INDEX_DIRTY >= INDEX_FLUSH_VECTORS:
+            flush_index()
+    # Cached search results may now be missing the new chunks
+    query_cache.clear()
     return len(chunk_rows)
 
 
+def index_pdf(stored_path: Path, meta: Dict[str, object]) -> int:
+    """Index a PDF: register file, extract text, chunk, embed, write to faiss.
+
+    Returns number of chunks indexed.
+    """
+    return index_pdfs([(stored_path, meta)])
+
+
 def search(query: str, top_k: int = 10) -> List[Dict[str, object]]:
     """Search the FAISS index and return ranked results with metadata.
 
     Returns list of dicts: {score, file, page, snippet, hash}
+    Repeated queries are answered from query_cache until the index changes.
     """
-    init_index()
-    if not FAISS_PATH.exists():
+    # Tagged so plain and fused results for the same query don't share an entry
+    key = ("search",) + search_key(query, top_k)
+    return query_cache.get_or_compute(key, lambda: search_batch([query], top_k)[0])
+
+
+def search_batch(queries: List[str], top_k: int = 10) -> List[List[Dict[str, object]]]:
+    """Run several queries with one embedding pass, one FAISS search and one catalog lookup.
+
+    Returns one result list per query, each shaped like search().
+    """
+    if not queries:
         return []
-    index = _open_index()
+    init_index()
+    index = get_index()
     if index.ntotal == 0:
-        return []
+        return [[] for _ in queries]
     emb = get_embedder()
-    q = emb.encode([query], convert_to_numpy=True).astype(np.float32)
-    q = _normalize(q)
-    D, I = index.search(q, max(1, min(top_k, index.ntotal)))
-    ids = [int(i) for i in I[0] if int(i) >= 0]
-    scores = [float(s) for s in D[0][: len(ids)]]
+    q = _normalize(emb.encode(list(queries), convert_to_numpy=True))
+    with _INDEX_LOCK:
+        index = get_index()  # may have been rebuilt as HNSW while encoding
+        D, I = index.search(q, max(1, min(top_k, index.ntotal)))
+    ranked = [[(int(i), float(d)) for i, d in zip(I[row], D[row]) if int(i) >= 0] for row in range(len(queries))]
+    ids = list({cid for hits in ranked for cid, _ in hits})
     if not ids:
-        return []
+        return [[] for _ in queries]
     # Fetch chunk + file metadata
-    conn = _conn()
-    try:
-        cur = conn.cursor()
-        qmarks = ",".join(["?"] * len(ids))
-        cur.execute(f"SELECT id, file_id, page, snippet FROM chunks WHERE id IN ({qmarks})", ids)
-        chunk_rows = {int(r[0]): (int(r[1]), int(r[2]), r[3]) for r in cur.fetchall()}
-        file_ids = list({fid for (fid, _, _) in chunk_rows.values()})
-        if file_ids:
-            qf = ",".join(["?"] * len(file_ids))
-            cur.execute(f"SELECT id, name, hash FROM files WHERE id IN ({qf})", file_ids)
-            file_rows = {int(r[0]): (r[1], r[2]) for r in cur.fetchall()}
-        else:
-            file_rows = {}
-    finally:
-        conn.close()
-    results: List[Dict[str, object]] = []
-    for cid, score in zip(ids, scores):
-        meta = chunk_rows.get(cid)
-        if not meta:
-            continue
-        fid, page, snippet = meta
-        fname, fhash = file_rows.get(fid, ("", ""))
-        results.append({
-            "score": score,
-            "file": fname,
-            "page": page,
-            "snippet": snippet,
-            "hash": fhash,
-        })
-    return results
+    cur = _conn().cursor()
+    qmarks = ",".join(["?"] * len(ids))
+    cur.execute(f"SELECT id, file_id, page, snippet FROM chunks WHERE id IN ({qmarks})", ids)
+    chunk_rows = {int(r[0]): (int(r[1]), int(r[2]), r[3]) for r in cur.fetchall()}
+    file_ids = list({fid for (fid, _, _) in chunk_rows.values()})
+    if file_ids:
+        qf = ",".join(["?"] * len(file_ids))
+        cur.execute(f"SELECT id, name, hash FROM files WHERE id IN ({qf})", file_ids)
+        file_rows = {int(r[0]): (r[1], r[2]) for r in cur.fetchall()}
+    else:
+        file_rows = {}
+    batches: List[List[Dict[str, object]]] = []
+    for hits in ranked:
+        results: List[Dict[str, object]] = []
+        for cid, score in hits:
+            meta = chunk_rows.get(cid)
+            if not meta:
+                continue
+            fid, page, snippet = meta
+            fname, fhash = file_rows.get(fid, ("", ""))
+            results.append({
+                "score": score,
+                "file": fname,
+                "page": page,
+                "snippet": snippet,
+                "hash": fhash,
+            })
+        batches.append(results)
+    return batches
+
+
+def search_fused(query: str, top_k: int = 10) -> List[Dict[str, object]]:
+    """Search a multi-sentence question by its whole text and by each sentence.
+
+    All variants go through one search_batch call; hits are merged per
+    (file, page) with reciprocal rank fusion. Single-sentence queries are a
+    plain search().
+    """
+    parts = [p.strip() for p in _SENTENCE_BREAK.split(query) if p.strip()]
+    if len(parts) <= 1:
+        return search(query, top_k)
+    fused: Dict[Tuple[object, object], float] = {}
+    best: Dict[Tuple[object, object], Dict[str, object]] = {}
+    for results in search_batch([query] + parts, top_k):
+        for rank, hit in enumerate(results, start=1):
+            key = (hit["hash"], hit["page"])
+            fused[key] = fused.get(key, 0.0) + 1.0 / (RRF_K + rank)
+            if key not in best or float(hit["score"]) > float(best[key]["score"]):  # type: ignore[arg-type]
+                best[key] = hit
+    order = sorted(fused, key=fused.__getitem__, reverse=True)
+    return [best[key] for key in order[:top_k]]
 
 
@@ -2,13 +2,16 @@ from __future__ import annotations
 
 from dataclasses import dataclass, asdict
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+import atexit
 import json
+import os
+import threading
 from datetime import datetime, timezone
 import blake3
 
 from .config import MANIFEST_PATH, TLOG_PATH
-from .storage import ensure_subdirs
+from .storage import _PARALLEL_HASH_MIN_BYTES, ensure_subdirs
 
 
 ISO_FORMAT = "%Y-%m-%dT%H:%M:%S.%fZ"
@@ -18,11 +21,17 @@ def _utcnow_iso() -> str:
     return datetime.now(timezone.utc).strftime(ISO_FORMAT)
 
 
+# Encoders are built once; the on-disk manifest and logs are machine-read, so stay compact
+_CANONICAL_JSON = json.JSONEncoder(ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+_COMPACT_JSON = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+
+
 # New API per spec
 def hash_json(obj: Any) -> str:
     """Return a BLAKE3 hex digest of the canonical JSON representation."""
-    data = json.dumps(obj, ensure_ascii=False, sort_keys=True, separators=(",", ":")).encode("utf-8")
-    return blake3.blake3(data).hexdigest()
+    data = _CANONICAL_JSON.encode(obj).encode("utf-8")
+    threads = blake3.blake3.AUTO if len(data) >= _PARALLEL_HASH_MIN_BYTES else 1
+    return blake3.blake3(data, max_threads=threads).hexdigest()
 
 
 def write_manifest(entries: List[Dict[str, Any]]) -> Path:
@@ -50,10 +59,35 @@ def write_manifest(entries: List[Dict[str, Any]]) -> Path:
     }
     fname_hash = hash_json(entries)
     out_path = day_dir / f"manifest-{fname_hash}.json"
-    out_path.write_text(json.dumps(manifest_doc, indent=2, ensure_ascii=False), encoding="utf-8")
+    out_path.write_text(_COMPACT_JSON.encode(manifest_doc), encoding="utf-8")
     return out_path
 
 
+# Log files stay open for the life of the process; O_APPEND makes each
+# single write() land atomically at the end, even with other writers.
+_APPEND_FDS: Dict[str, int] = {}
+_APPEND_LOCK = threading.Lock()
+
+
+def _append_line(path: Path, line: str) -> None:
+    data = (line + "\n").encode("utf-8")
+    key = str(path)
+    with _APPEND_LOCK:
+        fd = _APPEND_FDS.get(key)
+        if fd is None:
+            fd = os.open(key, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+            _APPEND_FDS[key] = fd
+        os.write(fd, data)
+
+
+@atexit.register
+def _close_append_fds() -> None:
+    with _APPEND_LOCK:
+        for fd in _APPEND_FDS.values():
+            os.close(fd)
+        _APPEND_FDS.clear()
+
+
 def append_tlog(event: Dict[str, Any]) -> None:
     """Append a JSONL event with time and signer to data/tlog/events.log."""
     subs = ensure_subdirs()
@@ -65,23 +99,46 @@ def append_tlog(event: Dict[str, Any]) -> None:
         "signer": "local-dev",
         "event": event,
     }
-    with out.open("a", encoding="utf-8") as f:
-        f.write(json.dumps(row, ensure_ascii=False) + "\n")
+    _append_line(out, _COMPACT_JSON.encode(row))
+
+
+# Parsed manifest and its digest index, keyed on the file's (mtime_ns, size).
+# Replaced as a whole so readers on other threads never see a half-built pair.
+_MANIFEST_CACHE: Optional[Tuple[Tuple[int, int], Dict[str, Any], Dict[str, Dict[str, Any]]]] = None
 
 
 # Existing API kept for compatibility with earlier flow
-def _read_manifest() -> Dict[str, Any]:
-    if not MANIFEST_PATH.exists():
-        return {"documents": []}
+def _load_manifest() -> Tuple[Dict[str, Any], Dict[str, Dict[str, Any]]]:
+    """Return (manifest, {digest: entry}), reparsing only when the file changed."""
+    global _MANIFEST_CACHE
+    try:
+        st = os.stat(MANIFEST_PATH)
+    except OSError:
+        return {"documents": []}, {}
+    stamp = (st.st_mtime_ns, st.st_size)
+    cached = _MANIFEST_CACHE
+    if cached is not None and cached[0] == stamp:
+        return cached[1], cached[2]
     try:
-        return json.loads(MANIFEST_PATH.read_text(encoding="utf-8"))
+        data = json.loads(MANIFEST_PATH.read_text(encoding="utf-8"))
     except json.JSONDecodeError:
-        return {"documents": []}
+        data = {"documents": []}
+    by_digest: Dict[str, Dict[str, Any]] = {}
+    for d in data.get("documents", []):
+        by_digest.setdefault(d.get("digest"), d)
+    _MANIFEST_CACHE = (stamp, data, by_digest)
+    return data, by_digest
+
+
+def _read_manifest() -> Dict[str, Any]:
+    return _load_manifest()[0]
 
 
 def _write_manifest(data: Dict[str, Any]) -> None:
+    global _MANIFEST_CACHE
     MANIFEST_PATH.parent.mkdir(parents=True, exist_ok=True)
-    MANIFEST_PATH.write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8")
+    MANIFEST_PATH.write_text(_COMPACT_JSON.encode(data), encoding="utf-8")
+    _MANIFEST_CACHE = None
 
 
 def append_tlog_legacy(event: str, data: Dict[str, Any]) -> None:
@@ -92,8 +149,7 @@ def append_tlog_legacy(event: str, data: Dict[str, Any]) -> None:
         "data": data,
     }
     TLOG_PATH.parent.mkdir(parents=True, exist_ok=True)
-    with TLOG_PATH.open("a", encoding="utf-8") as f:
-        f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+    _append_line(TLOG_PATH, _COMPACT_JSON.encode(entry))
 
 
 @dataclass
@@ -106,21 +162,44 @@ class DocumentEntry:
 
 
 def add_document_entry(entry: DocumentEntry) -> None:
-    manifest = _read_manifest()
-    documents: List[Dict[str, Any]] = manifest.get("documents", [])
-    documents = [d for d in documents if d.get("digest") != entry.digest]
-    documents.append(asdict(entry))
+    add_document_entries([entry])
+
+
+def add_document_entries(entries: Iterable[DocumentEntry]) -> None:
+    """Add or replace several documents with a single manifest rewrite.
+
+    Same result as calling add_document_entry for each in turn, but the
+    manifest is read and written once rather than once per entry.
+    """
+    rows = [asdict(e) for e in entries]
+    if not rows:
+        return
+    # Later rows replace earlier ones with the same digest, as sequential adds would
+    seen: set[str] = set()
+    latest: List[Dict[str, Any]] = []
+    for row in reversed(rows):
+        if row["digest"] not in seen:
+            seen.add(row["digest"])
+            latest.append(row)
+    latest.reverse()
+    # Copy so the cached manifest is never mutated ahead of a successful write
+    manifest = dict(_read_manifest())
+    documents: List[Dict[str, Any]] = [d for d in manifest.get("documents", []) if d.get("digest") not in seen]
+    documents.extend(latest)
     manifest["documents"] = documents
     _write_manifest(manifest)
-    append_tlog_legacy("manifest.add_document", asdict(entry))
+    for row in rows:
+        append_tlog_legacy("manifest.add_document", row)
 
 
 def get_document_entry(digest: str) -> Optional[Dict[str, Any]]:
-    manifest = _read_manifest()
-    for d in manifest.get("documents", []):
-        if d.get("digest") == digest:
-            return d
-    return None
+    return _load_manifest()[1].get(digest)
+
+
+def get_document_entries(digests: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+    """Look up many digests against one manifest read; unknown digests are skipped."""
+    by_digest = _load_manifest()[1]
+    return {d: by_digest[d] for d in digests if d in by_digest}
 
 
 def list_documents() -> List[Dict[str, Any]]:
@@ -128,3 +207,45 @@ def list_documents() -> List[Dict[str, Any]]:
     return list(manifest.get("documents", []))
 
 
+@dataclass(frozen=True)
+class SummaryStats:
+    total_docs: int = 0
+    total_pages: int = 0
+    total_bytes: int = 0
+    today_docs: int = 0
+    today_pages: int = 0
+    today_bytes: int = 0
+
+
+# (parsed manifest, today prefix, stats); valid while _load_manifest returns that same object
+_SUMMARY_CACHE: Optional[Tuple[Dict[str, Any], str, SummaryStats]] = None
+
+
+def summary_stats(today_prefix: str) -> SummaryStats:
+    """Document/page/byte totals, overall and for entries whose added_at starts with `today_prefix`.
+
+    Computed in one pass and reused until the manifest file changes, so
+    repeated dashboard refreshes don't walk every entry again.
+    """
+    global _SUMMARY_CACHE
+    manifest = _read_manifest()
+    cached = _SUMMARY_CACHE
+    if cached is not None and cached[0] is manifest and cached[1] == today_prefix:
+        return cached[2]
+    documents = manifest.get("documents", [])
+    pages = size = t_docs = t_pages = t_size = 0
+    for d in documents:
+        p = int(d.get("pages_count") or 0)
+        b = int(d.get("size_bytes") or 0)
+        pages += p
+        size += b
+        # Entries aren't kept in added_at order, so there is no range to seek
+        # into; this check rides along the one pass the totals need anyway
+        added = d.get("added_at")
+        if isinstance(added, str) and added.startswith(today_prefix):
+            t_docs += 1
+            t_pages += p
+            t_size += b
+    stats = SummaryStats(len(documents), pages, size, t_docs, t_pages, t_size)
+    _SUMMARY_CACHE = (manifest, today_prefix, stats)
+    return stats
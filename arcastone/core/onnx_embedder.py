@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import List, Sequence
+import os
+
+import numpy as np
+
+
+# Preferred first: the INT8 dynamic-quantised export, then the plain FP32 one
+ONNX_MODEL_FILES = ("model.int8.onnx", "model.onnx")
+
+
+class OnnxEmbedder:
+    """ONNX Runtime stand-in for the parts of SentenceTransformer the index uses.
+
+    Expects a directory produced by scripts/models/prepare_onnx_embedder.py:
+    an exported MiniLM graph plus its tokenizer files. Pooling matches
+    all-MiniLM-L6-v2 (attention-masked mean over the last hidden state).
+    """
+
+    def __init__(self, model_dir: Path, max_seq_length: int = 256):
+        import onnxruntime as ort  # type: ignore
+        from transformers import AutoTokenizer
+
+        model_file = next((model_dir / n for n in ONNX_MODEL_FILES if (model_dir / n).exists()), None)
+        if model_file is None:
+            raise FileNotFoundError(f"No ONNX model found in {model_dir}")
+        opts = ort.SessionOptions()
+        opts.intra_op_num_threads = os.cpu_count() or 1
+        opts.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        self._session = ort.InferenceSession(str(model_file), sess_options=opts, providers=["CPUExecutionProvider"])
+        self._input_names = [i.name for i in self._session.get_inputs()]
+        self._tokenizer = AutoTokenizer.from_pretrained(str(model_dir), local_files_only=True)
+        self._max_seq_length = max_seq_length
+        dim = self._session.get_outputs()[0].shape[-1]
+        self._dim = int(dim) if isinstance(dim, int) else 384
+
+    def get_sentence_embedding_dimension(self) -> int:
+        return self._dim
+
+    def encode(
+        self,
+        sentences: str | Sequence[str],
+        batch_size: int = 32,
+        convert_to_numpy: bool = True,
+        show_progress_bar: bool = False,
+        normalize_embeddings: bool = False,
+    ) -> np.ndarray:
+        if isinstance(sentences, str):
+            sentences = [sentences]
+        # Batch similar lengths together (as SentenceTransformer does) so each
+        # batch pads to its own longest text rather than the corpus's
+        order = sorted(range(len(sentences)), key=lambda i: -len(sentences[i]))
+        batches: List[np.ndarray] = []
+        for start in range(0, len(order), batch_size):
+            batch = [sentences[i] for i in order[start : start + batch_size]]
+            enc = self._tokenizer(
+                batch, padding=True, truncation=True, max_length=self._max_seq_length, return_tensors="np"
+            )
+            mask = enc["attention_mask"].astype(np.int64)
+            feeds = {}
+            for name in self._input_names:
+                if name in enc:
+                    feeds[name] = enc[name].astype(np.int64)
+                elif name == "token_type_ids":
+                    feeds[name] = np.zeros_like(mask)
+            hidden = self._session.run(None, feeds)[0]
+            weights = mask[..., None].astype(np.float32)
+            pooled = (hidden * weights).sum(axis=1) / np.clip(weights.sum(axis=1), 1e-9, None)
+            batches.append(pooled.astype(np.float32))
+        vecs = np.zeros((len(order), self._dim), dtype=np.float32)
+        if batches:
+            vecs[order] = np.concatenate(batches)
+        if normalize_embeddings:
+            vecs /= np.clip(np.linalg.norm(vecs, axis=1, keepdims=True), 1e-12, None)
+        return vecs
@@ -1,13 +1,36 @@
 from __future__ import annotations
 
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict
+from typing import List, Dict, Sequence, Tuple, Union
+import functools
+import multiprocessing
+import os
 import shutil
 import subprocess
 import tempfile
+import threading
 
 from pypdf import PdfReader
 
+try:  # PyMuPDF parses in C; pypdf stays as the fallback when it is missing or fails
+    import pymupdf  # type: ignore
+except Exception:  # pragma: no cover - optional dep
+    pymupdf = None
+
+
+# PDFs with at least this many pages are split across worker processes;
+# below it, process start-up and pickling cost more than they save.
+PARALLEL_MIN_PAGES = 32
+PARALLEL_WORKERS = min(os.cpu_count() or 1, 4)
+
+# Concurrent ocrmypdf runs in ocr_many; each is limited to one job so they
+# don't oversubscribe the CPU between them
+OCR_WORKERS = max(1, (os.cpu_count() or 2) // 2)
+
+_POOL: ProcessPoolExecutor | None = None
+_POOL_LOCK = threading.Lock()
+
 
 def is_pdf(path: Path) -> bool:
     """Heuristically determine if a file is a PDF.
@@ -29,31 +52,192 @@ def is_pdf(path: Path) -> bool:
 def _normalize_text(text: str | None) -> str:
     if not text:
         return ""
+    # split/join beats re.sub(r"\s+") here: both run in C, but the regex pays
+    # per-match overhead on every gap (~3x slower on typical page text)
     return " ".join(text.split())
 
 
-def extract_text(pdf_path: Path) -> List[Dict[str, object]]:
+def _pymupdf_range(doc, start: int, stop: int) -> List[str]:
+    texts: List[str] = []
+    for i in range(start, stop):
+        try:
+            texts.append(doc.load_page(i).get_text("text"))
+        except Exception:
+            texts.append("")
+    return texts
+
+
+def _extract_page_range(args: Tuple[str, int, int]) -> List[str]:
+    """Worker-process entry point: open the PDF locally and read pages [start, stop)."""
+    path, start, stop = args
+    with pymupdf.open(path) as doc:
+        return _pymupdf_range(doc, start, stop)
+
+
+def _get_pool() -> ProcessPoolExecutor:
+    global _POOL
+    with _POOL_LOCK:
+        if _POOL is None:
+            # fork() would copy a process already running Qt and worker threads
+            _POOL = ProcessPoolExecutor(max_workers=PARALLEL_WORKERS, mp_context=multiprocessing.get_context("spawn"))
+        return _POOL
+
+
+def _parallel_page_texts(pdf_path: Path, n: int) -> List[str]:
+    # Contiguous ranges so each worker opens the document once and reads sequentially
+    step = -(-n // (PARALLEL_WORKERS * 2))
+    jobs = [(str(pdf_path), start, min(n, start + step)) for start in range(0, n, step)]
+    texts: List[str] = []
+    for part in _get_pool().map(_extract_page_range, jobs):
+        texts.extend(part)
+    return texts
+
+
+class PdfHandle:
+    """A PDF opened once with PyMuPDF and shared by the functions below.
+
+    Pass it instead of a path when one file goes through several steps (OCR
+    check, extraction, page count) so the xref table is parsed only once.
+    The document is opened lazily; `doc` is None when PyMuPDF is missing or
+    can't read the file, in which case callers fall back to pypdf on `path`.
+    Like PyMuPDF itself, a handle must not be used from two threads at once.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._doc = None
+        self._opened = False
+
+    @property
+    def doc(self):
+        if not self._opened:
+            self._opened = True
+            if pymupdf is not None:
+                try:
+                    self._doc = pymupdf.open(str(self.path))
+                except Exception:
+                    self._doc = None
+        return self._doc
+
+    def close(self) -> None:
+        if self._doc is not None:
+            self._doc.close()
+        self._doc = None
+
+    def __enter__(self) -> "PdfHandle":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+PdfSource = Union[Path, PdfHandle]
+
+
+def _source_path(pdf: PdfSource) -> Path:
+    return pdf.path if isinstance(pdf, PdfHandle) else pdf
+
+
+def _page_texts(pdf: PdfSource, limit: int | None = None) -> List[str] | None:
+    """Raw text of each page (the first `limit` pages if given), or None if the PDF can't be opened."""
+    pdf_path = _source_path(pdf)
+    if pymupdf is not None:
+        try:
+            if isinstance(pdf, PdfHandle):
+                texts = _handle_page_texts(pdf, limit)
+                if texts is not None:
+                    return texts
+            else:
+                with pymupdf.open(str(pdf_path)) as doc:
+                    n = doc.page_count if limit is None else min(doc.page_count, limit)
+                    if n < PARALLEL_MIN_PAGES or PARALLEL_WORKERS < 2:
+                        return _pymupdf_range(doc, 0, n)
+                try:
+                    return _parallel_page_texts(pdf_path, n)
+                except Exception:
+                    with pymupdf.open(str(pdf_path)) as doc:  # e.g. broken pool; read it here instead
+                        return _pymupdf_range(doc, 0, n)
+        except Exception:
+            pass  # fall through to pypdf
+    try:
+        reader = PdfReader(str(pdf_path))
+    except Exception:
+        return None
+    # Closing clears the parsed object cache, which would otherwise live until
+    # the garbage collector breaks the reader/page reference cycles
+    with reader:
+        n = len(reader.pages) if limit is None else min(len(reader.pages), limit)
+        texts = []
+        for i in range(n):
+            try:
+                texts.append(reader.pages[i].extract_text())
+            except Exception:
+                texts.append("")
+    return texts
+
+
+def extract_text(pdf_path: PdfSource) -> List[Dict[str, object]]:
     """Extract text from a PDF into a list of {"page": int, "text": str}.
 
-    - Uses pypdf for text extraction
+    - Uses PyMuPDF when installed, otherwise pypdf
     - Handles encoding issues and exceptions gracefully
     - Whitespace is normalized
     """
-    try:
-        reader = PdfReader(str(pdf_path))
-    except Exception as exc:
+    texts = _page_texts(pdf_path)
+    if texts is None:
         # Return empty extraction on failure, callers can decide next steps
         return []
-    items: List[Dict[str, object]] = []
-    for i, page in enumerate(reader.pages, start=1):
+    return _as_pages(texts)
+
+
+def _as_pages(texts: List[str]) -> List[Dict[str, object]]:
+    return [{"page": i, "text": _normalize_text(text)} for i, text in enumerate(texts, start=1)]
+
+
+def extract_texts(pdfs: Sequence[PdfSource]) -> List[List[Dict[str, object]]]:
+    """extract_text for several PDFs; results line up with `pdfs`.
+
+    Short documents are each too small to split by page, so a batch of them
+    is spread across the page-range pool one document per task instead.
+    Anything else, and any task that fails, goes through extract_text here.
+    """
+    pending: Dict[int, object] = {}
+    if PARALLEL_WORKERS >= 2 and len(pdfs) > 1:
+        for i, pdf in enumerate(pdfs):
+            # Only open handles: their page count is already known, and a path
+            # would have to be opened here just to decide
+            if isinstance(pdf, PdfHandle) and pdf.doc is not None and pdf.doc.page_count < PARALLEL_MIN_PAGES:
+                try:
+                    pending[i] = _get_pool().submit(_extract_page_range, (str(pdf.path), 0, pdf.doc.page_count))
+                except Exception:  # e.g. broken pool; the loop below reads it here instead
+                    break
+    results: List[List[Dict[str, object]]] = []
+    for i, pdf in enumerate(pdfs):
+        fut = pending.get(i)
+        if fut is not None:
+            try:
+                results.append(_as_pages(fut.result()))
+                continue
+            except Exception:
+                pass
+        results.append(extract_text(pdf))
+    return results
+
+
+def _handle_page_texts(handle: PdfHandle, limit: int | None) -> List[str] | None:
+    doc = handle.doc
+    if doc is None:
+        return None
+    n = doc.page_count if limit is None else min(doc.page_count, limit)
+    if n >= PARALLEL_MIN_PAGES and PARALLEL_WORKERS >= 2:
         try:
-            text = page.extract_text()
+            return _parallel_page_texts(handle.path, n)
         except Exception:
-            text = ""
-        items.append({"page": i, "text": _normalize_text(text)})
-    return items
+            pass
+    return _pymupdf_range(doc, 0, n)
 
 
+@functools.lru_cache(maxsize=1)
 def _ocr_available() -> bool:
     try:
         res = subprocess.run(["ocrmypdf", "--version"], stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=False)
@@ -62,42 +246,78 @@ def _ocr_available() -> bool:
         return False
 
 
-def ocr_if_needed(pdf_path: Path) -> Path:
+def _needs_ocr(pdf: PdfSource) -> bool:
+    if not _ocr_available():  # cached, so check it before paying for the sample
+        return False
+    sample = _page_texts(pdf, limit=32)
+    if not sample:
+        return False
+    empty = sum(1 for text in sample if not text or text.isspace())
+    return empty / len(sample) > 0.8
+
+
+def _run_ocr(pdf_path: Path, jobs: int | None = None) -> Path | None:
+    tmpdir = Path(tempfile.mkdtemp(prefix="arcastone-ocr-"))
+    out = tmpdir / f"{pdf_path.stem}-ocr.pdf"
+    try:
+        cmd = ["ocrmypdf", "--skip-text", str(pdf_path), str(out)]
+        if jobs:
+            cmd[1:1] = ["--jobs", str(jobs)]
+        result = subprocess.run(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            check=False,
+        )
+        if result.returncode == 0 and out.exists():
+            return out
+    except Exception:
+        pass
+    shutil.rmtree(tmpdir, ignore_errors=True)
+    return None
+
+
+def ocr_if_needed(pdf: PdfSource, jobs: int | None = None) -> PdfSource:
     """Run OCR with `ocrmypdf` if most pages lack extractable text.
 
     - If >80% of sampled pages have no text, and `ocrmypdf` is present, run OCR
-    - Writes to a temp file and returns that path; otherwise returns original
+    - Writes to a temp file and returns that path; otherwise returns `pdf` unchanged
     - Sampling up to first 32 pages for speed on large PDFs
+    - `jobs` caps ocrmypdf's own parallelism (its default is one per core)
     """
-    try:
-        reader = PdfReader(str(pdf_path))
-    except Exception:
-        return pdf_path
-    total_pages = len(reader.pages)
-    sample_n = min(total_pages, 32)
-    empty = 0
-    for i in range(sample_n):
-        try:
-            text = reader.pages[i].extract_text()
-        except Exception:
-            text = ""
-        if not _normalize_text(text):
-            empty += 1
-    if sample_n > 0 and (empty / sample_n) > 0.8 and _ocr_available():
-        tmpdir = Path(tempfile.mkdtemp(prefix="arcastone-ocr-"))
-        out = tmpdir / f"{pdf_path.stem}-ocr.pdf"
-        try:
-            result = subprocess.run(
-                ["ocrmypdf", "--skip-text", str(pdf_path), str(out)],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                check=False,
-            )
-            if result.returncode == 0 and out.exists():
-                return out
-        except Exception:
-            pass
-    return pdf_path
+    if not _needs_ocr(pdf):
+        return pdf
+    out = _run_ocr(_source_path(pdf), jobs)
+    return out if out is not None else pdf
+
+
+def ocr_many(pdfs: Sequence[PdfSource]) -> List[PdfSource]:
+    """ocr_if_needed for several PDFs at once; results line up with `pdfs`.
+
+    Sampling happens on the calling thread (PyMuPDF isn't thread-safe); the
+    OCR itself runs in ocrmypdf's own process, so threads are enough to keep
+    several going. Each gets one job so a batch of scans spreads across cores
+    instead of each file claiming all of them in turn.
+    """
+    results = list(pdfs)
+    todo = [i for i, pdf in enumerate(pdfs) if _needs_ocr(pdf)]
+    if len(todo) == 1:
+        outs = [_run_ocr(_source_path(pdfs[todo[0]]))]
+    elif todo:
+        with ThreadPoolExecutor(max_workers=min(OCR_WORKERS, len(todo))) as pool:
+            outs = list(pool.map(lambda i: _run_ocr(_source_path(pdfs[i]), jobs=1), todo))
+    else:
+        outs = []
+    for i, out in zip(todo, outs):
+        if out is not None:
+            results[i] = out
+    return results
+
+
+def discard_ocr_output(source: PdfSource, original: PdfSource) -> None:
+    """Remove the temp directory ocr_if_needed wrote `source` into, if it did."""
+    if source is not original:
+        shutil.rmtree(_source_path(source).parent, ignore_errors=True)
 
 
 def first_snippet(text: str, max_chars: int = 240) -> str:
@@ -112,7 +332,17 @@ def first_snippet(text: str, max_chars: int = 240) -> str:
 def extract_text_by_page(pdf_path: Path) -> List[str]:  # pragma: no cover - thin wrapper
     return [item["text"] for item in extract_text(pdf_path)]
 
-def count_pages(pdf_path: Path) -> int:  # pragma: no cover - thin wrapper
+def count_pages(pdf_path: PdfSource) -> int:
+    if isinstance(pdf_path, PdfHandle):
+        if pdf_path.doc is not None:
+            return int(pdf_path.doc.page_count)
+        pdf_path = pdf_path.path
+    if pymupdf is not None:
+        try:
+            with pymupdf.open(str(pdf_path)) as doc:
+                return int(doc.page_count)
+        except Exception:
+            pass
     try:
         reader = PdfReader(str(pdf_path))
         return len(reader.pages)
@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import Callable, Dict, Hashable, Tuple, TypeVar
+import threading
+import time
+
+
+T = TypeVar("T")
+
+
+class QueryCache:
+    """Thread-safe LRU cache whose entries also expire after `ttl` seconds.
+
+    Used for search results, which stay valid until the index changes; the
+    index clears it whenever vectors are added.
+    """
+
+    def __init__(self, max_entries: int = 256, ttl: float = 300.0):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._items: "OrderedDict[Hashable, Tuple[float, object]]" = OrderedDict()
+        self._lock = threading.RLock()
+        self._hits = 0
+        self._misses = 0
+        self._generation = 0  # bumped by clear() so in-flight results aren't stored
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], T]) -> T:
+        now = time.monotonic()
+        with self._lock:
+            item = self._items.get(key)
+            if item is not None and now - item[0] < self.ttl:
+                self._items.move_to_end(key)
+                self._hits += 1
+                return item[1]  # type: ignore[return-value]
+            self._misses += 1
+            generation = self._generation
+        # Compute outside the lock so a slow search doesn't block other lookups
+        value = compute()
+        with self._lock:
+            if generation != self._generation:
+                return value
+            self._items[key] = (time.monotonic(), value)
+            self._items.move_to_end(key)
+            while len(self._items) > self.max_entries:
+                self._items.popitem(last=False)
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._items.clear()
+            self._generation += 1
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"hits": self._hits, "misses": self._misses, "entries": len(self._items)}
+
+
+# Shared cache for vector search results
+query_cache = QueryCache()
+
+
+def search_key(query: str, top_k: int) -> Tuple[str, int]:
+    # The embedding model is uncased, so case and surrounding space don't change results
+    return (" ".join(query.split()).lower(), int(top_k))
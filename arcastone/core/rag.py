@@ -2,21 +2,35 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Callable, List, Optional, Tuple
+import copy
 import os
+import threading
 
 import torch
-from transformers import AutoTokenizer, AutoModelForCausalLM
+from transformers import AutoTokenizer, AutoModelForCausalLM, StoppingCriteria, StoppingCriteriaList, TextIteratorStreamer
 
-from .index import search as vector_search
+from .index import search_fused as vector_search
+from .query_cache import query_cache, search_key
 from .config import MODELS_DIR
 
 
 _LLM = None
 _TOKENIZER = None
+_LLM_LOCK = threading.Lock()
+# (model, prefix input_ids, past_key_values) for _PROMPT_PREFIX, or None
+_PREFIX_CACHE = None
 
+# Instruction part of the QA prompt; identical for every question, so its
+# keys/values are computed once per model and reused by generate()
+_PROMPT_PREFIX = (
+    "You are a concise assistant. Answer the question using only the provided context.\n"
+    "Cite filenames and page numbers when relevant. If unsure, say you don't know.\n\n"
+    "Context:\n"
+)
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class QAResult:
     answer: str
     used_files: List[str]
@@ -39,18 +53,20 @@ def set_local_llm_path(path: str) -> bool:
     - Clears any cached tokenizer/model so the next use reloads from disk.
     Returns True if the provided path exists; False otherwise.
     """
-    global _LLM, _TOKENIZER
+    global _LLM, _TOKENIZER, _PREFIX_CACHE
     p = Path(path).expanduser() if path else None
     if p and p.exists():
         os.environ["ARCASTONE_LOCAL_LLM_PATH"] = str(p)
         _LLM = None
         _TOKENIZER = None
+        _PREFIX_CACHE = None
         return True
     # Clear override when invalid
     if "ARCASTONE_LOCAL_LLM_PATH" in os.environ:
         os.environ.pop("ARCASTONE_LOCAL_LLM_PATH", None)
     _LLM = None
     _TOKENIZER = None
+    _PREFIX_CACHE = None
     return False
 
 
@@ -60,11 +76,130 @@ def llm_status() -> Tuple[bool, Optional[str]]:
     return (p is not None, str(p) if p else None)
 
 
+def _cpu_has_bf16() -> bool:
+    """True when the CPU advertises bf16 arithmetic (AVX512-BF16 or AMX-BF16).
+
+    Only Linux exposes the flags cheaply (/proc/cpuinfo); elsewhere this is False.
+    """
+    try:
+        with open("/proc/cpuinfo", encoding="utf-8", errors="replace") as f:
+            for line in f:
+                if line.startswith("flags"):
+                    flags = set(line.split(":", 1)[1].split())
+                    return bool(flags & {"avx512_bf16", "amx_bf16"})
+    except OSError:
+        pass
+    return False
+
+
+def _llm_dtype() -> torch.dtype:
+    """bfloat16 where the CPU has bf16 instructions, float32 elsewhere.
+
+    bf16 halves the bytes read at load and the resident size; on CPUs without
+    bf16 units PyTorch emulates it and generation gets slower, not faster.
+    ARCASTONE_LLM_DTYPE=float32|bfloat16 overrides the choice.
+    """
+    if _llm_int8():
+        return torch.float32  # dynamic quantization converts from fp32 weights
+    forced = os.environ.get("ARCASTONE_LLM_DTYPE", "").strip().lower()
+    if forced in ("float32", "bfloat16"):
+        return getattr(torch, forced)
+    return torch.bfloat16 if _cpu_has_bf16() else torch.float32
+
+
+def _llm_int8() -> bool:
+    """True when ARCASTONE_LLM_QUANT=int8 asks for int8 Linear weights."""
+    return os.environ.get("ARCASTONE_LLM_QUANT", "").strip().lower() == "int8"
+
+
+def _quantize_int8(model):
+    """Swap the model's Linear layers for dynamically quantized int8 ones.
+
+    Generation on CPU is bound by reading weights, and int8 reads a quarter
+    of fp32's bytes; activations stay float, so there is no calibration step.
+    Returns the model unchanged if this PyTorch build can't quantize it.
+    """
+    try:
+        return torch.ao.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+    except Exception:
+        return model
+
+
+def _torch_threads() -> Optional[int]:
+    """Intra-op thread count for generation, or None to keep PyTorch's default.
+
+    ARCASTONE_TORCH_THREADS=N sets it explicitly. Otherwise it is the physical
+    core count when psutil is installed to report it; hyperthreads only
+    contend with the PDF pool, and CPUs without SMT lose nothing.
+    """
+    forced = os.environ.get("ARCASTONE_TORCH_THREADS", "").strip()
+    if forced.isdigit() and int(forced) > 0:
+        return int(forced)
+    try:
+        import psutil
+    except ImportError:
+        return None
+    return psutil.cpu_count(logical=False) or None
+
+
+def _tune_torch_threads() -> None:
+    threads = _torch_threads()
+    if threads is None:
+        return
+    torch.set_num_threads(threads)
+    try:
+        torch.set_num_interop_threads(1)
+    except RuntimeError:
+        pass  # only settable before the first parallel op; keep the default
+
+
+def _prefetch_weights(model_path: Path) -> None:
+    """Ask the kernel to start reading weight files into the page cache."""
+    if not hasattr(os, "posix_fadvise"):
+        return
+    for f in list(model_path.glob("*.safetensors")) + list(model_path.glob("*.bin")):
+        try:
+            fd = os.open(str(f), os.O_RDONLY)
+        except OSError:
+            continue
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+
+
 def get_local_llm():
     """Load a local HF model from disk only.
 
     Returns (tokenizer, model) or (None, None) if not available.
     """
+    if _LLM is not None and _TOKENIZER is not None:
+        return _TOKENIZER, _LLM
+    # The QA worker and the warm-up thread may race here; load only once
+    with _LLM_LOCK:
+        return _load_local_llm()
+
+
+def warm_local_llm() -> None:
+    """Load the local LLM and prefill the prompt prefix on a background thread,
+    so the first question waits for neither."""
+    if _LLM is not None or _get_llm_paths() is None:
+        return
+
+    def _load() -> None:
+        try:
+            tok, llm = get_local_llm()
+            if tok is not None and llm is not None:
+                _prefix_cache(tok, llm)
+        except Exception:
+            pass  # the QA worker reports load failures
+
+    threading.Thread(target=_load, name="arcastone-llm-warmup", daemon=True).start()
+
+
+def _load_local_llm():
     global _LLM, _TOKENIZER
     if _LLM is not None and _TOKENIZER is not None:
         return _TOKENIZER, _LLM
@@ -72,6 +207,9 @@ def get_local_llm():
     model_path = _get_llm_paths()
     if model_path is None:
         return None, None
+    _prefetch_weights(model_path)
+    _tune_torch_threads()
+    dtype = _llm_dtype()
     try:
         os.environ.setdefault("TRANSFORMERS_OFFLINE", "1")
         os.environ.setdefault("HF_HUB_DISABLE_TELEMETRY", "1")
@@ -81,7 +219,7 @@ def get_local_llm():
             str(model_path),
             local_files_only=True,
             low_cpu_mem_usage=True,
-            torch_dtype=torch.float32,
+            torch_dtype=dtype,
         )
     except Exception:
         # Fallback for models requiring custom code (e.g., some Qwen variants)
@@ -93,20 +231,22 @@ def get_local_llm():
                 str(model_path),
                 local_files_only=True,
                 low_cpu_mem_usage=True,
-                torch_dtype=torch.float32,
+                torch_dtype=dtype,
                 trust_remote_code=True,
             )
         except Exception:
             return None, None
     model.to(torch.device("cpu"))
     model.eval()
+    if _llm_int8():
+        model = _quantize_int8(model)
     _TOKENIZER, _LLM = tok, model
     return tok, model
 
 
 def build_context(query: str, top_k: int = 5) -> tuple[str, List[str]]:
     """Return a compact context string and list of files for a query."""
-    hits = vector_search(query, top_k)
+    hits = query_cache.get_or_compute(search_key(query, top_k), lambda: vector_search(query, top_k))
     lines: List[str] = []
     files: List[str] = []
     for h in hits:
@@ -118,10 +258,47 @@ def build_context(query: str, top_k: int = 5) -> tuple[str, List[str]]:
     return "\n".join(lines), files
 
 
-def generate_answer(question: str, top_k: int = 5, max_new_tokens: int = 128) -> QAResult:
+def _prefix_cache(tok, llm):
+    """Return (input_ids, past_key_values) for _PROMPT_PREFIX, or None if the model can't reuse a cache."""
+    global _PREFIX_CACHE
+    with _LLM_LOCK:
+        if _PREFIX_CACHE is None or _PREFIX_CACHE[0] is not llm:
+            try:
+                ids = tok(_PROMPT_PREFIX, return_tensors="pt").input_ids
+                # no_grad rather than inference_mode: the cache is deep-copied
+                # outside inference mode, which inference tensors don't allow
+                with torch.no_grad():
+                    pkv = llm(input_ids=ids, use_cache=True).past_key_values
+                _PREFIX_CACHE = (llm, ids, pkv) if pkv is not None else (llm, None, None)
+            except Exception:
+                _PREFIX_CACHE = (llm, None, None)  # e.g. custom model code; prefill in full
+        if _PREFIX_CACHE[1] is None:
+            return None
+        return _PREFIX_CACHE[1], _PREFIX_CACHE[2]
+
+
+class _StopWhen(StoppingCriteria):
+    """Stops generation as soon as `should_stop()` turns true (e.g. the worker was cancelled)."""
+
+    def __init__(self, should_stop: Callable[[], bool]):
+        self.should_stop = should_stop
+
+    def __call__(self, input_ids, scores, **kwargs):
+        return torch.full((input_ids.shape[0],), bool(self.should_stop()), dtype=torch.bool, device=input_ids.device)
+
+
+def generate_answer(
+    question: str,
+    top_k: int = 5,
+    max_new_tokens: int = 128,
+    on_token: Callable[[str], None] | None = None,
+    should_stop: Callable[[], bool] | None = None,
+) -> QAResult:
     """Generate a local answer using retrieved snippets.
 
     Falls back to extractive summary if a local LLM is not available.
+    Text is passed to `on_token` as it is generated; `should_stop` is polled
+    between tokens and ends generation early, returning what was produced.
     """
     context, files = build_context(question, top_k=top_k)
     if not context:
@@ -135,26 +312,53 @@ def generate_answer(question: str, top_k: int = 5, max_new_tokens: int = 128) ->
         )
         return QAResult(answer=preface + context, used_files=files)
 
-    prompt = (
-        "You are a concise assistant. Answer the question using only the provided context.\n"
-        "Cite filenames and page numbers when relevant. If unsure, say you don't know.\n\n"
-        f"Context:\n{context}\n\n"
-        f"Question: {question}\nAnswer:"
-    )
-
-    device = torch.device("cpu")
-    inputs = tok(prompt, return_tensors="pt").to(device)
-    with torch.no_grad():
-        out = llm.generate(
-            **inputs,
-            max_new_tokens=max_new_tokens,
-            do_sample=False,
-            temperature=0.2,
-            pad_token_id=tok.eos_token_id,
-        )
-    text = tok.decode(out[0], skip_special_tokens=True)
-    # Extract only the completion after 'Answer:'
-    answer = text.split("Answer:", 1)[-1].strip()
-    return QAResult(answer=answer, used_files=files)
+    suffix = f"{context}\n\nQuestion: {question}\nAnswer:"
+    inputs = tok(_PROMPT_PREFIX + suffix, return_tensors="pt").to(torch.device("cpu"))
+    cached = _prefix_cache(tok, llm)
+    if cached is not None:
+        prefix_ids, prefix_kv = cached
+        n = prefix_ids.shape[1]
+        input_ids = inputs["input_ids"]
+        # The cache only applies if the full prompt tokenizes to the cached prefix
+        # followed by more tokens; a merge across the boundary means prefill in full.
+        if input_ids.shape[1] > n and torch.equal(input_ids[:, :n], prefix_ids):
+            # generate() skips positions already in the cache and extends it in place, so copy it
+            inputs = {
+                "input_ids": input_ids,
+                "attention_mask": torch.ones_like(input_ids),
+                "past_key_values": copy.deepcopy(prefix_kv),
+            }
+    # generate() runs on its own thread and feeds decoded text through the streamer
+    streamer = TextIteratorStreamer(tok, skip_prompt=True, skip_special_tokens=True)
+    failure: List[BaseException] = []
+
+    def _generate() -> None:
+        try:
+            with torch.inference_mode():
+                llm.generate(
+                    **inputs,
+                    max_new_tokens=max_new_tokens,
+                    use_cache=True,
+                    do_sample=False,
+                    temperature=0.2,
+                    pad_token_id=tok.eos_token_id,
+                    streamer=streamer,
+                    stopping_criteria=StoppingCriteriaList([_StopWhen(should_stop or (lambda: False))]),
+                )
+        except BaseException as exc:
+            failure.append(exc)
+            streamer.end()  # unblock the reader below
+
+    thread = threading.Thread(target=_generate, name="arcastone-llm-generate", daemon=True)
+    thread.start()
+    parts: List[str] = []
+    for chunk in streamer:
+        parts.append(chunk)
+        if on_token is not None and chunk:
+            on_token(chunk)
+    thread.join()
+    if failure:
+        raise failure[0]
+    return QAResult(answer="".join(parts).strip(), used_files=files)
 
 
@@ -3,10 +3,11 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import List
 
-from .index import search as vector_search
+from .index import search_fused as vector_search
+from .query_cache import query_cache, search_key
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RetrievalAnswer:
     markdown: str
     sources: List[str]
@@ -17,7 +18,7 @@ def retrieve_only_answer(query: str, top_k: int = 5) -> RetrievalAnswer:
 
     The response is markdown composed of quoted passages and citations.
     """
-    hits = vector_search(query, top_k)
+    hits = query_cache.get_or_compute(search_key(query, top_k), lambda: vector_search(query, top_k))
     if not hits:
         return RetrievalAnswer(markdown="No matching passages found in your vault.", sources=[])
 
@@ -1,14 +1,14 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Dict, List
+from typing import Dict, List, Tuple
 import sqlite3
 
 from .index import _conn
 from .manifest import list_documents
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SiteNode:
     title: str
     digest: str
@@ -37,21 +37,23 @@ def export_sitemap_markdown() -> str:
     if not nodes:
         out.append("(empty)")
         return "\n".join(out)
-    # Fetch one snippet per file from chunks table
-    conn = _conn()
-    try:
-        cur = conn.cursor()
-        for n in nodes:
-            out.append(f"- **{n.title}**  ")
-            cur.execute(
-                "SELECT page, snippet FROM chunks c JOIN files f ON f.id=c.file_id WHERE f.hash=? ORDER BY c.id ASC LIMIT 1",
-                (n.digest,),
-            )
-            row = cur.fetchone()
-            if row:
-                out.append(f"  p.{int(row[0])}: {str(row[1])}")
-    finally:
-        conn.close()
+    # Fetch the first snippet of every file in one scan rather than one query per file
+    cur = _conn().cursor()
+    cur.execute(
+        """
+        SELECT f.hash, c.page, c.snippet
+        FROM files f
+        JOIN (SELECT file_id, MIN(id) AS mid FROM chunks GROUP BY file_id) m ON m.file_id = f.id
+        JOIN chunks c ON c.id = m.mid
+        """
+    )
+    # files.hash is "b3:<hex>"; nodes carry the bare hex digest
+    first: Dict[str, Tuple[int, str]] = {
+        str(h).partition(":")[2]: (int(page), str(snippet)) for h, page, snippet in cur.fetchall()
+    }
+    for n in nodes:
+        out.append(f"- **{n.title}**  ")
+        row = first.get(n.digest)
+        if row:
+            out.append(f"  p.{row[0]}: {row[1]}")
     return "\n".join(out)
-
-
@@ -1,10 +1,14 @@
 from __future__ import annotations
 
+from collections import OrderedDict
 from pathlib import Path
-from typing import Dict
+from typing import Dict, Optional, Tuple
 import shutil
+import sqlite3
+import stat
 import sys
 import os
+import threading
 import blake3
 
 
@@ -63,10 +67,122 @@ def ensure_subdirs() -> Dict[str, Path]:
     }
 
 
+# Below this size BLAKE3's thread fan-out costs more than it saves
+_PARALLEL_HASH_MIN_BYTES = 1 << 20
+
+
+# Digest cache: path -> (size, mtime_ns, digest), mirrored in a sidecar database
+# so re-ingesting an unchanged file skips hashing across runs. It holds absolute
+# source paths, so it is kept out of catalog.sqlite (which gets exported).
+# In memory only the most recently used entries are kept; the rest stay on disk.
+HASH_CACHE_DB = "hash_cache.sqlite"
+_DIGEST_CACHE_MAX = 4096
+_DIGEST_CACHE: "OrderedDict[str, Tuple[int, int, str]]" = OrderedDict()
+_DIGEST_CACHE_LOCK = threading.RLock()
+_DIGEST_CACHE_STATS = {"hits": 0, "misses": 0}
+_CACHE_LOCAL = threading.local()
+
+
+def _hash_cache_conn() -> Optional[sqlite3.Connection]:
+    conn = getattr(_CACHE_LOCAL, "conn", None)
+    if conn is None:
+        try:
+            path = ensure_subdirs()["catalog"].with_name(HASH_CACHE_DB)
+            conn = sqlite3.connect(str(path), isolation_level=None, check_same_thread=False)
+            conn.execute("PRAGMA busy_timeout=2000")
+            # One row is written per newly hashed file; WAL with synchronous=NORMAL
+            # makes those commits page-cache writes instead of an fsync each
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS hash_cache ("
+                "path TEXT PRIMARY KEY, size INT, mtime_ns INT, digest TEXT)"
+            )
+        except sqlite3.Error:
+            return None  # the cache is an optimisation; hash without it
+        _CACHE_LOCAL.conn = conn
+    return conn
+
+
+def _cache_put(key: str, entry: Tuple[int, int, str]) -> None:
+    with _DIGEST_CACHE_LOCK:
+        _DIGEST_CACHE[key] = entry
+        _DIGEST_CACHE.move_to_end(key)
+        while len(_DIGEST_CACHE) > _DIGEST_CACHE_MAX:
+            _DIGEST_CACHE.popitem(last=False)
+
+
+def _cached_digest(key: str, size: int, mtime_ns: int) -> Optional[str]:
+    with _DIGEST_CACHE_LOCK:
+        hit = _DIGEST_CACHE.get(key)
+        if hit is not None:
+            _DIGEST_CACHE.move_to_end(key)
+    if hit is None:
+        conn = _hash_cache_conn()
+        if conn is not None:
+            try:
+                row = conn.execute("SELECT size, mtime_ns, digest FROM hash_cache WHERE path=?", (key,)).fetchone()
+            except sqlite3.Error:
+                row = None
+            if row:
+                hit = (int(row[0]), int(row[1]), str(row[2]))
+                _cache_put(key, hit)
+    if hit is not None and hit[0] == size and hit[1] == mtime_ns:
+        return hit[2]
+    return None
+
+
+def _remember_digest(key: str, size: int, mtime_ns: int, digest: str) -> None:
+    _cache_put(key, (size, mtime_ns, digest))
+    conn = _hash_cache_conn()
+    if conn is not None:
+        try:
+            conn.execute(
+                "INSERT OR REPLACE INTO hash_cache(path, size, mtime_ns, digest) VALUES(?,?,?,?)",
+                (key, size, mtime_ns, digest),
+            )
+        except sqlite3.Error:
+            pass
+
+
+def digest_cache_stats() -> Dict[str, int]:
+    """Return {"hits", "misses", "entries"} for the file digest cache."""
+    with _DIGEST_CACHE_LOCK:
+        return {**_DIGEST_CACHE_STATS, "entries": len(_DIGEST_CACHE)}
+
+
 def blake3_file(path: Path, chunk_size: int = 1024 * 1024) -> str:
-    """Compute the BLAKE3 hex digest of a file by streaming its contents."""
-    if not path.exists() or not path.is_file():
+    """Compute the BLAKE3 hex digest of a file.
+
+    Digests are cached by (path, size, mtime_ns), so an unchanged file is not
+    read again. Otherwise the file is memory-mapped and hashed in one call
+    (multithreaded for large files); chunk_size only applies to the streaming
+    fallback used when the file can't be mapped.
+    """
+    try:
+        st = path.stat()
+    except OSError:
+        st = None
+    if st is None or not stat.S_ISREG(st.st_mode):
         raise StorageError(f"Path does not exist or is not a file: {path}")
+    key = str(path.resolve())
+    digest = _cached_digest(key, st.st_size, st.st_mtime_ns)
+    with _DIGEST_CACHE_LOCK:
+        _DIGEST_CACHE_STATS["hits" if digest else "misses"] += 1
+    if digest is None:
+        digest = _hash_file(path, st.st_size, chunk_size)
+        _remember_digest(key, st.st_size, st.st_mtime_ns, digest)
+    return digest
+
+
+def _hash_file(path: Path, size: int, chunk_size: int) -> str:
+    try:
+        large = size >= _PARALLEL_HASH_MIN_BYTES
+        hasher = blake3.blake3(max_threads=blake3.blake3.AUTO if large else 1)
+        hasher.update_mmap(str(path))
+        return hasher.hexdigest()
+    except Exception:
+        pass
     hasher = blake3.blake3()
     with path.open("rb") as f:
         while True:
@@ -93,10 +209,17 @@ def store_file(path: Path) -> Dict[str, object]:
     digest = blake3_file(path)
     dest = _object_path_for(digest)
     dest.parent.mkdir(parents=True, exist_ok=True)
+    # An object that exists is trusted without reading it, so it must never be
+    # seen half-written: copy beside it, then rename into place atomically.
+    # The hash pass leaves the source in the page cache, so the copy (done
+    # in-kernel by copy2) doesn't go back to the disk for it.
     if not dest.exists():
+        tmp = dest.with_name(f"{dest.name}.tmp-{os.getpid()}-{threading.get_ident()}")
         try:
-            shutil.copy2(path, dest)
+            shutil.copy2(path, tmp)
+            os.replace(tmp, dest)
         except Exception as exc:  # pragma: no cover - filesystem dependent
+            tmp.unlink(missing_ok=True)
             raise StorageError(f"Failed to store file: {path} -> {dest}: {exc}") from exc
     size = dest.stat().st_size
     return {"hash": f"b3:{digest}", "size": int(size), "name": path.name, "src": str(path)}
@@ -32,6 +32,8 @@ from .widgets.sitemap_panel import SitemapPanel
 from .workers.retrieval_worker import RetrievalWorker
 from .widgets.guide_panel import GuidePanel
 from .core.config import ensure_directories
+from .core.index import flush_index
+from .core import rag
 from .theme import glass
 
 
@@ -142,10 +144,25 @@ class MainWindow(QMainWindow):
         self.search.toggleExport.connect(self._toggle_export_digest)
         self.qa.ask.connect(self._start_qa)
         self.guide.ask.connect(self._start_retrieval)
+        self.dashboard.refreshFailed.connect(lambda msg: self.status.info(f"Dashboard refresh failed: {msg}"))
         self.sitemap.addToExport.connect(lambda d: self.export.toggle_digest(d, True))
+        self.sitemap.refreshFailed.connect(lambda msg: self.status.info(f"Sitemap refresh failed: {msg}"))
         self.export.exportRequested.connect(self._start_export)
 
+        # One search and one answer run at a time; anything asked meanwhile
+        # waits, and only the newest waiting request is kept
+        self._search_worker: SearchWorker | None = None
+        self._queued_search: str | None = None
+        self._qa_worker: QAWorker | None = None
+        self._queued_question: str | None = None
+        self._index_worker: IndexWorker | None = None
+
         self._pending_files: list[Path] = []
+        # Coalesce drops arriving in quick succession into a single ingest worker
+        self._ingest_timer = QTimer(self)
+        self._ingest_timer.setSingleShot(True)
+        self._ingest_timer.setInterval(250)
+        self._ingest_timer.timeout.connect(self._flush_ingest)
 
     def _track_worker(self, worker) -> None:
         """Track worker lifetime and remove on finish."""
@@ -163,12 +180,20 @@ class MainWindow(QMainWindow):
         self.sitemap.setVisible(row == 4)
         self.guide.setVisible(row == 5)
         self.qa.setVisible(row == 6)
+        if row == 6:
+            # Start loading the local LLM while the user types their question
+            rag.warm_local_llm()
         # Terminal is always visible at the bottom; no toggle via sidebar
         self.about.setVisible(row == 7)
 
     def _ingest_files(self, files: list[Path]) -> None:
         self._pending_files.extend(files)
         self.status.info(f"Queued {len(self._pending_files)} file(s) for ingest…")
+        self._ingest_timer.start()  # restarts the countdown if already armed
+
+    def _flush_ingest(self) -> None:
+        if not self._pending_files:
+            return
         worker = IngestWorker(self._pending_files.copy())
         self._pending_files.clear()
 
@@ -200,6 +225,8 @@ class MainWindow(QMainWindow):
         worker.start()
 
     def _start_index(self) -> None:
+        if self._index_worker is not None:
+            return  # one run at a time; a second would race the first over the same catalog
         worker = IndexWorker()
 
         def progress(p):
@@ -215,13 +242,25 @@ class MainWindow(QMainWindow):
         worker.progress.connect(progress)
         worker.finished_ok.connect(finished)
         worker.error.connect(err)
+        worker.finished.connect(self._index_done)
+        self._index_worker = worker
+        self.home.index_btn.setEnabled(False)
         self._track_worker(worker)
         worker.start()
 
+    def _index_done(self) -> None:
+        self._index_worker = None
+        self.home.index_btn.setEnabled(True)
+
     def _start_search(self, query: str) -> None:
+        if self._search_worker is not None:
+            self._queued_search = query
+            return
         worker = SearchWorker(query)
 
         def results(items):
+            if self._queued_search is not None:
+                return  # superseded; the newer query runs next and fills the list
             self.search.show_results(items)
             self.status.info(f"Found {len(items)} results")
 
@@ -230,9 +269,17 @@ class MainWindow(QMainWindow):
 
         worker.results.connect(results)
         worker.error.connect(err)
+        worker.finished.connect(self._search_done)
+        self._search_worker = worker
         self._track_worker(worker)
         worker.start()
 
+    def _search_done(self) -> None:
+        self._search_worker = None
+        query, self._queued_search = self._queued_search, None
+        if query is not None:
+            self._start_search(query)
+
     def _start_export(self, digests: list[str], dest: Path, fmt: str, enc: bool, puzzle: str) -> None:
         worker = ExportWorker(digests, dest, fmt, puzzle if enc else None)
 
@@ -251,6 +298,11 @@ class MainWindow(QMainWindow):
         self.export.toggle_digest(digest, selected)
 
     def _start_qa(self, question: str) -> None:
+        if self._qa_worker is not None:
+            # A new question supersedes the answer still being generated
+            self._queued_question = question
+            self._qa_worker.requestInterruption()
+            return
         worker = QAWorker(question)
 
         def finished(res):
@@ -261,11 +313,21 @@ class MainWindow(QMainWindow):
             QMessageBox.critical(self, "Q&A Error", msg)
 
         self.status.info("Answering…")
+        self.qa.begin_answer()
         self._track_worker(worker)
+        worker.partial_answer.connect(self.qa.append_token)
         worker.finished_ok.connect(finished)
         worker.error.connect(err)
+        worker.finished.connect(self._qa_done)
+        self._qa_worker = worker
         worker.start()
 
+    def _qa_done(self) -> None:
+        self._qa_worker = None
+        question, self._queued_question = self._queued_question, None
+        if question is not None:
+            self._start_qa(question)
+
     def _start_retrieval(self, question: str) -> None:
         worker = RetrievalWorker(question)
 
@@ -283,9 +345,11 @@ class MainWindow(QMainWindow):
         worker.start()
 
     def closeEvent(self, event):  # type: ignore[override]
-        # Attempt graceful shutdown of running threads
+        # Attempt graceful shutdown of running threads; nothing queued may start after
+        self._queued_search = self._queued_question = None
         for w in list(self._workers):
             if w.isRunning():
+                w.requestInterruption()  # long loops (e.g. LLM generation) poll this
                 w.quit()
         # Wait briefly for threads to exit
         for w in list(self._workers):
@@ -296,6 +360,10 @@ class MainWindow(QMainWindow):
             if w.isRunning():
                 w.terminate()
                 w.wait(1000)
+        self.dashboard.wait_for_refresh()
+        self.sitemap.wait_for_refresh()
+        self.terminal.wait_for_command()
+        flush_index()
         return super().closeEvent(event)
 
 
@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+from PySide6.QtCore import QFile
 from PySide6.QtGui import QIcon
 from PySide6.QtWidgets import QApplication, QStyle, QWidget
 from pathlib import Path
+import functools
+import re
 
 
 # Classic Windows-esque palette (modernized)
@@ -13,15 +16,20 @@ SURFACE = "#FFFFFF"
 TEXT_PRIMARY = "#111111"
 TEXT_SECONDARY = "#333333"
 BORDER = "#C6C6C6"
+FONT_STACK = "Segoe UI, -apple-system, system-ui, Roboto, Ubuntu, Cantarell, Noto Sans, Arial, sans-serif"
 
+# Panel radii with a rule in the global stylesheet; card()/glass() with any
+# other radius fall back to a per-widget stylesheet
+PANEL_RADII = (4, 14, 18)
 
-def apply_qss(app: QApplication) -> None:
-    """Apply a global QSS for a flat, classic Windows-style UI (no glass/shadows)."""
-    font_stack = "Segoe UI, -apple-system, system-ui, Roboto, Ubuntu, Cantarell, Noto Sans, Arial, sans-serif"
+
+@functools.lru_cache(maxsize=1)
+def _build_qss() -> str:
+    """Global QSS text; the palette is constant, so it is formatted only once."""
     qss = f"""
     /* Global */
     * {{
-        font-family: {font_stack};
+        font-family: {FONT_STACK};
         color: {TEXT_PRIMARY};
     }}
     QWidget {{
@@ -32,13 +40,6 @@ def apply_qss(app: QApplication) -> None:
     #AppRoot {{
         background: {WINDOW_BG};
     }}
-    /* Optional header */
-    #Header {{
-        background: {PRIMARY_ACCENT};
-        color: #ffffff;
-        padding: 12px 16px;
-        border-bottom: 1px solid {BORDER};
-    }}
     /* Flat panels (legacy classes kept for compatibility) */
     QWidget[class="Glass"],
     QWidget[class="Card"] {{
@@ -46,19 +47,6 @@ def apply_qss(app: QApplication) -> None:
         border: 1px solid {BORDER};
         border-radius: 4px;
     }}
-    QLabel#H1 {{
-        font-size: 22px;
-        font-weight: 600;
-        color: {TEXT_PRIMARY};
-    }}
-    QLabel#H2 {{
-        font-size: 18px;
-        font-weight: 600;
-        color: {TEXT_PRIMARY};
-    }}
-    QLabel[secondary="true"] {{
-        color: {TEXT_SECONDARY};
-    }}
     QPushButton {{
         background: #E6E6E6;
         border: 1px solid {BORDER};
@@ -72,11 +60,6 @@ def apply_qss(app: QApplication) -> None:
     QPushButton:pressed {{
         background: #D0D0D0;
     }}
-    QPushButton[accent="true"] {{
-        background: {PRIMARY_ACCENT};
-        color: #ffffff;
-        border: 1px solid {PRIMARY_ACCENT};
-    }}
     QLineEdit, QTextEdit, QPlainTextEdit {{
         background: #FFFFFF;
         border: 1px solid {BORDER};
@@ -86,6 +69,28 @@ def apply_qss(app: QApplication) -> None:
     QLineEdit:focus, QTextEdit:focus, QPlainTextEdit:focus {{
         border: 1px solid {PRIMARY_ACCENT};
     }}
+    /* Terminal panel: dark console regardless of the light palette */
+    QPlainTextEdit#TerminalOutput {{
+        background-color: #000000;
+        color: #f0f0f0;
+    }}
+    QLabel#TerminalPrompt {{
+        color: {PRIMARY_ACCENT};
+    }}
+    QLineEdit#TerminalInput {{
+        background-color: #0a0a0a;
+        color: #f0f0f0;
+        border: 1px solid #333;
+        padding: 6px 8px;
+        border-radius: 4px;
+    }}
+    QPushButton#TerminalRun {{
+        background-color: #1a1a1a;
+        color: #f0f0f0;
+        border: 1px solid #333;
+        padding: 6px 10px;
+        border-radius: 4px;
+    }}
     /* Sidebar */
     QListWidget#Sidebar {{
         background: {SURFACE};
@@ -148,7 +153,7 @@ def apply_qss(app: QApplication) -> None:
         border: 1px solid {BORDER};
         padding: 4px 6px;
     }}
-    QTableWidget, QTreeWidget {{
+    QTableView, QTreeWidget {{
         gridline-color: {BORDER};
         selection-background-color: #D9EFFF;
         selection-color: {TEXT_PRIMARY};
@@ -161,33 +166,120 @@ def apply_qss(app: QApplication) -> None:
         color: {TEXT_SECONDARY};
     }}
     """
-    app.setStyleSheet(qss)
+    # Per-radius panel rules, selected by the "radius" property _apply_panel sets
+    qss += "".join(
+        f'QWidget[class="Card"][radius="{r}"], QWidget[class="Glass"][radius="{r}"] {{ border-radius: {r}px; }}\n'
+        for r in PANEL_RADII
+    )
+    return _minify_qss(qss)
 
 
-def card(widget: QWidget, radius: int = 4, *_args, **_kwargs) -> None:
-    """Apply flat card styling with no shadow (compatibility helper)."""
-    current = widget.objectName()
-    if not current:
-        widget.setObjectName("CardInstance")
-    widget.setProperty("class", "Card")
+_QSS_COMMENT = re.compile(r"/\*.*?\*/", re.S)
+_QSS_SPACE = re.compile(r"\s+")
+_QSS_PUNCT_SPACE = re.compile(r"\s*([{};,])\s*")
+
+
+def _minify_qss(qss: str) -> str:
+    """Strip comments and layout whitespace so Qt tokenizes less text."""
+    qss = _QSS_COMMENT.sub("", qss)
+    qss = _QSS_SPACE.sub(" ", qss)
+    # Space around these is never significant; descendant-selector spaces are kept
+    return _QSS_PUNCT_SPACE.sub(r"\1", qss).strip()
+
+
+def apply_qss(app: QApplication) -> None:
+    """Apply a global QSS for a flat, classic Windows-style UI (no glass/shadows)."""
+    qss = _build_qss()
+    # setStyleSheet restyles every widget, so skip it when nothing would change
+    if app.styleSheet() != qss:
+        app.setStyleSheet(qss)
+
+
+@functools.lru_cache(maxsize=None)
+def _radius_qss(radius: int) -> str:
+    return f"border-radius: {radius}px;"
+
+
+def _apply_panel(widget: QWidget, default_name: str, cls: str, radius: int) -> None:
+    if not widget.objectName():  # keep names like "Sidebar" that the QSS targets
+        widget.setObjectName(default_name)
+    changed = widget.property("class") != cls or widget.property("radius") != radius
+    if changed:
+        widget.setProperty("class", cls)
+        widget.setProperty("radius", radius)
+    # Panels are flat: drop any graphics effect (e.g. a shadow left by older
+    # styling), since effects force offscreen rendering of the whole subtree
     try:
-        widget.setGraphicsEffect(None)
+        if widget.graphicsEffect() is not None:
+            widget.setGraphicsEffect(None)
     except Exception:
         pass
-    widget.setStyleSheet(f"border-radius: {radius}px;")
+    sheet = "" if radius in PANEL_RADII else _radius_qss(radius)
+    if widget.styleSheet() != sheet:
+        widget.setStyleSheet(sheet)  # re-polishes the widget itself
+    elif changed:
+        # Property selectors are only re-evaluated on polish
+        style = widget.style()
+        style.unpolish(widget)
+        style.polish(widget)
+
+
+def card(widget: QWidget, radius: int = 4, *_args, **_kwargs) -> None:
+    """Apply flat card styling with no shadow (compatibility helper).
+
+    Extra arguments (old shadow blur/offset/colour) are accepted and ignored:
+    panels never get a QGraphicsEffect, which would render them offscreen.
+    """
+    _apply_panel(widget, "CardInstance", "Card", radius)
 
 
 def glass(widget: QWidget, radius: int = 4, *_args, **_kwargs) -> None:
-    """Apply flat panel styling (no glass/shadow)."""
-    current = widget.objectName()
-    if not current:
-        widget.setObjectName("GlassInstance")
-    widget.setProperty("class", "Glass")
-    try:
-        widget.setGraphicsEffect(None)
-    except Exception:
-        pass
-    widget.setStyleSheet(f"border-radius: {radius}px;")
+    """Apply flat panel styling (no glass/shadow); extra arguments are ignored as in card()."""
+    _apply_panel(widget, "GlassInstance", "Glass", radius)
+
+
+_ICON_NAME_TO_SP = {
+    "file": QStyle.SP_FileIcon,
+    "folder": QStyle.SP_DirIcon,
+    "open": QStyle.SP_DialogOpenButton,
+    "save": QStyle.SP_DialogSaveButton,
+    "trash": QStyle.SP_TrashIcon,
+    "add": QStyle.SP_DialogYesButton,
+    "remove": QStyle.SP_DialogNoButton,
+    "search": QStyle.SP_FileDialogContentsView,
+    "refresh": QStyle.SP_BrowserReload,
+    "apply": QStyle.SP_DialogApplyButton,
+    "cancel": QStyle.SP_DialogCancelButton,
+}
+
+
+_CACHED_STYLE: QStyle | None = None
+
+
+def _style() -> QStyle | None:
+    """The application's QStyle, looked up once; None before a QApplication exists."""
+    global _CACHED_STYLE
+    if _CACHED_STYLE is None:
+        app = QApplication.instance()
+        if app is None:
+            return None
+        _CACHED_STYLE = app.style()
+        # The style dies with the app; don't hand out a dangling pointer afterwards
+        app.destroyed.connect(lambda *_: reset_style_cache())
+    return _CACHED_STYLE
+
+
+def reset_style_cache() -> None:
+    """Forget the cached QStyle and its icons; call after QApplication.setStyle()."""
+    global _CACHED_STYLE
+    _CACHED_STYLE = None
+    _cached_icon.cache_clear()
+
+
+@functools.lru_cache(maxsize=32)
+def _cached_icon(style: QStyle, sp: QStyle.StandardPixmap) -> QIcon:
+    # Keyed on the style too, so switching the app style yields its own icons
+    return style.standardIcon(sp)
 
 
 def get_icon(name: str) -> QIcon:
@@ -195,37 +287,40 @@ def get_icon(name: str) -> QIcon:
 
     Names: "file", "folder", "open", "save", "trash", "add", "remove", "search", "refresh", "apply", "cancel".
     """
-    mapping = {
-        "file": QStyle.SP_FileIcon,
-        "folder": QStyle.SP_DirIcon,
-        "open": QStyle.SP_DialogOpenButton,
-        "save": QStyle.SP_DialogSaveButton,
-        "trash": QStyle.SP_TrashIcon,
-        "add": QStyle.SP_DialogYesButton,
-        "remove": QStyle.SP_DialogNoButton,
-        "search": QStyle.SP_FileDialogContentsView,
-        "refresh": QStyle.SP_BrowserReload,
-        "apply": QStyle.SP_DialogApplyButton,
-        "cancel": QStyle.SP_DialogCancelButton,
-    }
-    sp = mapping.get(name.lower(), QStyle.SP_FileIcon)
-    style = QApplication.instance().style() if QApplication.instance() else None
+    sp = _ICON_NAME_TO_SP.get(name.lower(), QStyle.SP_FileIcon)
+    style = _style()
     if style is None:
-        # Fallback empty icon
+        # Fallback empty icon (not cached, so real icons load once an app exists)
         return QIcon()
-    return style.standardIcon(sp)
+    return _cached_icon(style, sp)
 
 
-def app_logo_icon() -> QIcon:
-    """Return the branded app icon if available."""
-    base = Path(__file__).resolve().parents[2]
-    svg = base / "assets" / "brand" / "arcastone.svg"
+try:  # compiled from assets/arcastone.qrc by pyside6-rcc for packaged builds
+    from . import resources_rc  # type: ignore  # noqa: F401
+except ImportError:  # pragma: no cover - development checkout
+    resources_rc = None
+
+_LOGO_RESOURCE = ":/brand/arcastone.svg"
+
+
+@functools.lru_cache(maxsize=1)
+def _load_logo_icon() -> QIcon:
+    if resources_rc is not None and QFile.exists(_LOGO_RESOURCE):
+        return QIcon(_LOGO_RESOURCE)  # embedded in the binary; no filesystem access
+    # Development checkout: assets/ sits next to this package. __file__ is
+    # already absolute, so no realpath() walk is needed to get there.
+    svg = Path(__file__).parent.parent / "assets" / "brand" / "arcastone.svg"
     if svg.exists():
         # Qt can load SVG into QIcon via QPixmap with svg plugin available
         return QIcon(str(svg))
     return QIcon()
 
 
+def app_logo_icon() -> QIcon:
+    """Return the branded app icon if available."""
+    return _load_logo_icon()
+
+
 # Backwards compatibility: keep the old name as a no-op wrapper
 def apply_dark_theme(app: QApplication) -> None:
     apply_qss(app)
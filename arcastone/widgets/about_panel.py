@@ -1,47 +1,39 @@
 from __future__ import annotations
 
 from datetime import datetime
+from typing import Optional, Tuple
 
-from PySide6.QtWidgets import QWidget, QVBoxLayout, QTextBrowser
+from PySide6.QtGui import QTextDocument
+from PySide6.QtWidgets import QApplication, QWidget, QVBoxLayout, QTextBrowser
 
 
-class AboutPanel(QWidget):
-    def __init__(self):
-        super().__init__()
-        layout = QVBoxLayout(self)
-        self.viewer = QTextBrowser()
-        self.viewer.setOpenExternalLinks(True)
-        layout.addWidget(self.viewer)
-        self.load_whitepaper()
-
-    def load_whitepaper(self) -> None:
-        today = datetime.now().strftime("%B %d, %Y")
-        html = f'''<!DOCTYPE html>
+# Only the date varies; a plain sentinel keeps the CSS braces readable
+_WHITEPAPER_HTML_TEMPLATE = '''<!DOCTYPE html>
 <html>
 <head>
   <meta charset="utf-8" />
   <style>
-    body {{
+    body {
       font-family: -apple-system, system-ui, "SF Pro Text", Segoe UI, Roboto, Arial, sans-serif;
       color: #1C1C1E; margin: 24px; line-height: 1.55;
-    }}
-    h1 {{ font-size: 28px; margin: 0 0 16px; }}
-    h2 {{ font-size: 20px; margin: 24px 0 8px; }}
-    h3 {{ font-size: 16px; margin: 18px 0 6px; }}
-    .muted {{ color: #4A4A4A; }}
-    .tag {{ display:inline-block; background:#F7F7FA; border:1px solid #E6E6EE; padding:2px 8px; border-radius:10px; font-size:12px; margin-right:6px; }}
-    .card {{ background:#FFFFFF; border:1px solid #E6E6EE; border-radius:14px; padding:16px; margin:14px 0; }}
-    ul {{ margin: 6px 0 12px 22px; }}
-    li {{ margin: 4px 0; }}
-    code {{ background:#f3f3f6; padding:1px 5px; border-radius:6px; }}
-    .kbd {{ font-family: ui-monospace, Menlo, monospace; font-size: 12px; background:#f3f3f6; padding:1px 6px; border-radius:6px; border:1px solid #e6e6ee; }}
-    .grid {{ display:grid; gap:12px; grid-template-columns: repeat(auto-fit, minmax(240px, 1fr)); }}
+    }
+    h1 { font-size: 28px; margin: 0 0 16px; }
+    h2 { font-size: 20px; margin: 24px 0 8px; }
+    h3 { font-size: 16px; margin: 18px 0 6px; }
+    .muted { color: #4A4A4A; }
+    .tag { display:inline-block; background:#F7F7FA; border:1px solid #E6E6EE; padding:2px 8px; border-radius:10px; font-size:12px; margin-right:6px; }
+    .card { background:#FFFFFF; border:1px solid #E6E6EE; border-radius:14px; padding:16px; margin:14px 0; }
+    ul { margin: 6px 0 12px 22px; }
+    li { margin: 4px 0; }
+    code { background:#f3f3f6; padding:1px 5px; border-radius:6px; }
+    .kbd { font-family: ui-monospace, Menlo, monospace; font-size: 12px; background:#f3f3f6; padding:1px 6px; border-radius:6px; border:1px solid #e6e6ee; }
+    .grid { display:grid; gap:12px; grid-template-columns: repeat(auto-fit, minmax(240px, 1fr)); }
   </style>
   <title>ArcaStone Whitepaper</title>
   </head>
   <body>
     <h1>ArcaStone — Personal Offline Vault for Knowledge</h1>
-    <div class="muted">Version 0.1 • Updated {today}</div>
+    <div class="muted">Version 0.1 • Updated __TODAY__</div>
 
     <div class="card">
       <h2>Executive Summary</h2>
@@ -158,6 +150,42 @@ class AboutPanel(QWidget):
     </ul>
   </body>
 </html>'''
-        self.viewer.setHtml(html)
+
+# Split once at the date slot(s); rendering is then a single join
+_WHITEPAPER_FRAGMENTS = _WHITEPAPER_HTML_TEMPLATE.split("__TODAY__")
+
+# (date, parsed document) shared by every AboutPanel; re-parsed only when the date changes
+_WHITEPAPER_DOC: Optional[Tuple[str, QTextDocument]] = None
+
+
+def _whitepaper_document() -> QTextDocument:
+    global _WHITEPAPER_DOC
+    today = datetime.now().strftime("%B %d, %Y")
+    if _WHITEPAPER_DOC is None or _WHITEPAPER_DOC[0] != today:
+        # Owned by the app, so panels still showing an older date keep a live document
+        doc = QTextDocument(QApplication.instance())
+        doc.setHtml(today.join(_WHITEPAPER_FRAGMENTS))
+        _WHITEPAPER_DOC = (today, doc)
+    return _WHITEPAPER_DOC[1]
+
+
+class AboutPanel(QWidget):
+    def __init__(self):
+        super().__init__()
+        QVBoxLayout(self)
+        # The panel starts hidden; the browser and document are built on first show
+        self.viewer: Optional[QTextBrowser] = None
+
+    def showEvent(self, event):  # type: ignore[override]
+        if self.viewer is None:
+            self.load_whitepaper()
+        super().showEvent(event)
+
+    def load_whitepaper(self) -> None:
+        if self.viewer is None:
+            self.viewer = QTextBrowser()
+            self.viewer.setOpenExternalLinks(True)
+            self.layout().addWidget(self.viewer)
+        self.viewer.setDocument(_whitepaper_document())
 
 
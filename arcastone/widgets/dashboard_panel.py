@@ -1,13 +1,9 @@
 from __future__ import annotations
 
-from pathlib import Path
-from datetime import datetime, timezone
-from typing import Dict, List, Tuple
-import json
-import sqlite3
-import os
-
-from PySide6.QtCore import Qt
+from datetime import datetime
+from typing import List, Tuple
+
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, Qt, QTimer, Signal
 from PySide6.QtWidgets import (
     QWidget,
     QVBoxLayout,
@@ -16,30 +12,55 @@ from PySide6.QtWidgets import (
     QPushButton,
     QGroupBox,
     QGridLayout,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QHeaderView,
     QTreeWidget,
     QTreeWidgetItem,
 )
 
-from ..core.storage import ensure_subdirs
-from ..core.manifest import list_documents
-from ..core.index import index_stats
+from ..core.dashboard import DashboardData
+from ..workers.dashboard_worker import DashboardWorker
 
 
-def _parse_iso(ts: str) -> datetime:
-    try:
-        # Supports ISO with trailing Z
-        return datetime.strptime(ts, "%Y-%m-%dT%H:%M:%S.%fZ").replace(tzinfo=timezone.utc)
-    except Exception:
-        try:
-            return datetime.fromisoformat(ts)
-        except Exception:
-            return datetime.fromtimestamp(0, tz=timezone.utc)
+_BYTE_UNITS = ("B", "KB", "MB", "GB", "TB", "PB")
+
+
+class ActivityModel(QAbstractTableModel):
+    """Activity rows as (time, event, details) strings; Qt asks for cells as it paints them."""
+
+    HEADERS = ("Time", "Event", "Details")
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows: List[Tuple[str, str, str]] = []
+
+    def set_rows(self, rows: List[Tuple[datetime, str, str]]) -> None:
+        self.beginResetModel()
+        self._rows = [(ts.strftime("%Y-%m-%d %H:%M:%S"), name, details) for ts, name, details in rows]
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()) -> int:  # type: ignore[override]
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()) -> int:  # type: ignore[override]
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index, role=Qt.DisplayRole):  # type: ignore[override]
+        if not index.isValid():
+            return None
+        if role == Qt.DisplayRole or (role == Qt.ToolTipRole and index.column() == 2):
+            return self._rows[index.row()][index.column()]
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):  # type: ignore[override]
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
 
 
 class DashboardPanel(QWidget):
+    refreshFailed = Signal(str)  # error message from a reload
+
     def __init__(self):
         super().__init__()
         layout = QVBoxLayout(self)
@@ -100,12 +121,23 @@ class DashboardPanel(QWidget):
         act_layout = QVBoxLayout(act_group)
         act_layout.setContentsMargins(10, 8, 10, 10)
         act_layout.setSpacing(8)
-        self.activity_table = QTableWidget(0, 3)
-        self.activity_table.setHorizontalHeaderLabels(["Time", "Event", "Details"])
-        self.activity_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeToContents)
+        self._activity_model = ActivityModel(self)
+        self.activity_table = QTableView()
+        self.activity_table.setModel(self._activity_model)
+        # Timestamps are fixed-width; sizing to contents would read every row
+        self.activity_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Fixed)
+        self.activity_table.horizontalHeader().resizeSection(
+            0, self.activity_table.fontMetrics().horizontalAdvance("0000-00-00 00:00:00") + 16
+        )
         self.activity_table.horizontalHeader().setSectionResizeMode(1, QHeaderView.ResizeToContents)
         self.activity_table.horizontalHeader().setSectionResizeMode(2, QHeaderView.Stretch)
-        self.activity_table.setWordWrap(True)
+        # Fixed-height single-line rows: measuring 200 wrapped JSON cells on every
+        # refresh cost more than the rest of it; the full text is in the tooltip
+        self.activity_table.setWordWrap(False)
+        self.activity_table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.activity_table.verticalHeader().setDefaultSectionSize(
+            self.activity_table.fontMetrics().height() + 8
+        )
         self.activity_table.setAlternatingRowColors(True)
         act_layout.addWidget(self.activity_table)
         layout.addWidget(act_group)
@@ -124,104 +156,85 @@ class DashboardPanel(QWidget):
 
         layout.addStretch(1)
 
-        self.refresh()
+        self._worker: DashboardWorker | None = None
+        self._refresh_pending = False
+        self._shown: DashboardData | None = None
+        # Coalesce bursts of refresh requests (e.g. repeated clicks) into one
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(250)
+        self._refresh_timer.timeout.connect(self._do_refresh)
+        self._do_refresh()
 
     def refresh(self) -> None:
-        self._load_summary()
-        self._load_activity()
-        self._load_positions()
-
-    def _load_summary(self) -> None:
-        docs = list_documents()
-        total_docs = len(docs)
-        total_pages = sum(int(d.get("pages_count", 0)) for d in docs)
-        total_bytes = sum(int(d.get("size_bytes", 0)) for d in docs)
-        today_str = datetime.now(timezone.utc).strftime("%Y-%m-%d")
-        today_docs = 0
-        today_pages = 0
-        today_bytes = 0
-        for d in docs:
-            ts = str(d.get("added_at", ""))
-            if ts.startswith(today_str):
-                today_docs += 1
-                today_pages += int(d.get("pages_count", 0))
-                today_bytes += int(d.get("size_bytes", 0))
-
-        idx = index_stats()
-        self.total_docs.setText(str(total_docs))
-        self.today_docs.setText(str(today_docs))
-        self.total_pages.setText(str(total_pages))
-        self.today_pages.setText(str(today_pages))
-        self.total_bytes.setText(self._fmt_bytes(total_bytes))
-        self.today_bytes.setText(self._fmt_bytes(today_bytes))
+        self._refresh_timer.start()  # restarts the countdown if already armed
+
+    def _do_refresh(self) -> None:
+        """Reload the dashboard on a worker thread; a request while one is running reloads once more after it."""
+        if self._worker is not None:
+            self._refresh_pending = True
+            return
+        self.refresh_btn.setEnabled(False)
+        worker = DashboardWorker()
+        worker.loaded.connect(self._show)
+        worker.error.connect(self.refreshFailed)
+        worker.finished.connect(self._refresh_done)
+        self._worker = worker
+        worker.start()
+
+    def _refresh_done(self) -> None:
+        self._worker = None
+        if self._refresh_pending:
+            # Data changed while the last load ran; what it showed may be stale
+            self._refresh_pending = False
+            self._do_refresh()
+            return
+        self.refresh_btn.setEnabled(True)
+
+    def wait_for_refresh(self, msecs: int = 5000) -> None:
+        """Block until an in-flight refresh finishes, e.g. before the window closes."""
+        if self._worker is not None:
+            self._worker.wait(msecs)
+
+    def _show(self, data: DashboardData) -> None:
+        # Idle refreshes usually load exactly what is on screen; comparing the
+        # plain data is far cheaper than rebuilding the labels, model and tree
+        prev, self._shown = self._shown, data
+        if prev is None or (prev.summary, prev.index) != (data.summary, data.index):
+            self._show_summary(data)
+        if prev is None or prev.activity != data.activity:
+            self._show_activity(data.activity)
+        if prev is None or (prev.paths, prev.index, prev.faiss_size, prev.catalog_files) != (
+            data.paths, data.index, data.faiss_size, data.catalog_files
+        ):
+            self._show_positions(data)
+
+    def _show_summary(self, data: DashboardData) -> None:
+        stats, idx = data.summary, data.index
+        self.total_docs.setText(str(stats.total_docs))
+        self.today_docs.setText(str(stats.today_docs))
+        self.total_pages.setText(str(stats.total_pages))
+        self.today_pages.setText(str(stats.today_pages))
+        self.total_bytes.setText(self._fmt_bytes(stats.total_bytes))
+        self.today_bytes.setText(self._fmt_bytes(stats.today_bytes))
         self.index_files.setText(str(idx.get("files", 0)))
         self.index_chunks.setText(str(idx.get("chunks", 0)))
         self.index_vectors.setText(str(idx.get("faiss_vectors", 0)))
 
-    def _iter_tlog_rows(self) -> List[Tuple[datetime, str, str]]:
-        subs = ensure_subdirs()
-        rows: List[Tuple[datetime, str, str]] = []
-        # New events.log
-        events_log = subs["tlog"] / "events.log"
-        if events_log.exists():
-            try:
-                with events_log.open("r", encoding="utf-8") as f:
-                    for line in f:
-                        line = line.strip()
-                        if not line:
-                            continue
-                        try:
-                            obj = json.loads(line)
-                            ts = _parse_iso(str(obj.get("time", "")))
-                            ev = obj.get("event", {})
-                            if isinstance(ev, dict):
-                                name = str(ev.get("type", "event"))
-                                details = json.dumps(ev, ensure_ascii=False)
-                            else:
-                                name = "event"
-                                details = str(ev)
-                            rows.append((ts, name, details))
-                        except Exception:
-                            pass
-            except Exception:
-                pass
-        # Legacy tlog.jsonl
-        legacy = Path(os.path.dirname(subs["tlog"])) / "tlog.jsonl"
-        if legacy.exists():
-            try:
-                with legacy.open("r", encoding="utf-8") as f:
-                    for line in f:
-                        line = line.strip()
-                        if not line:
-                            continue
-                        try:
-                            obj = json.loads(line)
-                            ts = _parse_iso(str(obj.get("time", "")))
-                            name = str(obj.get("event", ""))
-                            details = json.dumps(obj.get("data", {}), ensure_ascii=False)
-                            rows.append((ts, name, details))
-                        except Exception:
-                            pass
-            except Exception:
-                pass
-        rows.sort(key=lambda r: r[0], reverse=True)
-        return rows
-
-    def _load_activity(self) -> None:
-        rows = self._iter_tlog_rows()
-        # Limit to recent 200
-        rows = rows[:200]
-        self.activity_table.setRowCount(len(rows))
-        for i, (ts, name, details) in enumerate(rows):
-            self.activity_table.setItem(i, 0, QTableWidgetItem(ts.strftime("%Y-%m-%d %H:%M:%S")))
-            self.activity_table.setItem(i, 1, QTableWidgetItem(name))
-            self.activity_table.setItem(i, 2, QTableWidgetItem(details))
-        self.activity_table.resizeRowsToContents()
-
-    def _load_positions(self) -> None:
+    def _show_activity(self, rows: List[Tuple[datetime, str, str]]) -> None:
+        self._activity_model.set_rows(rows)
+
+    def _show_positions(self, data: DashboardData) -> None:
+        self.pos_tree.setUpdatesEnabled(False)
+        try:
+            self._fill_positions(data)
+        finally:
+            self.pos_tree.setUpdatesEnabled(True)
+
+    def _fill_positions(self, data: DashboardData) -> None:
         self.pos_tree.clear()
-        subs = ensure_subdirs()
-        data_dir = subs["objects"].parents[0]
+        subs = data.paths
+        data_dir = subs["objects"].parent
 
         # Root paths
         root_node = QTreeWidgetItem(["Data Root", str(data_dir)])
@@ -231,32 +244,20 @@ class DashboardPanel(QWidget):
         self.pos_tree.addTopLevelItem(QTreeWidgetItem(["Catalog DB", str(subs["catalog"])]))
 
         # Index files info
-        idx = index_stats()
         faiss_path = (subs["index"] / "faiss.index")
-        faiss_size = faiss_path.stat().st_size if faiss_path.exists() else 0
         idx_node = QTreeWidgetItem(["FAISS Index", str(faiss_path)])
-        idx_node.addChild(QTreeWidgetItem(["Vectors", str(idx.get("faiss_vectors", 0))]))
-        idx_node.addChild(QTreeWidgetItem(["File Size", self._fmt_bytes(faiss_size)]))
+        idx_node.addChild(QTreeWidgetItem(["Vectors", str(data.index.get("faiss_vectors", 0))]))
+        idx_node.addChild(QTreeWidgetItem(["File Size", self._fmt_bytes(data.faiss_size)]))
         self.pos_tree.addTopLevelItem(idx_node)
 
         # Catalog: list files (limited)
         files_node = QTreeWidgetItem(["Catalog Files (latest 200)", ""]) 
         self.pos_tree.addTopLevelItem(files_node)
-        try:
-            conn = sqlite3.connect(str(subs["catalog"]))
-            cur = conn.cursor()
-            cur.execute("SELECT name, size, stored_path FROM files ORDER BY id DESC LIMIT 200")
-            for name, size, stored in cur.fetchall():
-                stored_str = str(stored)
-                leaf = QTreeWidgetItem([str(name), f"{self._fmt_bytes(int(size))} @ {stored_str}"])
-                files_node.addChild(leaf)
-        except Exception:
-            pass
-        finally:
-            try:
-                conn.close()
-            except Exception:
-                pass
+        # One insertion into the tree instead of 200
+        files_node.addChildren([
+            QTreeWidgetItem([name, f"{self._fmt_bytes(size)} @ {stored}"])
+            for name, size, stored in data.catalog_files
+        ])
 
         for i in range(self.pos_tree.topLevelItemCount()):
             self.pos_tree.topLevelItem(i).setExpanded(True)
@@ -264,13 +265,9 @@ class DashboardPanel(QWidget):
     def _fmt_bytes(self, n: int) -> str:
         if n < 1024:
             return f"{n} B"
-        units = ["KB", "MB", "GB", "TB"]
-        x = float(n)
-        for u in units:
-            x /= 1024.0
-            if x < 1024.0:
-                return f"{x:.2f} {u}"
-        return f"{x:.2f} PB"
+        # Each unit is 10 more bits, so the bit length picks it without a loop
+        k = min((n.bit_length() - 1) // 10, 5)
+        return f"{n / (1 << (10 * k)):.2f} {_BYTE_UNITS[k]}"
 
 
 
@@ -1,13 +1,28 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List
+import os
 
 from PySide6.QtCore import Qt, Signal
 from PySide6.QtGui import QDragEnterEvent, QDropEvent
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QLabel, QPushButton, QFileDialog, QFrame, QListWidget, QListWidgetItem, QProgressBar
 
 
+# Drops at least this large stat their files on a small thread pool; each
+# stat releases the GIL, which matters on network mounts and slow disks
+PARALLEL_STAT_MIN = 16
+STAT_WORKERS = 8
+
+
+def _exists_many(paths: List[str]) -> List[bool]:
+    if len(paths) < PARALLEL_STAT_MIN:
+        return [os.path.exists(p) for p in paths]
+    with ThreadPoolExecutor(max_workers=STAT_WORKERS) as pool:
+        return list(pool.map(os.path.exists, paths))
+
+
 class DropIngest(QWidget):
     filesDropped = Signal(list)  # List[Path]
     indexRequested = Signal()
@@ -48,12 +63,13 @@ class DropIngest(QWidget):
         self.choose_btn.clicked.connect(self._choose_files)
         self.index_btn.clicked.connect(self.indexRequested.emit)
 
+        self._home = str(Path.home())
         self._has_files = False
         self._total = 0
         self._processed = 0
 
     def _choose_files(self) -> None:
-        files, _ = QFileDialog.getOpenFileNames(self, "Select PDF files", str(Path.home()), "PDF Files (*.pdf)")
+        files, _ = QFileDialog.getOpenFileNames(self, "Select PDF files", self._home, "PDF Files (*.pdf)")
         if files:
             paths = [Path(f) for f in files]
             self._has_files = True
@@ -68,12 +84,8 @@ class DropIngest(QWidget):
             super().dragEnterEvent(event)
 
     def dropEvent(self, event: QDropEvent) -> None:
-        urls = event.mimeData().urls()
-        paths: List[Path] = []
-        for u in urls:
-            p = Path(u.toLocalFile())
-            if p.suffix.lower() == ".pdf" and p.exists():
-                paths.append(p)
+        candidates = [f for f in (u.toLocalFile() for u in event.mimeData().urls()) if f.lower().endswith(".pdf")]
+        paths = [Path(f) for f, ok in zip(candidates, _exists_many(candidates)) if ok]
         if paths:
             self._has_files = True
             self.index_btn.setEnabled(True)
@@ -94,9 +106,15 @@ class DropIngest(QWidget):
             self.progress.hide()
 
     def _append_files(self, paths: List[Path]) -> None:
-        for p in paths:
-            item = QListWidgetItem(p.name)
-            item.setToolTip(str(p))
-            self.file_list.addItem(item)
+        file_list = self.file_list
+        # One repaint for the whole drop rather than one per file
+        file_list.setUpdatesEnabled(False)
+        try:
+            for p in paths:
+                item = QListWidgetItem(p.name)
+                item.setToolTip(str(p))
+                file_list.addItem(item)
+        finally:
+            file_list.setUpdatesEnabled(True)
 
 
@@ -9,6 +9,7 @@ from PySide6.QtWidgets import (
     QVBoxLayout,
     QHBoxLayout,
     QListWidget,
+    QListWidgetItem,
     QPushButton,
     QFileDialog,
     QAbstractItemView,
@@ -52,6 +53,7 @@ class ExportPanel(QWidget):
         opts.addWidget(self.puzzle)
         self.export_btn = QPushButton("Export…")
         self._selected_from_search: set[str] = set()
+        self._by_digest: dict[str, QListWidgetItem] = {}
 
         layout.addWidget(self.docs)
         layout.addWidget(self.refresh_btn)
@@ -63,18 +65,23 @@ class ExportPanel(QWidget):
         self.refresh()
 
     def refresh(self) -> None:
-        self.docs.clear()
-        for d in list_documents():
-            text = f"{d['original_filename']} — {d['pages_count']}p — {d['digest'][:8]}…"
-            item = self.docs.addItem(text) if False else None
-            # Workaround: QListWidget.addItem returns None; create item explicitly
-            from PySide6.QtWidgets import QListWidgetItem
-            item = QListWidgetItem(text)
-            item.setData(Qt.UserRole, d["digest"])  # store full digest
-            self.docs.addItem(item)
-            # auto-select items previously toggled in Search
-            if d["digest"] in self._selected_from_search:
-                item.setSelected(True)
+        self._by_digest.clear()
+        # Paint once after the list is rebuilt rather than per item
+        self.docs.setUpdatesEnabled(False)
+        user_role = Qt.UserRole  # enum lookup hoisted out of the loop
+        try:
+            self.docs.clear()
+            for d in list_documents():
+                text = f"{d['original_filename']} — {d['pages_count']}p — {d['digest'][:8]}…"
+                item = QListWidgetItem(text)
+                item.setData(user_role, d["digest"])  # store full digest
+                self.docs.addItem(item)
+                self._by_digest[d["digest"]] = item
+                # auto-select items previously toggled in Search
+                if d["digest"] in self._selected_from_search:
+                    item.setSelected(True)
+        finally:
+            self.docs.setUpdatesEnabled(True)
 
     def _export(self) -> None:
         items = self.docs.selectedItems()
@@ -101,10 +108,8 @@ class ExportPanel(QWidget):
         else:
             self._selected_from_search.discard(digest)
         # sync selection state in the list if item exists
-        for i in range(self.docs.count()):
-            it = self.docs.item(i)
-            if it.data(Qt.UserRole) == digest:
-                it.setSelected(selected)
-                break
+        item = self._by_digest.get(digest)
+        if item is not None:
+            item.setSelected(selected)
 
 
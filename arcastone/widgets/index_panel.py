@@ -35,9 +35,18 @@ class IndexPanel(QWidget):
         layout.addWidget(self.refresh_btn)
         self.refresh_btn.clicked.connect(self.refresh)
 
-        self.refresh()
+        # Coalesce bursts of refresh requests (e.g. repeated clicks) into one
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(250)
+        self._refresh_timer.timeout.connect(self._do_refresh)
+
+        self._do_refresh()
 
     def refresh(self) -> None:
+        self._refresh_timer.start()  # restarts the countdown if already armed
+
+    def _do_refresh(self) -> None:
         s = index_stats()
         self.files.setText(str(s.get("files", 0)))
         self.chunks.setText(str(s.get("chunks", 0)))
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from PySide6.QtCore import Signal, Qt
+from PySide6.QtGui import QTextCursor
 from PySide6.QtWidgets import (
     QWidget,
     QVBoxLayout,
@@ -68,16 +69,21 @@ class QAPanel(QWidget):
         else:
             self.llm_status.setText("LLM: not configured (uses extractive fallback)")
 
+    def begin_answer(self) -> None:
+        self.answer.clear()
+        self.sources.setText("")
+
+    def append_token(self, text: str) -> None:
+        cursor = self.answer.textCursor()
+        cursor.movePosition(QTextCursor.End)
+        cursor.insertText(text)
+        self.answer.setTextCursor(cursor)
+
     def show_answer(self, text: str, files: list[str]) -> None:
         self.answer.setPlainText(text)
         if files:
-            unique = []
-            seen = set()
-            for f in files:
-                if f and f not in seen:
-                    seen.add(f)
-                    unique.append(f)
-            self.sources.setText("\n".join(unique))
+            # dict keeps first-seen order, so this dedupes without reordering
+            self.sources.setText("\n".join(dict.fromkeys(f for f in files if f)))
         else:
             self.sources.setText("(no sources)")
 
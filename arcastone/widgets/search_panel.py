@@ -2,11 +2,68 @@ from __future__ import annotations
 
 from typing import List
 
-from PySide6.QtCore import Qt, Signal
-from PySide6.QtWidgets import QWidget, QVBoxLayout, QLineEdit, QListWidget, QListWidgetItem, QLabel
+from PySide6.QtCore import QAbstractListModel, QModelIndex, Qt, Signal
+from PySide6.QtWidgets import QWidget, QVBoxLayout, QLineEdit, QListView, QLabel
 
 
 
+class ResultsModel(QAbstractListModel):
+    """Search hits as checkable rows; Qt asks for text only for the rows it paints."""
+
+    checkToggled = Signal(str, bool)  # digest hash, checked
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows: List[dict] = []
+        self._checked: List[bool] = []
+        self._text: List[str | None] = []  # display strings, built on first paint
+
+    def set_results(self, results: List[dict]) -> None:
+        # Rows start unchecked through the reset itself; checkToggled fires only
+        # from setData, so populating sends nothing to the export panel
+        self.beginResetModel()
+        self._rows = list(results)
+        self._checked = [False] * len(self._rows)
+        self._text = [None] * len(self._rows)
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()) -> int:  # type: ignore[override]
+        return 0 if parent.isValid() else len(self._rows)
+
+    def data(self, index, role=Qt.DisplayRole):  # type: ignore[override]
+        if not index.isValid():
+            return None
+        row = index.row()
+        r = self._rows[row]
+        if role == Qt.DisplayRole:
+            # Views ask again on every repaint and scroll; format each row once
+            text = self._text[row]
+            if text is None:
+                text = self._text[row] = f"{r.get('file','')}  —  p.{r.get('page',0)}  —  {r.get('snippet','')}"
+            return text
+        if role == Qt.UserRole:
+            return str(r.get("hash", ""))
+        if role == Qt.CheckStateRole:
+            return Qt.Checked if self._checked[row] else Qt.Unchecked
+        return None
+
+    def setData(self, index, value, role=Qt.EditRole) -> bool:  # type: ignore[override]
+        if not index.isValid() or role != Qt.CheckStateRole:
+            return False
+        checked = Qt.CheckState(value) == Qt.Checked
+        self._checked[index.row()] = checked
+        self.dataChanged.emit(index, index, [Qt.CheckStateRole])
+        digest = str(self._rows[index.row()].get("hash", ""))
+        if digest:
+            self.checkToggled.emit(digest, checked)
+        return True
+
+    def flags(self, index):  # type: ignore[override]
+        if not index.isValid():
+            return Qt.NoItemFlags
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable | Qt.ItemIsUserCheckable
+
+
 class SearchPanel(QWidget):
     querySubmitted = Signal(str)
     toggleExport = Signal(str, bool)  # digest hash, selected
@@ -16,8 +73,15 @@ class SearchPanel(QWidget):
         layout = QVBoxLayout(self)
         self.input = QLineEdit()
         self.input.setPlaceholderText("Search…")
-        self.results = QListWidget()
-        self.results.itemChanged.connect(self._item_changed)
+        self._model = ResultsModel(self)
+        self._model.checkToggled.connect(self.toggleExport)
+        self.results = QListView()
+        self.results.setModel(self._model)
+        # Rows are single-line text, so one size hint serves them all; lay
+        # out in batches so a long result list doesn't stall the first paint
+        self.results.setUniformItemSizes(True)
+        self.results.setLayoutMode(QListView.Batched)
+        self.results.setBatchSize(100)
         self.caption = QLabel("Enter a query to search indexed PDFs")
         self.caption.setAlignment(Qt.AlignCenter)
 
@@ -33,19 +97,4 @@ class SearchPanel(QWidget):
             self.querySubmitted.emit(text)
 
     def show_results(self, results: List[dict]) -> None:
-        self.results.clear()
-        for r in results:
-            digest = str(r.get("hash", ""))
-            text = f"{r.get('file','')}  —  p.{r.get('page',0)}  —  {r.get('snippet','')}"
-            item = QListWidgetItem(text)
-            item.setData(Qt.UserRole, digest)
-            item.setFlags(item.flags() | Qt.ItemIsUserCheckable | Qt.ItemIsEditable)
-            item.setCheckState(Qt.Unchecked)
-            self.results.addItem(item)
-
-    def _item_changed(self, item: QListWidgetItem) -> None:
-        digest = item.data(Qt.UserRole)
-        if isinstance(digest, str) and digest:
-            self.toggleExport.emit(digest, item.checkState() == Qt.Checked)
-
-
+        self._model.set_results(results)
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from PySide6.QtCore import Qt, Signal
+from typing import List, Tuple
+
+from PySide6.QtCore import Qt, QTimer, Signal
 from PySide6.QtWidgets import (
     QWidget,
     QVBoxLayout,
@@ -12,11 +14,13 @@ from PySide6.QtWidgets import (
     QFileDialog,
 )
 
-from ..core.sitemap import build_sitemap, export_sitemap_markdown
+from ..core.sitemap import SiteNode, export_sitemap_markdown
+from ..workers.sitemap_worker import SitemapWorker
 
 
 class SitemapPanel(QWidget):
     addToExport = Signal(str)  # digest
+    refreshFailed = Signal(str)  # error message from a rebuild
 
     def __init__(self):
         super().__init__()
@@ -36,27 +40,74 @@ class SitemapPanel(QWidget):
         self.tree.setHeaderLabels(["Document", "Pages", "Digest"])
         layout.addWidget(self.tree)
 
+        # (item, lowercased title) per top-level row, rebuilt on refresh
+        self._rows: List[Tuple[QTreeWidgetItem, str]] = []
+        self._worker: SitemapWorker | None = None
+        self._refresh_pending = False
+        # Filter once typing pauses rather than on every keystroke
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(150)
+        self._filter_timer.timeout.connect(self._apply_filter)
+
         self.refresh_btn.clicked.connect(self.refresh)
-        self.filter.textChanged.connect(self._apply_filter)
+        self.filter.textChanged.connect(self._filter_timer.start)
         self.export_md_btn.clicked.connect(self._export_md)
         self.tree.itemDoubleClicked.connect(self._add_selected)
 
         self.refresh()
 
     def refresh(self) -> None:
-        self.tree.clear()
-        for node in build_sitemap():
-            it = QTreeWidgetItem([node.title, str(node.pages), node.digest])
-            self.tree.addTopLevelItem(it)
-        self.tree.resizeColumnToContents(0)
+        """Rebuild the tree from a worker thread; a request while one is running rebuilds once more after it."""
+        if self._worker is not None:
+            self._refresh_pending = True
+            return
+        self.refresh_btn.setEnabled(False)
+        worker = SitemapWorker()
+        worker.loaded.connect(self._show)
+        worker.error.connect(self.refreshFailed)
+        worker.finished.connect(self._refresh_done)
+        self._worker = worker
+        worker.start()
+
+    def _refresh_done(self) -> None:
+        self._worker = None
+        if self._refresh_pending:
+            # Documents may have been added while the last build ran
+            self._refresh_pending = False
+            self.refresh()
+            return
+        self.refresh_btn.setEnabled(True)
+
+    def wait_for_refresh(self, msecs: int = 5000) -> None:
+        """Block until an in-flight refresh finishes, e.g. before the window closes."""
+        if self._worker is not None:
+            self._worker.wait(msecs)
+
+    def _show(self, nodes: List[SiteNode]) -> None:
+        self.tree.setUpdatesEnabled(False)
+        try:
+            self.tree.clear()
+            self._rows = [
+                (QTreeWidgetItem([node.title, str(node.pages), node.digest]), node.title.lower())
+                for node in nodes
+            ]
+            # One insertion for all documents instead of one per node
+            self.tree.addTopLevelItems([it for it, _ in self._rows])
+            self.tree.resizeColumnToContents(0)
+        finally:
+            self.tree.setUpdatesEnabled(True)
         self._apply_filter()
 
     def _apply_filter(self) -> None:
+        self._filter_timer.stop()
         text = self.filter.text().strip().lower()
-        for i in range(self.tree.topLevelItemCount()):
-            it = self.tree.topLevelItem(i)
-            visible = text in it.text(0).lower() if text else True
-            it.setHidden(not visible)
+        self.tree.setUpdatesEnabled(False)
+        try:
+            for it, title in self._rows:
+                it.setHidden(bool(text) and text not in title)
+        finally:
+            self.tree.setUpdatesEnabled(True)
 
     def _add_selected(self) -> None:
         it = self.tree.currentItem()
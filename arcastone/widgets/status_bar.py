@@ -1,8 +1,13 @@
 from __future__ import annotations
 
+from PySide6.QtCore import QTimer
 from PySide6.QtWidgets import QStatusBar, QLabel, QProgressBar
 
 
+# Progress repaints are capped at about 30 per second however fast workers report
+PROGRESS_INTERVAL_MS = 33
+
+
 class StatusBar(QStatusBar):
     def __init__(self):
         super().__init__()
@@ -13,20 +18,37 @@ class StatusBar(QStatusBar):
         self.progress.hide()
         self.addPermanentWidget(self.progress)
         self.addPermanentWidget(self.message_label)
+        self._pending: int | None = None
+        self._progress_timer = QTimer(self)
+        self._progress_timer.setSingleShot(True)
+        self._progress_timer.setInterval(PROGRESS_INTERVAL_MS)
+        self._progress_timer.timeout.connect(self._flush_progress)
 
     def info(self, text: str) -> None:
         self.message_label.setText(text)
         self.showMessage(text, 4000)
 
     def start_progress(self, maximum: int) -> None:
+        self._progress_timer.stop()
+        self._pending = None
         self.progress.setRange(0, max(1, int(maximum)))
         self.progress.setValue(0)
         self.progress.show()
 
     def set_progress(self, value: int) -> None:
-        self.progress.setValue(max(0, int(value)))
+        # Only the latest value matters; it is painted when the timer fires
+        self._pending = max(0, int(value))
+        if not self._progress_timer.isActive():
+            self._progress_timer.start()
+
+    def _flush_progress(self) -> None:
+        if self._pending is not None:
+            self.progress.setValue(self._pending)
+            self._pending = None
 
     def stop_progress(self) -> None:
+        self._progress_timer.stop()
+        self._pending = None
         self.progress.hide()
 
 
@@ -1,14 +1,17 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import List, Tuple, Dict
+from typing import Callable, List, Tuple, Dict
 from datetime import datetime, timezone
+import functools
+import os
 import shlex
+import stat
 import sqlite3
 import json
 
 from PySide6.QtCore import Qt
-from PySide6.QtGui import QFont, QTextCursor, QPalette, QColor
+from PySide6.QtGui import QFont, QPalette, QColor
 from PySide6.QtWidgets import (
     QWidget,
     QVBoxLayout,
@@ -22,57 +25,161 @@ from PySide6.QtWidgets import (
 from ..core.storage import ensure_subdirs
 from ..core.manifest import list_documents, get_document_entry
 from ..core.index import index_stats, search as idx_search
+from ..core.dashboard import _tail_lines
+from ..workers.terminal_worker import CommandWorker
+
+
+# Scrollback kept in the output pane
+OUTPUT_MAX_LINES = 5000
+
+_BYTE_UNITS = ("B", "KB", "MB", "GB", "TB", "PB")
 
 
 def _fmt_bytes(n: int) -> str:
     if n < 1024:
         return f"{n} B"
-    units = ["KB", "MB", "GB", "TB"]
-    x = float(n)
-    for u in units:
-        x /= 1024.0
-        if x < 1024.0:
-            return f"{x:.2f} {u}"
-    return f"{x:.2f} PB"
+    # Each unit is 10 more bits, so the bit length picks it without a loop
+    k = min((n.bit_length() - 1) // 10, 5)
+    return f"{n / (1 << (10 * k)):.2f} {_BYTE_UNITS[k]}"
 
 
 def _dos_time(ts: float) -> str:
+    # Only minutes are shown, so whole seconds are a safe key; files written
+    # together share a stamp and reuse the formatted string
+    return _dos_time_s(int(ts))
+
+
+@functools.lru_cache(maxsize=4096)
+def _dos_time_s(ts: int) -> str:
     return datetime.fromtimestamp(ts).strftime("%m/%d/%Y  %I:%M %p")
 
 
+def _dir_lines(target: Path, data_root: Path) -> List[str]:
+    # One stat answers exists/is_file and supplies the file's own line
+    try:
+        st = target.stat()
+    except OSError:
+        return ["File Not Found"]
+    if stat.S_ISREG(st.st_mode):
+        return [f"{_dos_time(st.st_mtime)}           {_fmt_bytes(st.st_size):>12} {target.name}"]
+    rel_path = str(target.relative_to(data_root)).replace("/", "\\") if target != data_root else ""
+    lines = [" Volume in drive C has no label.", f" Directory of C:\\{rel_path}", ""]
+    files = 0
+    bytes_total = 0
+    dirs = 0
+    # scandir entries carry the file type from the directory read, so sorting
+    # dirs first costs no extra stat per entry
+    with os.scandir(target) as it:
+        entries = sorted(it, key=lambda e: (not e.is_dir(), e.name.lower()))
+    for entry in entries:
+        st = entry.stat()
+        t = _dos_time(st.st_mtime)
+        if entry.is_dir():
+            lines.append(f"{t}    <DIR>          {entry.name}")
+            dirs += 1
+        else:
+            lines.append(f"{t}           {_fmt_bytes(st.st_size):>12} {entry.name}")
+            files += 1
+            bytes_total += st.st_size
+    lines.append(f"             {files} File(s)      {_fmt_bytes(bytes_total)}")
+    lines.append(f"             {dirs} Dir(s)")
+    return lines
+
+
+def _tail_rows(path: Path, n: int, payload: Callable[[Dict], object]) -> List[Tuple[str, str]]:
+    """The last `n` parseable rows of a JSONL log as (time, JSON of payload(row)), oldest first."""
+    rows: List[Tuple[str, str]] = []
+    if n <= 0 or not path.exists():
+        return rows
+    try:
+        for line in _tail_lines(path):
+            try:
+                obj = json.loads(line)
+                rows.append((obj.get("time", ""), json.dumps(payload(obj), ensure_ascii=False)))
+            except Exception:
+                continue
+            if len(rows) >= n:
+                break
+    except Exception:
+        pass
+    rows.reverse()
+    return rows
+
+
+def _tokenize(cmdline: str) -> List[str]:
+    # Without quotes or escapes shlex splits exactly like str.split, minus its
+    # pure-Python state machine
+    if '"' not in cmdline and "'" not in cmdline and "\\" not in cmdline:
+        return cmdline.split()
+    try:
+        return shlex.split(cmdline)
+    except ValueError:
+        return cmdline.split()
+
+
+def _file_stamp(path: Path) -> Tuple[int, int]:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return (0, 0)
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _tlog_lines(n: int) -> List[str]:
+    subs = ensure_subdirs()
+    events = subs["tlog"] / "events.log"
+    legacy = subs["tlog"].parent / "tlog.jsonl"
+    # Keyed on both logs' (mtime, size): repeating TLOG with nothing logged
+    # in between costs two stats
+    return list(_tlog_lines_at(events, legacy, _file_stamp(events), _file_stamp(legacy), n))
+
+
+@functools.lru_cache(maxsize=8)
+def _tlog_lines_at(
+    events: Path, legacy: Path, events_stamp: Tuple[int, int], legacy_stamp: Tuple[int, int], n: int
+) -> Tuple[str, ...]:
+    # Output is the tail of events.log followed by the legacy log, so take the
+    # legacy tail first and only as much of events.log as still fits in n
+    legacy_rows = _tail_rows(legacy, n, lambda obj: obj)
+    event_rows = _tail_rows(events, n - len(legacy_rows), lambda obj: obj.get("event", {}))
+    rows = event_rows + legacy_rows
+    if not rows:
+        return ("No activity.",)
+    return tuple(f"{t}  {e}" for t, e in rows)
+
+
 class TerminalPanel(QWidget):
     def __init__(self):
         super().__init__()
         subs = ensure_subdirs()
         self.data_root: Path = subs["objects"].parents[0]
         self.cwd: Path = self.data_root
+        self._prompt: Tuple[Path, str] | None = None  # (cwd it was built for, prompt)
         self.history: List[str] = []
         self.history_idx: int = -1
+        self._command: CommandWorker | None = None
 
         layout = QVBoxLayout(self)
 
         # Output area
         self.output = QPlainTextEdit()
         self.output.setReadOnly(True)
+        # Qt drops the oldest lines past this, so long sessions don't slow every append
+        self.output.setMaximumBlockCount(OUTPUT_MAX_LINES)
         self._apply_dos_theme()
 
         # Input area
         input_row = QHBoxLayout()
         self.prompt_label = QLabel(self._prompt_text())
-        # Modern Windows-accent prompt color
-        self.prompt_label.setStyleSheet("color: #0078d4;")
+        # Colours for the prompt, input and Run button come from the #Terminal* rules in theme.py
+        self.prompt_label.setObjectName("TerminalPrompt")
         self.input = QLineEdit()
         self.input.returnPressed.connect(self._on_enter)
         self.input.installEventFilter(self)
+        self.input.setObjectName("TerminalInput")
         self.run_btn = QPushButton("Run")
+        self.run_btn.setObjectName("TerminalRun")
         self.run_btn.clicked.connect(self._on_enter)
-        # Style input and button to match the dark terminal vibe
-        self.input.setStyleSheet(
-            "background-color: #0a0a0a; color: #f0f0f0; border: 1px solid #333; padding: 6px 8px; border-radius: 4px;"
-        )
-        self.run_btn.setStyleSheet(
-            "background-color: #1a1a1a; color: #f0f0f0; border: 1px solid #333; padding: 6px 10px; border-radius: 4px;"
-        )
         input_row.addWidget(self.prompt_label)
         input_row.addWidget(self.input)
         input_row.addWidget(self.run_btn)
@@ -93,7 +200,7 @@ class TerminalPanel(QWidget):
         pal.setColor(QPalette.Base, QColor(0, 0, 0))
         pal.setColor(QPalette.Text, QColor(240, 240, 240))
         self.output.setPalette(pal)
-        self.output.setStyleSheet("background-color: #000000; color: #f0f0f0;")
+        self.output.setObjectName("TerminalOutput")  # styled by the global stylesheet
 
     def _set_mono_font(self) -> None:
         f = QFont("Courier New")
@@ -105,17 +212,46 @@ class TerminalPanel(QWidget):
         self.prompt_label.setFont(f)
 
     def _prompt_text(self) -> str:
+        # Rebuilt only when cwd changes (CD), not on every command echo
+        cached = self._prompt
+        if cached is not None and cached[0] is self.cwd:
+            return cached[1]
         rel = str(self.cwd.relative_to(self.data_root)).replace("/", "\\") if self.cwd != self.data_root else ""
-        return f"C:\\{rel}> " if rel else "C:\\> "
+        text = f"C:\\{rel}> " if rel else "C:\\> "
+        self._prompt = (self.cwd, text)
+        return text
 
     def _write(self, text: str) -> None:
-        self.output.moveCursor(QTextCursor.End)
-        self.output.insertPlainText(text)
-        self.output.moveCursor(QTextCursor.End)
+        # Writes are whole lines; appendPlainText adds the line break itself and
+        # appends at the end without moving the cursor there and back
+        if text:
+            self.output.appendPlainText(text[:-1] if text.endswith("\n") else text)
 
     def _write_line(self, text: str) -> None:
         self._write(text + "\n")
 
+    def _run_in_background(self, produce: Callable[[], List[str]]) -> None:
+        """Run a command body that touches the disk on a worker; input waits until its output is in."""
+        worker = CommandWorker(produce)
+        worker.lines.connect(lambda lines: self._write("".join(line + "\n" for line in lines)))
+        worker.error.connect(lambda msg: self._write_line(f"Error: {msg}"))
+        worker.finished.connect(self._command_done)
+        self._command = worker
+        self.input.setEnabled(False)
+        self.run_btn.setEnabled(False)
+        worker.start()
+
+    def _command_done(self) -> None:
+        self._command = None
+        self.input.setEnabled(True)
+        self.run_btn.setEnabled(True)
+        self.input.setFocus()
+
+    def wait_for_command(self, msecs: int = 5000) -> None:
+        """Block until a running background command finishes, e.g. before the window closes."""
+        if self._command is not None:
+            self._command.wait(msecs)
+
     def _set_prompt(self) -> None:
         self.prompt_label.setText(self._prompt_text())
 
@@ -153,10 +289,7 @@ class TerminalPanel(QWidget):
         self._execute(cmdline)
 
     def _execute(self, cmdline: str) -> None:
-        try:
-            parts = shlex.split(cmdline)
-        except ValueError:
-            parts = cmdline.split()
+        parts = _tokenize(cmdline)
         if not parts:
             return
         cmd = parts[0].lower()
@@ -200,6 +333,8 @@ class TerminalPanel(QWidget):
         if not arg or arg.strip() == "":
             return self.cwd
         p = arg.replace("\\", "/")
+        # resolve() stays uncached: callers check the result against data_root,
+        # and a memo would keep trusting a symlink after it was repointed
         if p.startswith("/"):
             # absolute within data root
             return (self.data_root / p.lstrip("/")).resolve()
@@ -214,32 +349,7 @@ class TerminalPanel(QWidget):
         except Exception:
             self._write_line("Access denied.")
             return
-        if not target.exists():
-            self._write_line("File Not Found")
-            return
-        if target.is_file():
-            stat = target.stat()
-            self._write_line(f"{_dos_time(stat.st_mtime)}           {_fmt_bytes(stat.st_size):>12} {target.name}")
-            return
-        self._write_line(f" Volume in drive C has no label.")
-        rel_path = str(target.relative_to(self.data_root)).replace("/", "\\") if target != self.data_root else ""
-        self._write_line(f" Directory of C:\\{rel_path}")
-        self._write_line("")
-        files = 0
-        bytes_total = 0
-        dirs = 0
-        for entry in sorted(target.iterdir(), key=lambda p: (not p.is_dir(), p.name.lower())):
-            st = entry.stat()
-            t = _dos_time(st.st_mtime)
-            if entry.is_dir():
-                self._write_line(f"{t}    <DIR>          {entry.name}")
-                dirs += 1
-            else:
-                self._write_line(f"{t}           {_fmt_bytes(st.st_size):>12} {entry.name}")
-                files += 1
-                bytes_total += st.st_size
-        self._write_line(f"             {files} File(s)      {_fmt_bytes(bytes_total)}")
-        self._write_line(f"             {dirs} Dir(s)")
+        self._run_in_background(lambda: _dir_lines(target, self.data_root))
 
     def _cmd_cd(self, args: List[str]) -> None:
         target = self._resolve_path(args[0] if args else "")
@@ -265,17 +375,19 @@ class TerminalPanel(QWidget):
         self._write_line(f"  Last Updated:  {datetime.fromtimestamp(s.get('last_updated_epoch', 0)).strftime('%Y-%m-%d %H:%M:%S') if s.get('last_updated_epoch', 0) else '—'}")
 
     def _cmd_docs(self, args: List[str]) -> None:
-        docs = list_documents()
         filt = args[0].lower() if args else None
-        self._write_line("Documents:")
-        for d in docs:
+        lines = ["Documents:"]
+        for d in list_documents():
             name = str(d.get("original_filename", ""))
             digest = str(d.get("digest", ""))
-            pages = int(d.get("pages_count", 0))
-            sizeb = int(d.get("size_bytes", 0))
+            # Filter before formatting so skipped rows cost no int()/_fmt_bytes
             if filt and filt not in name.lower() and (filt not in digest.lower()):
                 continue
-            self._write_line(f"  {name}  ({pages}p, {_fmt_bytes(sizeb)})  [{digest}]")
+            pages = int(d.get("pages_count", 0))
+            sizeb = int(d.get("size_bytes", 0))
+            lines.append(f"  {name}  ({pages}p, {_fmt_bytes(sizeb)})  [{digest}]")
+        # One insert and cursor move for the whole listing instead of one per document
+        self._write("".join(line + "\n" for line in lines))
 
     def _cmd_show(self, args: List[str]) -> None:
         if not args:
@@ -312,42 +424,6 @@ class TerminalPanel(QWidget):
             n = int(args[0]) if args else 50
         except Exception:
             n = 50
-        subs = ensure_subdirs()
-        rows: List[Tuple[str, str]] = []
-        # New events.log
-        events = subs["tlog"] / "events.log"
-        if events.exists():
-            try:
-                with events.open("r", encoding="utf-8") as f:
-                    for line in f:
-                        try:
-                            obj = json.loads(line)
-                            t = obj.get("time", "")
-                            ev = obj.get("event", {})
-                            rows.append((t, json.dumps(ev, ensure_ascii=False)))
-                        except Exception:
-                            pass
-            except Exception:
-                pass
-        # Legacy
-        legacy = subs["tlog"].parents[0] / "tlog.jsonl"
-        if legacy.exists():
-            try:
-                with legacy.open("r", encoding="utf-8") as f:
-                    for line in f:
-                        try:
-                            obj = json.loads(line)
-                            t = obj.get("time", "")
-                            rows.append((t, json.dumps(obj, ensure_ascii=False)))
-                        except Exception:
-                            pass
-            except Exception:
-                pass
-        rows = rows[-n:]
-        if not rows:
-            self._write_line("No activity.")
-            return
-        for t, e in rows:
-            self._write_line(f"{t}  {e}")
+        self._run_in_background(lambda: _tlog_lines(max(1, n)))
 
 
@@ -0,0 +1,16 @@
+from __future__ import annotations
+
+from PySide6.QtCore import QThread, Signal
+
+from ..core.dashboard import load_dashboard
+
+
+class DashboardWorker(QThread):
+    loaded = Signal(object)  # DashboardData
+    error = Signal(str)
+
+    def run(self) -> None:
+        try:
+            self.loaded.emit(load_dashboard())
+        except Exception as exc:  # pragma: no cover
+            self.error.emit(str(exc))
@@ -2,16 +2,28 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from pathlib import Path
-from typing import List
+from typing import Dict, List, Tuple
+import queue
+import threading
 
 from PySide6.QtCore import QThread, Signal
 
-from ..core.index import init_index, index_pdf
-from ..core.pdf import extract_text, ocr_if_needed
+from ..core.index import flush_index, index_prepared, indexed_digests, prepare_pdfs
+from ..core.pdf import PdfHandle, discard_ocr_output, ocr_many
 from ..core.manifest import list_documents
 from ..core.storage import resolve_object
 
 
+# Documents embedded per index_prepared call: large enough to keep the encoder busy,
+# small enough that progress still moves regularly
+INDEX_BATCH_DOCS = 16
+# Extracted batches allowed to wait for the embedder; bounds memory while the
+# parser runs ahead
+PIPELINE_DEPTH = 2
+
+_DONE = object()
+
+
 @dataclass
 class IndexProgress:
     processed_docs: int
@@ -27,13 +39,30 @@ class IndexWorker(QThread):
     def __init__(self):
         super().__init__()
 
-    def run(self) -> None:
-        docs = list_documents()
-        total = len(docs)
-        added_total = 0
-        init_index()
+    @staticmethod
+    def _prepare(batch: List[Tuple[Path, Dict[str, object]]]):
+        # Each PDF is opened once for both the OCR check and text extraction;
+        # scanned ones are OCR'd concurrently and read from the OCR output instead
+        handles = [PdfHandle(path) for path, _ in batch]
+        try:
+            sources = ocr_many(handles)
+            try:
+                return prepare_pdfs([(src, meta) for src, (_, meta) in zip(sources, batch)])
+            finally:
+                for src, handle in zip(sources, handles):
+                    discard_ocr_output(src, handle)
+        finally:
+            for handle in handles:
+                handle.close()
+
+    def _produce(self, docs: List[Dict[str, object]], out: "queue.Queue[object]", stop: threading.Event) -> None:
+        """Extract and chunk documents in batches, feeding the embedding loop in run()."""
         try:
+            batch: List[Tuple[Path, Dict[str, object]]] = []
+            last_digest: str | None = None
             for idx, d in enumerate(docs, start=1):
+                if stop.is_set():
+                    return
                 digest = d.get("digest")
                 filename = d.get("original_filename")
                 if not digest or not filename:
@@ -48,11 +77,57 @@ class IndexWorker(QThread):
                     "size": int(blob_path.stat().st_size),
                     "stored_path": str(blob_path),
                 }
-                added = index_pdf(blob_path, meta)
-                added_total += int(added)
-                self.progress.emit(IndexProgress(idx, total, digest))
+                batch.append((blob_path, meta))
+                last_digest = digest
+                if len(batch) >= INDEX_BATCH_DOCS:
+                    out.put((idx, digest, self._prepare(batch)))
+                    batch = []
+            if batch:
+                out.put((len(docs), last_digest, self._prepare(batch)))
+            out.put(_DONE)
+        except BaseException as exc:
+            out.put(exc)
+
+    def run(self) -> None:
+        # Documents already in the catalog and FAISS are not parsed or embedded
+        # again; indexing the same PDF twice would only duplicate its chunks
+        try:
+            done = indexed_digests()
+            docs = [d for d in list_documents() if d.get("digest") not in done]
+        except Exception as exc:  # pragma: no cover - GUI surface
+            self.error.emit(str(exc))
+            return
+        total = len(docs)
+        added_total = 0
+        if not docs:
+            self.progress.emit(IndexProgress(0, 0, None))
+            self.finished_ok.emit(0)
+            return
+        # Parsing (I/O and pypdf/PyMuPDF) runs one stage ahead of embedding
+        ready: "queue.Queue[object]" = queue.Queue(maxsize=PIPELINE_DEPTH)
+        stop = threading.Event()
+        producer = threading.Thread(target=self._produce, args=(docs, ready, stop), daemon=True)
+        producer.start()
+        try:
+            last_digest: str | None = None
+            while True:
+                item = ready.get()
+                if item is _DONE:
+                    break
+                if isinstance(item, BaseException):
+                    raise item
+                idx, last_digest, prepared = item
+                added_total += int(index_prepared(prepared))
+                self.progress.emit(IndexProgress(idx, total, last_digest))
+            flush_index()
+            self.progress.emit(IndexProgress(total, total, last_digest))
             self.finished_ok.emit(added_total)
         except Exception as exc:  # pragma: no cover - GUI surface
+            stop.set()
+            # Unblock a producer waiting on a full queue so it can see the stop flag
+            while producer.is_alive():
+                try:
+                    ready.get(timeout=0.1)
+                except queue.Empty:
+                    pass
             self.error.emit(str(exc))
-
-
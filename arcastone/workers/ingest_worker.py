@@ -1,8 +1,9 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import List
+from typing import Dict, List
 
 from PySide6.QtCore import QObject, QThread, Signal
 
@@ -12,6 +13,19 @@ from ..core.manifest import DocumentEntry, add_document_entry
 from ..core.manifest import _utcnow_iso  # internal but OK for worker use
 
 
+# Files hashed and stored at once. Hashing and copying release the GIL, so
+# threads overlap one file's disk I/O with the next file's. Page counting
+# stays on the worker thread: PyMuPDF is not thread-safe.
+INGEST_WORKERS = 4
+
+
+def _store(path: Path) -> Dict[str, object] | Exception:
+    try:
+        return store_file(path)
+    except Exception as exc:  # reported in order by run()
+        return exc
+
+
 @dataclass
 class IngestResult:
     digest: str
@@ -33,27 +47,31 @@ class IngestWorker(QThread):
     def run(self) -> None:
         results: List[IngestResult] = []
         total = len(self.files)
-        for i, path in enumerate(self.files, start=1):
-            try:
-                info = store_file(path)
-                digest = info["hash"].split(":", 1)[1]
-                pages = count_pages(path)
-                add_document_entry(
-                    DocumentEntry(
-                        digest=digest,
-                        original_filename=path.name,
-                        size_bytes=int(info["size"]),
-                        added_at=_utcnow_iso(),
-                        pages_count=pages,
+        with ThreadPoolExecutor(max_workers=max(1, min(INGEST_WORKERS, total))) as pool:
+            # map() yields in input order, so manifest entries are still added
+            # one at a time from this thread, in the order the files were given
+            stored_all = pool.map(_store, self.files)
+            for i, (path, stored) in enumerate(zip(self.files, stored_all), start=1):
+                try:
+                    if isinstance(stored, Exception):
+                        raise stored
+                    info = stored
+                    pages = count_pages(path)
+                    digest = str(info["hash"]).split(":", 1)[1]
+                    add_document_entry(
+                        DocumentEntry(
+                            digest=digest,
+                            original_filename=path.name,
+                            size_bytes=int(info["size"]),
+                            added_at=_utcnow_iso(),
+                            pages_count=pages,
+                        )
                     )
-                )
-                result = IngestResult(digest, path.name, pages, int(info["size"]))
-                results.append(result)
-                self.item_done.emit(result)
-            except Exception as exc:  # pragma: no cover - GUI thread surface
-                self.error.emit(f"Failed ingest {path.name}: {exc}")
-            finally:
-                self.progress.emit(i, total)
+                    result = IngestResult(digest, path.name, pages, int(info["size"]))
+                    results.append(result)
+                    self.item_done.emit(result)
+                except Exception as exc:  # pragma: no cover - GUI thread surface
+                    self.error.emit(f"Failed ingest {path.name}: {exc}")
+                finally:
+                    self.progress.emit(i, total)
         self.finished_all.emit(results)
-
-
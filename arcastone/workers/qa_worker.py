@@ -1,26 +1,37 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+import unicodedata
 
 from PySide6.QtCore import QThread, Signal
 
 from ..core.rag import generate_answer, QAResult
 
 
+# Questions are retrieved with and then sit in the LLM prompt; past this they
+# only slow tokenization and crowd out the retrieved context
+MAX_QUESTION_CHARS = 4096
+
+
 class QAWorker(QThread):
+    partial_answer = Signal(str)  # text generated so far, in pieces
     finished_ok = Signal(object)  # QAResult
     error = Signal(str)
 
     def __init__(self, question: str, top_k: int = 5, max_new_tokens: int = 128):
         super().__init__()
-        self.question = question
+        self.question = unicodedata.normalize("NFKC", question[:MAX_QUESTION_CHARS])[:MAX_QUESTION_CHARS]
         self.top_k = top_k
         self.max_new_tokens = max_new_tokens
 
     def run(self) -> None:
         try:
             res: QAResult = generate_answer(
-                self.question, top_k=self.top_k, max_new_tokens=self.max_new_tokens
+                self.question,
+                top_k=self.top_k,
+                max_new_tokens=self.max_new_tokens,
+                on_token=self.partial_answer.emit,
+                should_stop=self.isInterruptionRequested,
             )
             self.finished_ok.emit(res)
         except Exception as exc:  # pragma: no cover
@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+import unicodedata
+
 from PySide6.QtCore import QThread, Signal
 
 from ..core.retrieval_chat import retrieve_only_answer
+from .search_worker import MAX_QUERY_CHARS
 
 
 class RetrievalWorker(QThread):
@@ -11,7 +14,7 @@ class RetrievalWorker(QThread):
 
     def __init__(self, query: str, top_k: int = 5):
         super().__init__()
-        self.query = query
+        self.query = unicodedata.normalize("NFKC", query[:MAX_QUERY_CHARS])[:MAX_QUERY_CHARS]
         self.top_k = top_k
 
     def run(self) -> None:
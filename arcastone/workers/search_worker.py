@@ -1,17 +1,24 @@
 from __future__ import annotations
 
+import unicodedata
+
 from PySide6.QtCore import QThread, Signal
 
 from ..core.index import search as core_search
 
 
+# Longer input only adds tokenizer work; the embedder truncates past its window anyway
+MAX_QUERY_CHARS = 512
+
+
 class SearchWorker(QThread):
     results = Signal(list)  # List[dict]
     error = Signal(str)
 
     def __init__(self, query: str, k: int = 10):
         super().__init__()
-        self.query = query
+        # Clamped before NFKC so a huge paste costs nothing here either
+        self.query = unicodedata.normalize("NFKC", query[:MAX_QUERY_CHARS])[:MAX_QUERY_CHARS]
         self.k = k
 
     def run(self) -> None:
@@ -0,0 +1,16 @@
+from __future__ import annotations
+
+from PySide6.QtCore import QThread, Signal
+
+from ..core.sitemap import build_sitemap
+
+
+class SitemapWorker(QThread):
+    loaded = Signal(list)  # List[SiteNode]
+    error = Signal(str)
+
+    def run(self) -> None:
+        try:
+            self.loaded.emit(build_sitemap())
+        except Exception as exc:  # pragma: no cover
+            self.error.emit(str(exc))
@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+from typing import Callable, List
+
+from PySide6.QtCore import QThread, Signal
+
+
+class CommandWorker(QThread):
+    """Runs the disk-bound part of a terminal command and hands back its output lines."""
+
+    lines = Signal(list)  # List[str]
+    error = Signal(str)
+
+    def __init__(self, produce: Callable[[], List[str]]):
+        super().__init__()
+        self.produce = produce
+
+    def run(self) -> None:
+        try:
+            self.lines.emit(self.produce())
+        except Exception as exc:  # pragma: no cover
+            self.error.emit(str(exc))
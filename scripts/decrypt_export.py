@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+import getpass
+from pathlib import Path
+import sys
+
+# Allow running from a checkout without installing the package
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from arcastone.core.export import decrypt_file  # noqa: E402
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Decrypt an ArcaStone encrypted export (*.enc)")
+    parser.add_argument("src", help="Encrypted file, e.g. export.zip.enc")
+    parser.add_argument(
+        "--out",
+        default=None,
+        help="Output path (defaults to src without its .enc suffix)",
+    )
+    args = parser.parse_args()
+
+    src = Path(args.src).expanduser()
+    if args.out:
+        dest = Path(args.out).expanduser()
+    elif src.suffix == ".enc":
+        dest = src.with_suffix("")
+    else:
+        dest = src.with_name(src.name + ".dec")
+    puzzle = getpass.getpass("Puzzle: ")
+    try:
+        decrypt_file(src, dest, puzzle)
+    except (OSError, ValueError, RuntimeError) as exc:
+        print(f"Error: {exc}", file=sys.stderr)
+        return 1
+    print(f"Decrypted {src} -> {dest}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,12 +1,25 @@
 #!/usr/bin/env python3
 from __future__ import annotations
 
+import argparse
 import subprocess
 from pathlib import Path
 import sys
 
 
 def main() -> int:
+    parser = argparse.ArgumentParser(description="Package dist/ArcaStone.app as a DMG")
+    parser.add_argument(
+        "--format",
+        default="ULFO",
+        choices=["ULFO", "ULMO", "UDBZ", "UDZO"],
+        help=(
+            "Disk image format (default: ULFO). LZFSE (ULFO) is smaller than zlib (UDZO) "
+            "and decompresses faster; it mounts on macOS 10.11+, below what PySide6 needs anyway."
+        ),
+    )
+    args = parser.parse_args()
+
     root = Path(__file__).resolve().parents[2]
     dist = root / "dist"
     app = dist / "ArcaStone.app"
@@ -21,10 +34,12 @@ def main() -> int:
         print("Installing dmgbuild...")
         subprocess.check_call([sys.executable, "-m", "pip", "install", "dmgbuild"])
 
+    # Only zlib takes a level; the other formats have a fixed one
+    level = "compression_level = 9\n" if args.format == "UDZO" else ""
     settings = f"""
 application = "{app}"
-format = "UDZO"
-files = [application]
+format = "{args.format}"
+{level}files = [application]
 symlinks = {{'Applications': '/Applications'}}
 icon_size = 128
 window_rect = ((200, 120), (600, 400))
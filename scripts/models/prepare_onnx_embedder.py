@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+import os
+from pathlib import Path
+import sys
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Export the ArcaStone embedding model to INT8 ONNX")
+    parser.add_argument(
+        "--model",
+        default="sentence-transformers/all-MiniLM-L6-v2",
+        help="Hugging Face model id to export (default: sentence-transformers/all-MiniLM-L6-v2)",
+    )
+    parser.add_argument(
+        "--dst",
+        default=str(Path(__file__).resolve().parents[2] / "data" / "index" / ".models" / "minilm-onnx"),
+        help="Destination directory (default: data/index/.models/minilm-onnx, picked up automatically)",
+    )
+    args = parser.parse_args()
+
+    dst = Path(args.dst)
+    dst.mkdir(parents=True, exist_ok=True)
+    os.environ.setdefault("HF_HUB_DISABLE_TELEMETRY", "1")
+
+    try:
+        from optimum.onnxruntime import ORTModelForFeatureExtraction  # type: ignore
+        from onnxruntime.quantization import QuantType, quantize_dynamic  # type: ignore
+    except Exception:
+        print("Installing optimum[onnxruntime]…")
+        import subprocess
+
+        subprocess.check_call([sys.executable, "-m", "pip", "install", "optimum[onnxruntime]"])  # noqa: S603, S607
+        from optimum.onnxruntime import ORTModelForFeatureExtraction  # type: ignore
+        from onnxruntime.quantization import QuantType, quantize_dynamic  # type: ignore
+    from transformers import AutoTokenizer  # type: ignore
+
+    print(f"Exporting {args.model} → {dst} …")
+    model = ORTModelForFeatureExtraction.from_pretrained(args.model, export=True)
+    model.save_pretrained(str(dst))
+    AutoTokenizer.from_pretrained(args.model).save_pretrained(str(dst))
+
+    print("Quantizing weights to INT8…")
+    quantize_dynamic(str(dst / "model.onnx"), str(dst / "model.int8.onnx"), weight_type=QuantType.QInt8)
+
+    print(f"Done. ArcaStone will use {dst / 'model.int8.onnx'} for embeddings when onnxruntime is installed.")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,143 @@
+from pathlib import Path
+import errno
+import io
+import os
+import zipfile
+
+import pytest
+
+from arcastone.core import export
+from arcastone.core.export import _copy_file, _copy_many
+
+
+def _sample(tmp_path: Path, name: str = "src.bin", size: int = 3 * 1024 * 1024 + 17) -> Path:
+    src = tmp_path / name
+    src.write_bytes(os.urandom(size))
+    return src
+
+
+def _fail(err: int):
+    def raiser(*args, **kwargs):
+        raise OSError(err, os.strerror(err))
+    return raiser
+
+
+def test_copy_file_default_path(tmp_path: Path):
+    src = _sample(tmp_path)
+    dest = tmp_path / "out.bin"
+    assert _copy_file(src, dest) == src.stat().st_size
+    assert dest.read_bytes() == src.read_bytes()
+
+
+def test_copy_file_falls_back_to_sendfile(tmp_path: Path, monkeypatch):
+    src = _sample(tmp_path)
+    dest = tmp_path / "out.bin"
+    monkeypatch.setattr(export, "_KERNEL_COPY", True)
+    monkeypatch.setattr(os, "copy_file_range", _fail(errno.EXDEV), raising=False)
+    _copy_file(src, dest)
+    assert dest.read_bytes() == src.read_bytes()
+
+
+def test_copy_file_falls_back_to_read_write(tmp_path: Path, monkeypatch):
+    src = _sample(tmp_path)
+    dest = tmp_path / "out.bin"
+    monkeypatch.setattr(export, "_KERNEL_COPY", True)
+    monkeypatch.delattr(os, "copy_file_range", raising=False)
+    # what macOS reports for sendfile into a regular file
+    monkeypatch.setattr(os, "sendfile", _fail(errno.ENOTSOCK), raising=False)
+    _copy_file(src, dest)
+    assert dest.read_bytes() == src.read_bytes()
+
+
+def test_copy_file_without_kernel_copy(tmp_path: Path, monkeypatch):
+    src = _sample(tmp_path)
+    dest = tmp_path / "out.bin"
+    monkeypatch.setattr(export, "_KERNEL_COPY", False)
+    monkeypatch.setattr(os, "copy_file_range", _fail(errno.ENOSYS), raising=False)
+    monkeypatch.setattr(os, "sendfile", _fail(errno.ENOSYS), raising=False)
+    _copy_file(src, dest)
+    assert dest.read_bytes() == src.read_bytes()
+
+
+def test_copy_file_resumes_after_partial_kernel_copy(tmp_path: Path, monkeypatch):
+    src = _sample(tmp_path)
+    dest = tmp_path / "out.bin"
+    if not hasattr(os, "copy_file_range"):
+        pytest.skip("needs os.copy_file_range")
+    real = os.copy_file_range
+    calls = []
+
+    def partial(src_fd, dst_fd, count, *args):
+        if calls:
+            raise OSError(errno.EIO, "stopped")
+        calls.append(count)
+        return real(src_fd, dst_fd, 4096)
+
+    monkeypatch.setattr(export, "_KERNEL_COPY", True)
+    monkeypatch.setattr(os, "copy_file_range", partial)
+    monkeypatch.setattr(os, "sendfile", _fail(errno.EINVAL), raising=False)
+    _copy_file(src, dest)
+    assert dest.read_bytes() == src.read_bytes()
+
+
+def test_copy_many_copies_every_pair(tmp_path: Path):
+    srcs = [_sample(tmp_path, f"src{i}.bin", size=100_000 + i) for i in range(4)]
+    pairs = [(src, tmp_path / f"out{i}.bin") for i, src in enumerate(srcs)]
+    assert _copy_many(pairs) == [100_000 + i for i in range(4)]
+    for src, dest in pairs:
+        assert dest.read_bytes() == src.read_bytes()
+
+
+def test_copy_many_keeps_timestamps_unless_told_not_to(tmp_path: Path):
+    src = _sample(tmp_path, size=1000)
+    os.utime(src, ns=(1_000_000_000, 1_000_000_000))
+    kept, plain = tmp_path / "kept.bin", tmp_path / "plain.bin"
+    _copy_many([(src, kept)])
+    _copy_many([(src, plain)], preserve_metadata=False)
+    assert kept.stat().st_mtime_ns == src.stat().st_mtime_ns
+    assert plain.stat().st_mtime_ns != src.stat().st_mtime_ns
+
+
+def test_encrypted_export_round_trip(tmp_path: Path):
+    pytest.importorskip("cryptography")
+    key = export.derive_key("correct horse")
+    payload = os.urandom(200_000)
+    # one-shot framing
+    assert export.decrypt_bytes(export._seal(key, payload), "correct horse") == payload
+    # streamed framing, written in uneven pieces through a zip archive
+    out = tmp_path / "export.zip.enc"
+    with export._open_output(out, key) as sink, zipfile.ZipFile(sink, mode="w") as zf:
+        with zf.open("a.bin", "w") as member:
+            for start in range(0, len(payload), 70_001):
+                member.write(payload[start : start + 70_001])
+    plain = export.decrypt_bytes(out.read_bytes(), "correct horse")
+    with zipfile.ZipFile(io.BytesIO(plain)) as zf:
+        assert zf.read("a.bin") == payload
+    assert export.decrypt_file(out, tmp_path / "export.zip", "correct horse").read_bytes() == plain
+    # both payloads of one export share the salt but not the nonce
+    sealed = export._seal(key, payload)
+    assert out.read_bytes()[:24] == sealed[:24]
+    assert out.read_bytes()[24:36] != sealed[24:36]
+
+
+def test_decrypt_reads_v1_exports(tmp_path: Path):
+    pytest.importorskip("cryptography")
+    payload = os.urandom(5000)
+    salt = os.urandom(16)
+    v1 = b"ARCAENC1" + salt + export.encrypt_with_key(export._pbkdf2_key("old", salt, iterations=200_000), payload)
+    assert export.decrypt_bytes(v1, "old") == payload
+    src = tmp_path / "old.zip.enc"
+    src.write_bytes(v1)
+    assert export.decrypt_file(src, tmp_path / "old.zip", "old").read_bytes() == payload
+    with pytest.raises(ValueError):
+        export.decrypt_file(src, tmp_path / "bad.zip", "wrong")
+    assert not (tmp_path / "bad.zip").exists() and not (tmp_path / "bad.zip.part").exists()
+    with pytest.raises(ValueError):
+        export.decrypt_bytes(b"NOTARCA!" + v1[8:], "old")
+
+
+def test_unencrypted_output_is_plain(tmp_path: Path):
+    out = tmp_path / "plain.bin"
+    with export._open_output(out, None) as sink:
+        sink.write(b"hello")
+    assert out.read_bytes() == b"hello"
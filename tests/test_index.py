@@ -0,0 +1,211 @@
+from pathlib import Path
+import hashlib
+import threading
+
+import faiss
+import numpy as np
+import pytest
+
+from arcastone.core import index
+
+DIM = 16
+
+
+@pytest.fixture
+def vault(tmp_path: Path, monkeypatch):
+    """Point the catalog and FAISS index at tmp_path, starting from an empty index."""
+    monkeypatch.setattr(index, "CATALOG_DB", tmp_path / "catalog.sqlite")
+    monkeypatch.setattr(index, "FAISS_PATH", tmp_path / "faiss.index")
+    monkeypatch.setattr(index, "_LOCAL", threading.local())
+    monkeypatch.setattr(index, "_INDEX", index._new_index(DIM))
+    monkeypatch.setattr(index, "_INDEX_DIRTY", 0)
+    monkeypatch.setattr(index, "_RECONCILED", False)
+    index._catalog_counts.cache_clear()
+    yield tmp_path
+    index._close_conn()
+
+
+def _add_file(digest: str, n_chunks: int) -> None:
+    """Index n_chunks random vectors under a file with the given digest."""
+    meta = {"name": f"{digest}.pdf", "hash": f"b3:{digest}", "size": 1, "stored_path": ""}
+    rows = [(1, f"{digest} chunk {i}", f"{digest} {i}") for i in range(n_chunks)]
+    conn = index._conn()
+    cur = conn.cursor()
+    cur.execute("BEGIN")
+    file_id = index._upsert_file(cur, meta)
+    cur.execute("SELECT COALESCE(MAX(id), 0) FROM chunks")
+    start = int(cur.fetchone()[0]) + 1
+    ids = list(range(start, start + n_chunks))
+    cur.executemany(
+        "INSERT INTO chunks(id, file_id, page, text, snippet) VALUES(?,?,?,?,?)",
+        [(cid, file_id, page, text, snip) for cid, (page, text, snip) in zip(ids, rows)],
+    )
+    conn.commit()
+    rng = np.random.default_rng(len(ids) + start)
+    vecs = index._normalize(rng.standard_normal((n_chunks, DIM)))
+    index.get_index().add_with_ids(vecs, np.array(ids, dtype=np.int64))
+
+
+def test_indexed_digests_when_in_sync(vault):
+    index.init_index()
+    _add_file("aa", 3)
+    _add_file("bb", 2)
+    assert index.indexed_digests() == {"aa", "bb"}
+
+
+def test_indexed_digests_drops_chunks_missing_from_faiss(vault):
+    index.init_index()
+    _add_file("aa", 3)
+    # "bb" reached the catalog but its vectors were lost before a flush
+    saved = index.get_index()
+    index._INDEX = index._new_index(DIM)
+    _add_file("bb", 2)
+    index._INDEX = saved
+    assert index.indexed_digests() == {"aa"}
+    cur = index._conn().cursor()
+    cur.execute("SELECT COUNT(*) FROM chunks")
+    assert int(cur.fetchone()[0]) == index.get_index().ntotal == 3
+    # consistent again, so a second call needs no repair
+    assert index.indexed_digests() == {"aa"}
+
+
+def test_indexed_digests_leaves_in_flight_chunks_alone(vault):
+    index.init_index()
+    _add_file("aa", 3)
+    assert index.indexed_digests() == {"aa"}
+    # "bb" rows are committed but index_prepared is still embedding them
+    saved = index.get_index()
+    index._INDEX = index._new_index(DIM)
+    _add_file("bb", 2)
+    index._INDEX = saved
+    assert index.indexed_digests() == {"aa", "bb"}
+    cur = index._conn().cursor()
+    cur.execute("SELECT COUNT(*) FROM chunks")
+    assert int(cur.fetchone()[0]) == 5
+
+
+def _flat_ip(n: int) -> tuple:
+    vecs = index._normalize(np.random.default_rng(7).standard_normal((n, DIM)))
+    ids = np.arange(100, 100 + n, dtype=np.int64)
+    flat = faiss.IndexIDMap2(faiss.IndexFlatIP(DIM))
+    flat.add_with_ids(vecs, ids)
+    return flat, vecs, ids
+
+
+def test_baseline_flat_index_upgrades_to_hnsw(monkeypatch):
+    monkeypatch.setattr(index, "HNSW_MIN_VECTORS", 300)
+    flat, vecs, ids = _flat_ip(299)
+    assert index._maybe_upgrade_index(flat) is flat
+    flat, vecs, ids = _flat_ip(300)
+    upgraded = index._maybe_upgrade_index(flat)
+    assert isinstance(faiss.downcast_index(upgraded.index), faiss.IndexHNSW)
+    assert upgraded.ntotal == 300
+    assert np.array_equal(np.sort(faiss.vector_to_array(upgraded.id_map)), ids)
+    _, found = upgraded.search(vecs[:20], 1)
+    assert np.mean(found[:, 0] == ids[:20]) >= 0.9
+    assert index._maybe_upgrade_index(upgraded) is upgraded
+
+
+def test_index_stats_does_not_wait_for_index_lock(vault):
+    index.init_index()
+    _add_file("aa", 3)
+    held = threading.Event()
+    release = threading.Event()
+
+    def writer():
+        with index._INDEX_LOCK:
+            held.set()
+            release.wait(5)
+
+    t = threading.Thread(target=writer)
+    t.start()
+    try:
+        held.wait(5)
+        assert index.index_stats()["faiss_vectors"] == 3
+    finally:
+        release.set()
+        t.join()
+
+
+class _HashEmbedder:
+    """Deterministic stand-in for the sentence model: one pseudo-random vector per text.
+
+    Trailing punctuation is ignored so a sentence split out of a question still
+    matches the chunk it was copied from.
+    """
+
+    def get_sentence_embedding_dimension(self) -> int:
+        return DIM
+
+    def encode(self, texts, **kwargs) -> np.ndarray:
+        rows = []
+        for text in texts:
+            key = text.strip().rstrip(".?!;").encode("utf-8")
+            seed = int.from_bytes(hashlib.blake2b(key, digest_size=8).digest(), "little")
+            rows.append(np.random.default_rng(seed).standard_normal(DIM))
+        return np.asarray(rows, dtype=np.float32)
+
+
+@pytest.fixture
+def embedded_vault(vault, monkeypatch):
+    monkeypatch.setattr(index, "_EMBEDDER", _HashEmbedder())
+    index.query_cache.clear()
+    yield vault
+    index.query_cache.clear()
+
+
+def _index_docs(prefix: str, n_docs: int, chunks_per_doc: int = 5) -> None:
+    prepared = []
+    for d in range(n_docs):
+        digest = f"{prefix}{d:04d}"
+        meta = {"name": f"{digest}.pdf", "hash": f"b3:{digest}", "size": 1, "stored_path": ""}
+        rows = [(p + 1, f"{digest} passage {p}", f"{digest} snippet {p}") for p in range(chunks_per_doc)]
+        prepared.append((meta, rows))
+    index.index_prepared(prepared)
+
+
+def test_indexing_clears_query_cache(embedded_vault):
+    index.query_cache.get_or_compute("stale", lambda: ["old answer"])
+    assert index.query_cache.stats()["entries"] == 1
+    _index_docs("doc", 2)
+    assert index.query_cache.stats()["entries"] == 0
+
+
+def test_search_batch_matches_single_searches(embedded_vault):
+    _index_docs("doc", 20)
+    queries = ["doc0003 passage 1", "doc0017 passage 4", "doc0009 passage 0"]
+    batched = index.search_batch(queries, top_k=5)
+    for query, hits in zip(queries, batched):
+        assert hits == index.search(query, top_k=5)
+        assert hits[0]["snippet"] == query.replace("passage", "snippet")
+
+
+def test_search_fused_merges_sentences(embedded_vault):
+    _index_docs("doc", 20)
+    assert index.search_fused("doc0003 passage 1", top_k=5) == index.search("doc0003 passage 1", top_k=5)
+    hits = index.search_fused("doc0003 passage 1. doc0011 passage 2.", top_k=5)
+    keys = [(h["hash"], h["page"]) for h in hits]
+    assert len(keys) == len(set(keys)) <= 5
+    assert ("b3:doc0003", 2) in keys and ("b3:doc0011", 3) in keys
+
+
+def test_indexing_invalidates_cached_searches(embedded_vault):
+    _index_docs("doc", 5)
+    query = "new0000 passage 0"
+    before = index.search(query, top_k=3)
+    assert all(h["hash"] != "b3:new0000" for h in before)
+    _index_docs("new", 1)
+    assert index.search(query, top_k=3)[0]["hash"] == "b3:new0000"
+
+
+def test_search_results_survive_hnsw_upgrade(embedded_vault, monkeypatch):
+    monkeypatch.setattr(index, "HNSW_MIN_VECTORS", 300)
+    _index_docs("doc", 50)  # 250 vectors, still flat
+    assert isinstance(faiss.downcast_index(index.get_index().index), faiss.IndexScalarQuantizer)
+    queries = [f"doc{d:04d} passage {d % 5}" for d in range(0, 50, 7)]
+    flat_top = [hits[0] for hits in index.search_batch(queries, top_k=3)]
+    _index_docs("more", 20)  # crosses HNSW_MIN_VECTORS
+    assert isinstance(faiss.downcast_index(index.get_index().index), faiss.IndexHNSW)
+    assert index.get_index().ntotal == 350
+    hnsw_top = [hits[0] for hits in index.search_batch(queries, top_k=3)]
+    assert [(h["hash"], h["page"]) for h in hnsw_top] == [(h["hash"], h["page"]) for h in flat_top]
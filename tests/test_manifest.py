@@ -1,4 +1,14 @@
-from arcastone.core.manifest import DocumentEntry, add_document_entry, list_documents
+import uuid
+
+from arcastone.core.manifest import (
+    DocumentEntry,
+    add_document_entry,
+    add_document_entries,
+    list_documents,
+    get_document_entry,
+    get_document_entries,
+    summary_stats,
+)
 from arcastone.core.config import ensure_directories
 
 
@@ -16,3 +26,48 @@ def test_manifest_add_and_list(tmp_path):
     assert any(d["digest"] == "deadbeef" for d in docs)
 
 
+def test_get_document_entry_sees_updates(tmp_path):
+    ensure_directories()
+    entry = DocumentEntry(
+        digest="cafebabe",
+        original_filename="first.pdf",
+        size_bytes=10,
+        added_at="2024-01-01T00:00:00.000Z",
+        pages_count=1,
+    )
+    add_document_entry(entry)
+    assert get_document_entry("cafebabe")["original_filename"] == "first.pdf"
+    entry.original_filename = "second.pdf"
+    add_document_entry(entry)
+    assert get_document_entry("cafebabe")["original_filename"] == "second.pdf"
+    assert get_document_entry("not-a-digest") is None
+    assert set(get_document_entries(["cafebabe", "not-a-digest"])) == {"cafebabe"}
+
+
+def test_summary_stats_counts_today(tmp_path):
+    ensure_directories()
+    before = summary_stats("2031-05-06")
+    add_document_entry(DocumentEntry(uuid.uuid4().hex, "old.pdf", 100, "2031-05-05T23:59:59.000Z", 3))
+    add_document_entry(DocumentEntry("facefeed", "new.pdf", 40, "2031-05-06T00:00:01.000Z", 2))
+    after = summary_stats("2031-05-06")
+    assert after.total_docs >= before.total_docs + 1
+    assert after.total_pages >= before.total_pages + 3
+    assert after.total_bytes >= before.total_bytes + 100
+    assert (after.today_docs, after.today_pages, after.today_bytes) == (1, 2, 40)
+    assert summary_stats("2031-05-06") is after
+
+
+def test_add_document_entries_matches_sequential_adds(tmp_path):
+    ensure_directories()
+    a, b = uuid.uuid4().hex, uuid.uuid4().hex
+    add_document_entries(
+        [
+            DocumentEntry(a, "a1.pdf", 1, "2024-01-01T00:00:00.000Z", 1),
+            DocumentEntry(b, "b.pdf", 2, "2024-01-01T00:00:00.000Z", 1),
+            DocumentEntry(a, "a2.pdf", 3, "2024-01-01T00:00:00.000Z", 1),
+        ]
+    )
+    digests = [d["digest"] for d in list_documents()]
+    assert digests.count(a) == 1 and digests.index(b) < digests.index(a)
+    assert get_document_entry(a)["original_filename"] == "a2.pdf"
+    add_document_entries([])
@@ -0,0 +1,42 @@
+from pathlib import Path
+
+import pymupdf
+
+from arcastone.core import pdf
+from arcastone.core.pdf import PdfHandle, count_pages, first_snippet
+
+
+def _make_pdf(path: Path, pages: int) -> Path:
+    doc = pymupdf.open()
+    for i in range(pages):
+        doc.new_page().insert_text((72, 72), f"page {i}")
+    doc.save(str(path))
+    doc.close()
+    return path
+
+
+def test_count_pages_path_and_handle(tmp_path: Path):
+    sample = _make_pdf(tmp_path / "three.pdf", 3)
+    assert count_pages(sample) == 3
+    with PdfHandle(sample) as handle:
+        assert count_pages(handle) == 3
+
+
+def test_count_pages_falls_back_to_pypdf(tmp_path: Path, monkeypatch):
+    sample = _make_pdf(tmp_path / "two.pdf", 2)
+    monkeypatch.setattr(pdf, "pymupdf", None)
+    assert count_pages(sample) == 2
+    assert count_pages(PdfHandle(sample)) == 2
+
+
+def test_count_pages_unreadable_file(tmp_path: Path):
+    junk = tmp_path / "junk.pdf"
+    junk.write_bytes(b"not a pdf")
+    assert count_pages(junk) == 0
+
+
+def test_first_snippet_trims_with_ellipsis():
+    assert first_snippet("  short  ") == "short"
+    snippet = first_snippet("word " * 100, max_chars=20)
+    assert len(snippet) <= 20
+    assert snippet.endswith("…")
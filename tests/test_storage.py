@@ -1,7 +1,8 @@
 from pathlib import Path
 import tempfile
 
-from arcastone.core.storage import blake3_file, store_file, resolve_object, ensure_subdirs
+from arcastone.core import storage
+from arcastone.core.storage import blake3_file, digest_cache_stats, store_file, resolve_object, ensure_subdirs
 
 
 def test_compute_and_store_roundtrip(tmp_path: Path):
@@ -15,3 +16,22 @@ def test_compute_and_store_roundtrip(tmp_path: Path):
     assert obj_path.exists()
 
 
+def test_blake3_file_cache_tracks_changes(tmp_path: Path):
+    sample = tmp_path / "cached.txt"
+    sample.write_text("first", encoding="utf-8")
+    first = blake3_file(sample)
+    hits = digest_cache_stats()["hits"]
+    assert blake3_file(sample) == first
+    assert digest_cache_stats()["hits"] == hits + 1
+    sample.write_text("second!", encoding="utf-8")
+    assert blake3_file(sample) != first
+
+
+def test_digest_cache_keeps_only_recent_entries(tmp_path: Path, monkeypatch):
+    monkeypatch.setattr(storage, "_DIGEST_CACHE_MAX", 2)
+    for i in range(3):
+        sample = tmp_path / f"lru{i}.txt"
+        sample.write_text(str(i), encoding="utf-8")
+        blake3_file(sample)
+    assert digest_cache_stats()["entries"] == 2
+    assert str((tmp_path / "lru0.txt").resolve()) not in storage._DIGEST_CACHE